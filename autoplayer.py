@@ -0,0 +1,251 @@
+"""
+Automatic Player for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the AutoPlayer class, a bot that plays the game by working out
+where the ball will come down and moving the paddle there. It is used for long
+soak runs: the game is kept busy for hours so memory leaks and slowdowns show up.
+
+The landing point is worked out with a formula instead of simulating the ball.
+Bouncing between the side walls is the same as flying straight through a row of
+mirrored copies of the screen ("unfolding" the reflections), so we move the ball
+in a straight line and fold the result back into the screen. The same trick
+handles a bounce off the ceiling. The prediction only changes when the ball
+bounces, so it is only worked out again when the ball's velocity changes; every
+other tick the bot just compares two numbers and steers.
+
+It can drive the live game (python main.py --autoplay) or run headless:
+    python autoplayer.py --ticks 1000000
+    python autoplayer.py --levels levels.brk --hours 2
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import time
+from array import array
+
+try:
+    import resource  # Only on Linux and macOS, used to report memory during soak runs
+except ImportError:
+    resource = None
+
+from engine import (
+    GameState, step, TIME_STEP,
+    BALL_RADIUS, PADDLE_Y, PADDLE_HALF_HEIGHT, SCREEN_EDGE,
+    PADDLE_DECELERATION, TOP_WALL, SIDE_WALL, INPUT_LEFT, INPUT_RIGHT,
+)
+
+# Constants for the bot
+CONTACT_Y = PADDLE_Y + PADDLE_HALF_HEIGHT + BALL_RADIUS  # Height of the ball center when it touches the paddle
+DEAD_ZONE = 4  # The paddle counts as in place when it is this close (in pixels) to the target
+REPORT_INTERVAL = 60.0  # Seconds between progress lines of a headless soak run
+
+
+def predict_landing(x, y, x_move, y_move):
+    """
+    Work out where and when a ball will reach the height of the paddle,
+    bouncing off the side walls and the ceiling on the way (bricks are ignored).
+
+    Args:
+        x, y: Position of the ball center
+        x_move, y_move: Velocity of the ball in pixels per second
+
+    Returns:
+        A tuple (landing x, seconds until landing)
+    """
+    if y_move == 0:
+        return x, float("inf")
+
+    # Vertical distance to travel: straight down, or up to the ceiling and back down
+    if y_move < 0:
+        distance = max(y - CONTACT_Y, 0.0)
+    else:
+        distance = (TOP_WALL - y) + (TOP_WALL - CONTACT_Y)
+    seconds = distance / abs(y_move)
+
+    # Fly straight through the mirrored copies of the screen, then fold back in
+    width = 2 * SIDE_WALL
+    unfolded = (x + x_move * seconds + SIDE_WALL) % (2 * width)
+    if unfolded > width:
+        unfolded = 2 * width - unfolded
+    return unfolded - SIDE_WALL, seconds
+
+
+def steer(paddle_x, paddle_speed, target_x):
+    """
+    Choose which key to hold to bring the paddle to a target.
+    The key is let go early when the paddle would otherwise brake past the target.
+
+    Args:
+        paddle_x: Position of the paddle center
+        paddle_speed: Speed of the paddle (negative when moving left)
+        target_x: Where the paddle center should be
+
+    Returns:
+        INPUT_LEFT, INPUT_RIGHT or 0
+    """
+    distance = target_x - paddle_x
+    if abs(distance) <= DEAD_ZONE:
+        return 0
+    direction = 1 if distance > 0 else -1
+
+    # Already heading there fast enough to coast to a stop on the target
+    stopping_distance = paddle_speed * paddle_speed / (2 * PADDLE_DECELERATION)
+    if paddle_speed * direction > 0 and stopping_distance >= abs(distance):
+        return 0
+    return INPUT_RIGHT if direction > 0 else INPUT_LEFT
+
+
+class AutoPlayer:
+    """
+    The AutoPlayer class chooses the paddle keys for a game each tick.
+    It remembers the predicted landing point of every ball and only predicts
+    again for a ball whose velocity changed (it bounced) since the last tick.
+    """
+
+    def __init__(self, state, dt=TIME_STEP):
+        """
+        Initialize the bot for a game.
+
+        Args:
+            state: The GameState to play
+            dt: Length of one step in seconds (used to turn landing times into ticks)
+        """
+        self.state = state
+        self.dt = dt
+        self.x_move = array("d")  # Velocity of each ball when its landing point was predicted
+        self.y_move = array("d")
+        self.landing_x = array("d")  # Predicted landing x of each ball
+        self.landing_tick = array("d")  # Predicted tick each ball reaches the paddle
+        self.predictions = 0  # Number of predictions made (for checking the bot's cost)
+
+    def predict(self, ball):
+        """
+        Predict where one ball lands and remember its current velocity.
+
+        Args:
+            ball: The index of the ball
+        """
+        state = self.state
+        x_move = self.x_move[ball] = state.x_move[ball]
+        y_move = self.y_move[ball] = state.y_move[ball]
+        landing_x, seconds = predict_landing(state.ball_x[ball], state.ball_y[ball], x_move, y_move)
+        self.landing_x[ball] = landing_x
+        self.landing_tick[ball] = state.tick + seconds / self.dt
+        self.predictions += 1
+
+    def inputs(self):
+        """
+        Choose the keys to hold for the next step.
+
+        Returns:
+            The INPUT_* flags to pass to step()
+        """
+        state = self.state
+        count = len(state.ball_x)
+
+        # Balls came or went: start again with a prediction for every ball
+        if count != len(self.x_move):
+            for column in (self.x_move, self.y_move, self.landing_x, self.landing_tick):
+                del column[:]
+                column.extend([0.0] * count)
+            for ball in range(count):
+                self.predict(ball)
+
+        # Predict again only for the balls that bounced, and follow the one landing first
+        target = 0
+        x_move = state.x_move
+        y_move = state.y_move
+        for ball in range(count):
+            if x_move[ball] != self.x_move[ball] or y_move[ball] != self.y_move[ball]:
+                self.predict(ball)
+            if self.landing_tick[ball] < self.landing_tick[target]:
+                target = ball
+
+        target_x = 0.0
+        if count:
+            # Furthest the paddle center can go from the middle (less while the paddle is wider)
+            limit = SCREEN_EDGE - state.paddle_half_width
+            target_x = max(-limit, min(limit, self.landing_x[target]))
+        return steer(state.paddle_x, state.paddle_speed, target_x)
+
+
+def soak(ticks=None, seconds=None, level_pack=None, balls=1, report=print, powerups=False):
+    """
+    Play game after game headless with the bot, for a number of ticks or seconds.
+    Each new game uses the next level of the pack (or the standard wall).
+
+    Args:
+        ticks: Stop after this many steps (None for no limit)
+        seconds: Stop after this much real time (None for no limit)
+        level_pack: An open LevelPack to cycle through, or None
+        balls: Balls served in each game
+        report: Function called with a progress line (speed and peak memory) every
+            REPORT_INTERVAL seconds
+        powerups: True to let destroyed bricks drop power-ups
+
+    Returns:
+        A dictionary with the number of steps, games, games won and steps per second
+    """
+    games = won = total = 0
+    level = 0
+    start = last_report = time.perf_counter()
+    state = bot = None
+    while (ticks is None or total < ticks) and (seconds is None or time.perf_counter() - start < seconds):
+        if state is None or not state.game_is_on:
+            if state is not None:
+                games += 1
+                won += state.won
+            if level_pack is not None:
+                state = GameState(bricks=level_pack.level(level % len(level_pack)).bricks(), balls=balls,
+                                  powerups=powerups)
+                level += 1
+            else:
+                state = GameState(balls=balls, powerups=powerups)
+            bot = AutoPlayer(state)
+
+        step(state, bot.inputs())
+        total += 1
+
+        now = time.perf_counter()
+        if total % 1000 == 0 and now - last_report >= REPORT_INTERVAL:
+            last_report = now
+            memory = f"  peak memory {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss} KB" if resource else ""
+            report(f"{now - start:8.0f} s  {total} steps  {games} games ({won} won)  "
+                   f"{total / (now - start):.0f} steps/s{memory}")
+
+    elapsed = time.perf_counter() - start
+    return {"ticks": total, "games": games, "won": won, "ticks_per_second": round(total / elapsed)}
+
+
+def main():
+    """
+    Run a headless soak test from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Let a bot play BreakOut without a window.")
+    parser.add_argument("--ticks", type=int, help="stop after this many steps")
+    parser.add_argument("--hours", type=float, help="stop after this many hours")
+    parser.add_argument("--levels", metavar="PACK", help="cycle through the levels of a level pack")
+    parser.add_argument("--balls", type=int, default=1, help="balls served in each game")
+    parser.add_argument("--powerups", action="store_true", help="let destroyed bricks drop power-ups")
+    args = parser.parse_args()
+    if args.ticks is None and args.hours is None:
+        args.ticks = 1000000
+
+    seconds = None if args.hours is None else args.hours * 3600
+    if args.levels:
+        from levels import LevelPack
+        with LevelPack(args.levels) as pack:
+            results = soak(args.ticks, seconds, pack, args.balls, powerups=args.powerups)
+    else:
+        results = soak(args.ticks, seconds, None, args.balls, powerups=args.powerups)
+    print(f"{results['ticks']} steps, {results['games']} games finished ({results['won']} won), "
+          f"{results['ticks_per_second']} steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 """
 Ball Class for BreakOut Clone Game
 Author: Hemant Vijay
-Last Updated: 4-Nov-2025
+Last Updated: 18-Oct-2026
 
-This file defines the Ball class which represents the bouncing ball in the game.
+This file defines the Ball class which draws the bouncing ball in the game.
 The ball moves continuously, bounces off walls, the paddle, and bricks.
-The ball's speed increases slightly with each paddle bounce to increase difficulty.
+The movement itself is calculated by the game engine (engine.py).
 
 Project Credit: This project is part of the assignment for Angela Yu's course
 "100 Days of Code: The Complete Python Pro Bootcamp"
@@ -17,82 +17,59 @@ from turtle import Turtle
 # Constants for ball properties
 BALL_COLOR = "white"  # Color of the ball
 BALL_SIZE = 1  # Size of the ball (1 = normal size)
-INITIAL_MOVE_SPEED = 10  # Starting speed of the ball in pixels
-SPEED_INCREMENT = 1.1  # How much faster the ball gets after hitting paddle
 
 
 class Ball(Turtle):
     """
-    The Ball class creates a bouncing ball that moves around the screen.
-    The ball bounces off the walls, paddle, and bricks.
-    If the ball falls off the bottom, the player loses a life.
+    The Ball class draws the bouncing ball on the screen.
+    The ball's position and speed live in the GameState (see engine.py);
+    this class only moves the turtle to where the game state says the ball is.
+    In multi-ball mode there is one Ball turtle for each ball in play.
     """
 
-    def __init__(self):
+    def __init__(self, state, index=0):
         """
-        Initialize the ball at the center of the screen.
-        The ball starts moving in an upward diagonal direction.
+        Initialize the ball drawing at the ball's position in the game state.
+
+        Args:
+            state: The GameState whose ball this turtle shows
+            index: Which of the game's balls this turtle shows (0 for the first)
         """
-        super().__init__()  # Initialize the parent Turtle class
+        # Start hidden with the circle shape and without an undo history, which the game never uses
+        super().__init__(shape="circle", undobuffersize=0, visible=False)
 
         # Set up the ball's appearance
-        self.shape("circle")  # Make it a circular ball
         self.color(BALL_COLOR)  # Make it white to stand out
-        self.shapesize(stretch_wid=BALL_SIZE, stretch_len=BALL_SIZE)  # Normal size
+        if BALL_SIZE != 1:
+            self.shapesize(stretch_wid=BALL_SIZE, stretch_len=BALL_SIZE)  # Circles are normal size already
         self.penup()  # Don't draw lines when moving
 
-        # Set up ball movement direction
-        # x_move and y_move control the direction and speed of the ball
-        self.x_move = INITIAL_MOVE_SPEED  # Move right initially
-        self.y_move = INITIAL_MOVE_SPEED  # Move up initially
-        self.move_speed = 0.1  # Time delay between moves (lower = faster)
-
-    def move(self):
-        """
-        Move the ball by updating its position based on x_move and y_move.
-        This method is called repeatedly in the game loop to animate the ball.
-        """
-        # Calculate new position
-        new_x = self.xcor() + self.x_move
-        new_y = self.ycor() + self.y_move
-
-        # Move to new position
-        self.goto(new_x, new_y)
+        # Remember which game we are drawing and show the starting position
+        self.state = state
+        self.index = index
+        self.render()
 
-    def bounce_y(self):
-        """
-        Bounce the ball vertically (reverse its up/down direction).
-        This happens when the ball hits the top wall or the paddle.
+    def render(self, alpha=1.0):
         """
-        # Reverse the y direction (if going up, now go down, and vice versa)
-        self.y_move *= -1
+        Move the ball turtle to the ball's position in the game state.
+        This method is called once per frame after the game has been stepped.
 
-    def bounce_x(self):
+        Args:
+            alpha: How far between the previous and the current step to draw the ball
+                   (0 = previous position, 1 = current position), for smooth movement
         """
-        Bounce the ball horizontally (reverse its left/right direction).
-        This happens when the ball hits the left or right walls.
-        """
-        # Reverse the x direction (if going right, now go left, and vice versa)
-        self.x_move *= -1
-
-    def increase_speed(self):
-        """
-        Increase the ball's speed slightly to make the game more challenging.
-        This is called each time the ball successfully bounces off the paddle.
-        """
-        # Reduce the move_speed delay to make the ball faster
-        self.move_speed *= 0.9
-
-    def reset_position(self):
-        """
-        Reset the ball to the center of the screen after a player loses a life.
-        The ball also bounces in the opposite direction to give the player time to prepare.
-        """
-        # Move ball back to center
-        self.goto(0, 0)
-
-        # Reset the speed to initial value
-        self.move_speed = 0.1
-
-        # Reverse the y direction so the ball goes in opposite direction
-        self.bounce_y()
+        state = self.state
+        index = self.index
+
+        # Hide the turtle while its ball is out of play (multi-ball mode)
+        if index >= len(state.ball_x):
+            if self.isvisible():
+                self.hideturtle()
+            return
+        if not self.isvisible():
+            self.showturtle()
+
+        prev_x = state.prev_x[index]
+        prev_y = state.prev_y[index]
+        self.goto(prev_x + (state.ball_x[index] - prev_x) * alpha,
+                  prev_y + (state.ball_y[index] - prev_y) * alpha)
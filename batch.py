@@ -0,0 +1,252 @@
+"""
+Batch Simulator for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the BatchGame class which plays many independent games at once.
+Instead of one GameState object per game, every value is stored in a NumPy array
+with one entry per game (ball position and speed, paddle position, score, lives)
+and the bricks are a true/false array of shape (games, bricks). Each call to step()
+advances every game by one time step with whole-array operations, following the same
+rules as the original game, so 10,000 games cost about as much Python work as one.
+Collisions use the original distance checks (the ball is moved first and then tested
+against each brick and the paddle), which is simpler to do for many games at once
+than the swept collisions used by engine.py, so keep the time step small.
+
+This is used for testing bots and tuning the game; the normal game does not need it.
+It requires NumPy (pip install numpy).
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import numpy as np
+
+from engine import (
+    INITIAL_MOVE_SPEED, SPEED_INCREMENT,
+    PADDLE_WIDTH, PADDLE_Y, SCREEN_EDGE,
+    PADDLE_MAX_SPEED, PADDLE_ACCELERATION, PADDLE_DECELERATION,
+    BRICK_ROWS, BRICK_COLUMNS, BRICK_START_X, BRICK_START_Y,
+    BRICK_SPACING_X, BRICK_SPACING_Y, BRICK_POINTS,
+    STARTING_LIVES, TOP_WALL, SIDE_WALL, BOTTOM_EDGE,
+    INPUT_LEFT, INPUT_RIGHT, TIME_STEP,
+    EVENT_WALL, EVENT_PADDLE, EVENT_BRICK, EVENT_LIFE_LOST, EVENT_WIN, EVENT_GAME_OVER,
+)
+
+# Distance checks from the original game
+PADDLE_HIT_DISTANCE = 50  # How close the ball must be to the paddle to bounce
+PADDLE_HIT_ZONE = -230  # The ball must also be below this height to hit the paddle
+BRICK_HIT_DISTANCE = 40  # How close the ball must be to a brick to destroy it
+
+# The ball can only touch bricks within BRICK_HIT_DISTANCE of it, which covers at
+# most this many grid columns and rows around the ball
+NEAR_COLUMNS = int(2 * BRICK_HIT_DISTANCE // BRICK_SPACING_X) + 2
+NEAR_ROWS = int(2 * BRICK_HIT_DISTANCE // BRICK_SPACING_Y) + 2
+
+
+class BatchGame:
+    """
+    The BatchGame class runs N Breakout games in lockstep using NumPy arrays.
+    Index g of every array belongs to game g.
+    """
+
+    def __init__(self, games, rows=BRICK_ROWS, columns=BRICK_COLUMNS):
+        """
+        Set up N new games.
+
+        Args:
+            games: Number of games to run side by side
+            rows: Number of brick rows in every game
+            columns: Number of bricks in each row
+        """
+        self.games = games
+        self.rows = rows
+        self.columns = columns
+
+        # Brick layout, shared by all games (brick i is at row i // columns, column i % columns)
+        index = np.arange(rows * columns)
+        self.brick_x = (BRICK_START_X + (index % columns) * BRICK_SPACING_X).astype(np.float64)
+        self.brick_y = (BRICK_START_Y - (index // columns) * BRICK_SPACING_Y).astype(np.float64)
+        points = np.array(BRICK_POINTS, dtype=np.int64)
+        self.brick_points = points[np.minimum(index // columns, len(BRICK_POINTS) - 1)]
+
+        # Per-game arrays
+        self.ball_x = np.zeros(games)
+        self.ball_y = np.zeros(games)
+        self.x_move = np.zeros(games)
+        self.y_move = np.zeros(games)
+        self.paddle_x = np.zeros(games)
+        self.paddle_speed = np.zeros(games)
+        self.brick_alive = np.zeros((games, rows * columns), dtype=bool)
+        self.bricks_left = np.zeros(games, dtype=np.int64)
+        self.score = np.zeros(games, dtype=np.int64)
+        self.lives = np.zeros(games, dtype=np.int64)
+        self.tick = np.zeros(games, dtype=np.int64)
+        self.game_is_on = np.zeros(games, dtype=bool)
+        self.won = np.zeros(games, dtype=bool)
+
+        # Offsets of the nearby cells checked for brick hits, in brick list order
+        # (row offsets outside, column offsets inside) so the first hit is the lowest index
+        self._near_rows = np.repeat(np.arange(NEAR_ROWS), NEAR_COLUMNS)
+        self._near_cols = np.tile(np.arange(NEAR_COLUMNS), NEAR_ROWS)
+
+        self.reset()
+
+    def reset(self, games=None):
+        """
+        Start some (or all) of the games again from the beginning.
+
+        Args:
+            games: A boolean mask or index array of games to reset (all games if None)
+        """
+        if games is None:
+            games = slice(None)
+        self.ball_x[games] = 0.0
+        self.ball_y[games] = 0.0
+        self.x_move[games] = INITIAL_MOVE_SPEED
+        self.y_move[games] = INITIAL_MOVE_SPEED
+        self.paddle_x[games] = 0.0
+        self.paddle_speed[games] = 0.0
+        self.brick_alive[games] = True
+        self.bricks_left[games] = self.rows * self.columns
+        self.score[games] = 0
+        self.lives[games] = STARTING_LIVES
+        self.tick[games] = 0
+        self.game_is_on[games] = True
+        self.won[games] = False
+
+    def _move_paddles(self, mask, inputs, dt):
+        """
+        Move the paddle of every game in mask for one time step, staying inside the
+        screen. Paddles speed up while a direction is held and slow down otherwise,
+        like move_paddle() in engine.py.
+
+        Args:
+            mask: Boolean array of games whose paddle should move
+            inputs: Integer array of INPUT_LEFT/INPUT_RIGHT flags, one per game
+            dt: Length of the step in seconds
+        """
+        direction = ((inputs & INPUT_RIGHT) != 0).astype(np.float64) - ((inputs & INPUT_LEFT) != 0)
+        target = direction * PADDLE_MAX_SPEED
+        change = np.where(direction != 0, PADDLE_ACCELERATION, PADDLE_DECELERATION) * dt
+        speed = np.clip(target, self.paddle_speed - change, self.paddle_speed + change)
+
+        # Stop at the edge of the screen
+        limit = SCREEN_EDGE - (PADDLE_WIDTH * 10)
+        new_x = self.paddle_x + speed * dt
+        outside = np.abs(new_x) > limit
+        new_x[outside] = np.copysign(limit, new_x[outside])
+        speed[outside] = 0.0
+
+        self.paddle_x[mask] = new_x[mask]
+        self.paddle_speed[mask] = speed[mask]
+
+    def _find_brick_hits(self, active):
+        """
+        Find the brick each active game's ball is touching.
+        Only the few grid cells around each ball are checked.
+
+        Args:
+            active: Boolean array of games still being played
+
+        Returns:
+            An index array of games that hit a brick and a matching array of brick indices
+        """
+        games = np.flatnonzero(active)
+        x = self.ball_x[games]
+        y = self.ball_y[games]
+
+        # Top-left cell of the square around each ball that could contain a hit
+        first_col = np.floor((x - BRICK_HIT_DISTANCE - BRICK_START_X) / BRICK_SPACING_X + 0.5).astype(np.int64)
+        first_row = np.floor((BRICK_START_Y - y - BRICK_HIT_DISTANCE) / BRICK_SPACING_Y + 0.5).astype(np.int64)
+
+        # Candidate cells for every game, shape (games, NEAR_ROWS * NEAR_COLUMNS)
+        cols = first_col[:, None] + self._near_cols
+        rows = first_row[:, None] + self._near_rows
+        valid = (cols >= 0) & (cols < self.columns) & (rows >= 0) & (rows < self.rows)
+        bricks = np.where(valid, rows * self.columns + cols, 0)
+
+        # A candidate is a hit if it exists, is still alive and is close enough
+        alive = self.brick_alive[games[:, None], bricks]
+        distance = np.hypot(self.brick_x[bricks] - x[:, None], self.brick_y[bricks] - y[:, None])
+        hits = valid & alive & (distance < BRICK_HIT_DISTANCE)
+
+        # Candidates are in brick order, so the first hit is the lowest brick index
+        any_hit = hits.any(axis=1)
+        first = hits.argmax(axis=1)
+        return games[any_hit], bricks[any_hit, first[any_hit]]
+
+    def step(self, inputs=None, dt=TIME_STEP):
+        """
+        Advance every game that is still on by one time step.
+
+        Args:
+            inputs: Optional integer array of INPUT_LEFT/INPUT_RIGHT flags, one per game
+            dt: Length of the step in seconds
+
+        Returns:
+            An integer array of EVENT_* flags, one per game
+        """
+        active = self.game_is_on.copy()
+        events = np.zeros(self.games, dtype=np.int64)
+        self.tick[active] += 1
+
+        # Apply the player's input before moving the ball
+        if inputs is None:
+            inputs = np.zeros(self.games, dtype=np.int64)
+        self._move_paddles(active, inputs, dt)
+
+        # Move the balls of the games that are still on
+        self.ball_x[active] += self.x_move[active] * dt
+        self.ball_y[active] += self.y_move[active] * dt
+
+        # Check if ball hits the top wall (only while moving up)
+        hit = active & (self.ball_y > TOP_WALL) & (self.y_move > 0)
+        self.y_move[hit] *= -1
+        events[hit] |= EVENT_WALL
+
+        # Check if ball hits the left or right walls (only while moving towards them)
+        hit = active & (np.abs(self.ball_x) > SIDE_WALL) & (self.ball_x * self.x_move > 0)
+        self.x_move[hit] *= -1
+        events[hit] |= EVENT_WALL
+
+        # Check if ball hits the paddle (only while falling)
+        hit = (active
+               & (self.y_move < 0)
+               & (self.ball_y < PADDLE_HIT_ZONE)
+               & (np.hypot(self.ball_x - self.paddle_x, self.ball_y - PADDLE_Y) < PADDLE_HIT_DISTANCE))
+        self.y_move[hit] *= -SPEED_INCREMENT
+        self.x_move[hit] *= SPEED_INCREMENT
+        events[hit] |= EVENT_PADDLE
+
+        # Check if ball hits any bricks (at most one brick per game per tick)
+        games, bricks = self._find_brick_hits(active)
+        self.brick_alive[games, bricks] = False
+        self.bricks_left[games] -= 1
+        self.score[games] += self.brick_points[bricks]
+        self.y_move[games] *= -1
+        events[games] |= EVENT_BRICK
+
+        # Check if all bricks are destroyed (player wins)
+        won = active & (self.bricks_left == 0)
+        self.won[won] = True
+        self.game_is_on[won] = False
+        events[won] |= EVENT_WIN
+        active &= ~won
+
+        # Check if ball falls off the bottom of the screen (player loses a life)
+        fell = active & (self.ball_y < BOTTOM_EDGE)
+        self.ball_x[fell] = 0.0
+        self.ball_y[fell] = 0.0
+        self.x_move[fell] = np.copysign(INITIAL_MOVE_SPEED, self.x_move[fell])
+        self.y_move[fell] = np.copysign(INITIAL_MOVE_SPEED, -self.y_move[fell])
+        self.lives[fell] -= 1
+        events[fell] |= EVENT_LIFE_LOST
+
+        # Check if player has run out of lives
+        over = fell & (self.lives <= 0)
+        self.game_is_on[over] = False
+        events[over] |= EVENT_GAME_OVER
+
+        return events
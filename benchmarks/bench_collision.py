@@ -0,0 +1,132 @@
+"""
+Brick Collision Microbenchmark for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This script compares the grid-based brick collision check in engine.py with the
+old approach of checking every brick in the list. It builds brick walls of growing
+size and times both checks for the same ball positions and movements.
+
+Run it from the project directory with:
+    python benchmarks/bench_collision.py
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import os
+import random
+import sys
+import time
+
+# Make the game modules importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collision import sweep_circle_box
+from engine import GameState, BALL_RADIUS, BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT, find_brick_hit, brick_is_alive
+
+# Brick wall sizes to test, as (rows, columns)
+SIZES = [(5, 11), (50, 11), (100, 55), (200, 250)]
+POSITIONS = 200  # Number of ball positions checked per size
+MOVE = 20  # Largest ball movement (in pixels, along x and y) during one check
+
+
+def linear_find_brick_hit(state, x, y, dx, dy):
+    """
+    The original approach: check every brick in the list, in order.
+
+    Args:
+        state: The GameState to check
+        x, y: Position of the ball
+        dx, dy: How far the ball moves
+
+    Returns:
+        A tuple (t, index, normal_x, normal_y) for the first brick touched, or None
+    """
+    best = None
+    for i in range(len(state.brick_x)):
+        if not brick_is_alive(state, i):
+            continue
+        bx = state.brick_x[i]
+        by = state.brick_y[i]
+        hit = sweep_circle_box(x, y, dx, dy, BALL_RADIUS,
+                               bx - BRICK_HALF_WIDTH, by - BRICK_HALF_HEIGHT,
+                               bx + BRICK_HALF_WIDTH, by + BRICK_HALF_HEIGHT)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = (hit[0], i, hit[1], hit[2])
+    return best
+
+
+def time_check(check, state, positions):
+    """
+    Time one collision check over a list of ball positions.
+
+    Args:
+        check: The function to time (takes a GameState, x, y, dx and dy)
+        state: The GameState holding the bricks
+        positions: A list of (x, y, dx, dy) ball positions and movements
+
+    Returns:
+        A tuple (average nanoseconds per check, list of results)
+    """
+    results = []
+    start = time.perf_counter_ns()
+    for x, y, dx, dy in positions:
+        results.append(check(state, x, y, dx, dy))
+    elapsed = time.perf_counter_ns() - start
+    return elapsed / len(positions), results
+
+
+def run(sizes=SIZES, count=POSITIONS, seed=0):
+    """
+    Run the benchmark for every brick wall size.
+
+    Args:
+        sizes: A list of (rows, columns) brick wall sizes
+        count: Number of ball positions checked per size
+        seed: Random seed so runs can be compared
+
+    Returns:
+        A list of dictionaries, one per size, with the timings in nanoseconds
+    """
+    rng = random.Random(seed)
+    rows_out = []
+    for rows, columns in sizes:
+        state = GameState(rows, columns)
+
+        # Scatter ball positions over the whole brick wall and the space below it
+        min_x = min(state.brick_x) - 50
+        max_x = max(state.brick_x) + 50
+        min_y = min(state.brick_y) - 300
+        max_y = max(state.brick_y) + 50
+        positions = [(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y),
+                      rng.uniform(-MOVE, MOVE), rng.uniform(-MOVE, MOVE)) for _ in range(count)]
+
+        linear_ns, linear_hits = time_check(linear_find_brick_hit, state, positions)
+        grid_ns, grid_hits = time_check(find_brick_hit, state, positions)
+
+        # Both checks must agree on which brick gets hit
+        if linear_hits != grid_hits:
+            raise AssertionError(f"grid and linear scan disagree for {rows}x{columns} bricks")
+
+        rows_out.append({
+            "bricks": rows * columns,
+            "linear_ns": round(linear_ns),
+            "grid_ns": round(grid_ns),
+            "speedup": round(linear_ns / grid_ns, 1),
+        })
+    return rows_out
+
+
+def main():
+    """
+    Print a table comparing the two collision checks.
+    """
+    print(f"{'bricks':>8} {'linear ns':>12} {'grid ns':>10} {'speedup':>8}")
+    for row in run():
+        print(f"{row['bricks']:>8} {row['linear_ns']:>12} {row['grid_ns']:>10} {row['speedup']:>7}x")
+
+
+if __name__ == "__main__":
+    main()
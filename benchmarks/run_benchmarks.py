@@ -0,0 +1,310 @@
+"""
+Benchmark Suite for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This script measures how fast the game runs and writes the results as JSON so
+runs can be compared and slowdowns caught before a new version is deployed.
+It measures:
+- headless ticks per second of the game engine
+- the cost of the brick collision check as the number of bricks grows
+- how long it takes to create the game state and the drawing objects
+- frame time percentiles of the render path (drawn on a stub canvas)
+
+Nothing here opens a window, so it runs on a Linux box with no display. The
+Ball and Paddle turtles need the turtle module (tkinter); if it is missing
+their timings are reported as null.
+
+Run it from the project directory with:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Make the game modules importable when running this file directly
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+import bench_collision
+from stub_canvas import StubCanvas, offscreen_screen
+from engine import GameState, step, INPUT_LEFT, INPUT_RIGHT, EVENT_BRICK, EVENT_LIFE_LOST
+from gameloop import TIME_STEP, RENDER_RATE
+from profiler import percentiles
+from brick import BrickManager
+from scoreboard import Scoreboard
+
+RESULTS_VERSION = 1  # Bump when the layout of the JSON results changes
+TICKS = 200000  # Engine steps used to measure ticks per second
+FRAMES = 3000  # Frames drawn to measure frame times
+REPEATS = 20  # How many times each object is created to time construction
+COLLISION_POSITIONS = 200  # Ball positions checked per brick count
+REGRESSION_TOLERANCE = 0.2  # A result 20% worse than the baseline counts as a regression
+
+
+def follow_ball(state):
+    """
+    A simple scripted player that moves the paddle towards the first ball.
+
+    Args:
+        state: The GameState being played
+
+    Returns:
+        The INPUT_* flags for this step
+    """
+    if state.ball_x[0] > state.paddle_x + 10:
+        return INPUT_RIGHT
+    if state.ball_x[0] < state.paddle_x - 10:
+        return INPUT_LEFT
+    return 0
+
+
+def measure_ticks(ticks=TICKS):
+    """
+    Measure how many engine steps per second run without any graphics.
+
+    Args:
+        ticks: Number of steps to run (new games are started as needed)
+
+    Returns:
+        A dictionary with the number of steps, games and steps per second
+    """
+    state = GameState()
+    games = 1
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if not state.game_is_on:
+            state = GameState()
+            games += 1
+        step(state, follow_ball(state))
+    elapsed = time.perf_counter() - start
+    return {"ticks": ticks, "games": games, "ticks_per_second": round(ticks / elapsed)}
+
+
+def measure_collision(positions=COLLISION_POSITIONS):
+    """
+    Measure the brick collision check for growing numbers of bricks.
+
+    Args:
+        positions: Ball positions checked per brick count
+
+    Returns:
+        A list of dictionaries (see bench_collision.py)
+    """
+    return bench_collision.run(count=positions)
+
+
+def time_construction(create, repeats=REPEATS):
+    """
+    Time how long creating an object takes.
+
+    Args:
+        create: A function that creates the object
+        repeats: How many times to create it
+
+    Returns:
+        The median time in milliseconds
+    """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        create()
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+    return round(percentiles(samples)["p50"], 4)
+
+
+def load_turtle_classes():
+    """
+    Set up an offscreen turtle screen and import the Ball and Paddle turtles.
+
+    Returns:
+        A tuple (screen, Ball, Paddle), or (None, None, None) if turtle is not available
+    """
+    try:
+        screen = offscreen_screen()
+        from ball import Ball
+        from paddle import Paddle, register_paddle_shape
+        register_paddle_shape(screen)  # The Paddle turtle uses the shape main.py registers
+    except ImportError:
+        return None, None, None
+    return screen, Ball, Paddle
+
+
+def measure_startup(repeats=REPEATS):
+    """
+    Measure how long it takes to create the game state and each drawing object.
+
+    Args:
+        repeats: How many times each object is created
+
+    Returns:
+        A dictionary of median creation times in milliseconds
+    """
+    state = GameState()
+    results = {
+        "game_state": time_construction(GameState, repeats),
+        "brick_manager": time_construction(lambda: BrickManager(state, StubCanvas()), repeats),
+        "scoreboard": time_construction(lambda: Scoreboard(state, StubCanvas()), repeats),
+        "paddle": None,
+        "ball": None,
+    }
+
+    screen, Ball, Paddle = load_turtle_classes()
+    if screen is not None:
+        results["paddle"] = time_construction(lambda: Paddle(state), repeats)
+        results["ball"] = time_construction(lambda: Ball(state), repeats)
+    return results
+
+
+def measure_frames(frames=FRAMES):
+    """
+    Measure the time to draw each frame, the same way the main loop does,
+    but on a stub canvas so no window is needed.
+
+    Args:
+        frames: Number of frames to draw
+
+    Returns:
+        A dictionary of frame time percentiles in milliseconds
+    """
+    screen, Ball, Paddle = load_turtle_classes()
+    steps_per_frame = round(1 / (RENDER_RATE * TIME_STEP))
+    samples = []
+
+    state = GameState()
+    canvas = StubCanvas() if screen is None else screen.cv
+    if screen is not None:
+        ball = Ball(state)
+        paddle = Paddle(state)
+
+    brick_manager = scoreboard = None
+    for _ in range(frames):
+        if brick_manager is None or not state.game_is_on:
+            # Start a new game (not timed), reusing the ball and paddle turtles
+            if not state.game_is_on:
+                state = GameState()
+            brick_manager = BrickManager(state, canvas)
+            scoreboard = Scoreboard(state, canvas)
+            if screen is not None:
+                ball.state = paddle.state = state
+
+        start = time.perf_counter_ns()
+        for _ in range(steps_per_frame):
+            events = step(state, follow_ball(state))
+            if events & EVENT_BRICK:
+                for index in state.hit_bricks:
+                    brick_manager.destroy(index)
+            if events & (EVENT_BRICK | EVENT_LIFE_LOST):
+                scoreboard.update_scoreboard()
+        scoreboard.render()
+        if screen is not None:
+            ball.render()
+            paddle.render()
+            screen.update()
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+
+    results = {name: round(value, 4) for name, value in percentiles(samples).items()}
+    results["frames"] = frames
+    results["turtles"] = screen is not None
+    return results
+
+
+def run_all(quick=False):
+    """
+    Run every benchmark.
+
+    Args:
+        quick: Use fewer repetitions (for a fast smoke test)
+
+    Returns:
+        A dictionary with all results, ready to be saved as JSON
+    """
+    scale = 10 if quick else 1
+    return {
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ticks": measure_ticks(TICKS // scale),
+        "collision": measure_collision(COLLISION_POSITIONS // scale),
+        "startup_ms": measure_startup(max(REPEATS // scale, 1)),
+        "frame_time_ms": measure_frames(FRAMES // scale),
+    }
+
+
+def compare(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Compare results with an earlier run.
+
+    Args:
+        results: The results of this run
+        baseline: The results of an earlier run
+        tolerance: How much worse (as a fraction) a result may be before it counts
+
+    Returns:
+        A list of messages, one for each result that got worse than the tolerance
+    """
+    # (name, this run, baseline run, True if bigger numbers are better)
+    checks = [("ticks_per_second", results["ticks"]["ticks_per_second"],
+               baseline["ticks"]["ticks_per_second"], True)]
+    for new, old in zip(results["collision"], baseline["collision"]):
+        checks.append((f"collision grid_ns ({new['bricks']} bricks)", new["grid_ns"], old["grid_ns"], False))
+    for name, value in results["startup_ms"].items():
+        checks.append((f"startup {name} ms", value, baseline["startup_ms"].get(name), False))
+    for name in ("p50", "p95", "p99"):
+        checks.append((f"frame time {name} ms", results["frame_time_ms"][name],
+                       baseline["frame_time_ms"][name], False))
+
+    regressions = []
+    for name, new, old, higher_is_better in checks:
+        if new is None or not old:
+            continue
+        change = (old - new) / old if higher_is_better else (new - old) / old
+        if change > tolerance:
+            regressions.append(f"{name}: {old} -> {new} ({change:+.0%} worse)")
+    return regressions
+
+
+def main():
+    """
+    Run the benchmarks from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the BreakOut Clone game.")
+    parser.add_argument("--output", help="write the JSON results to this file (default: print them)")
+    parser.add_argument("--baseline", help="compare with the JSON results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE,
+                        help="fraction a result may get worse before it counts as a regression")
+    parser.add_argument("--quick", action="store_true", help="run fewer repetitions")
+    args = parser.parse_args()
+
+    results = run_all(quick=args.quick)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print("REGRESSION:", message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Stub Canvas for BreakOut Clone Game Benchmarks
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the StubCanvas class, a stand-in for the Tk canvas that accepts
+every drawing call and does nothing with it except count it. The canvas-based
+drawing classes (BrickManager, Scoreboard) can draw on it directly, and turtle's
+TurtleScreen can be built on top of it with offscreen_screen(), so the whole render
+path can be timed on a Linux box with no display.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+from collections import Counter
+
+# Size reported by the stub canvas (the same as the game window)
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+
+
+class StubCanvas:
+    """
+    The StubCanvas class pretends to be a Tk canvas.
+    Methods that create items return new item ids; all other methods do nothing.
+    """
+
+    def __init__(self, width=CANVAS_WIDTH, height=CANVAS_HEIGHT):
+        """
+        Initialize the stub canvas.
+
+        Args:
+            width: Width reported by cget("width")
+            height: Height reported by cget("height")
+        """
+        self.options = {"width": width, "height": height, "bg": "white"}
+        self.last_item = 0  # Id of the most recently created item
+        self.points = {}  # Points of each item that had coords() set
+        self.calls = Counter()  # How many times each method was called
+
+    def _create(self, *args, **kwargs):
+        """
+        Pretend to create a canvas item.
+
+        Returns:
+            A new item id
+        """
+        self.last_item += 1
+        return self.last_item
+
+    create_line = create_polygon = create_rectangle = create_text = create_image = create_oval = _create
+
+    def cget(self, option):
+        """
+        Return a canvas option such as its width, height or background color.
+        """
+        return self.options.get(option, "")
+
+    def config(self, **options):
+        """
+        Change canvas options (only remembered, nothing is drawn).
+        """
+        self.options.update(options)
+
+    configure = config
+
+    def winfo_rgb(self, color):
+        """
+        Turtle asks the canvas to check color names; every color is accepted.
+        """
+        return 0, 0, 0
+
+    def coords(self, item, *points):
+        """
+        Set or return the points of an item.
+        """
+        self.calls["coords"] += 1
+        if points:
+            self.points[item] = list(points[0] if len(points) == 1 else points)
+        else:
+            return self.points.get(item, [0, 0, 0, 0])
+
+    def bbox(self, *args):
+        """
+        Return a dummy bounding box for text items.
+        """
+        return 0, 0, 0, 0
+
+    def __getattr__(self, name):
+        """
+        Any other canvas method (coords, itemconfigure, delete, update, ...) is a no-op
+        that is only counted.
+        """
+        def method(*args, **kwargs):
+            self.calls[name] += 1
+        return method
+
+
+def offscreen_screen(canvas=None):
+    """
+    Build a turtle screen that draws on a StubCanvas and make new turtles use it.
+    This needs the turtle module (and so tkinter) but not a display.
+
+    Args:
+        canvas: The StubCanvas to use (a new one if None)
+
+    Returns:
+        The TurtleScreen, already set to tracer(0) like the game
+    """
+    import turtle
+
+    class OffscreenScreen(turtle.TurtleScreen):
+        def _blankimage(self):
+            # The real version makes a Tk image, which needs a Tk window
+            return ""
+
+    screen = OffscreenScreen(canvas or StubCanvas())
+    screen.tracer(0)
+
+    # Turtle() normally creates the real window on first use; hand it ours instead
+    turtle.Turtle._screen = screen
+    return screen
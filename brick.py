@@ -1,140 +1,103 @@
 """
-Brick Class for BreakOut Clone Game
+Brick Drawing for BreakOut Clone Game
 Author: Hemant Vijay
-Last Updated: 4-Nov-2025
+Last Updated: 18-Oct-2026
 
-This file defines the Brick class which represents the colored bricks at the top
+This file defines the BrickManager class which draws the colored bricks at the top
 of the screen. These bricks are destroyed when the ball hits them, and the player
-earns points. The game is won when all bricks are destroyed.
+earns points. A level is cleared when all its bricks are destroyed.
+
+The rectangles of destroyed bricks are hidden and kept in an ItemPool (see
+pool.py), and the next level's bricks reuse them, so playing level after level
+never adds more items to the canvas than the biggest level needs.
 
 Project Credit: This project is part of the assignment for Angela Yu's course
 "100 Days of Code: The Complete Python Pro Bootcamp"
 Course URL: https://www.udemy.com/course/100-days-of-code/
 """
 
-from turtle import Turtle
+from array import array
+
+from engine import BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT, brick_is_alive
+from pool import ItemPool
 
 # Constants for brick properties
-BRICK_WIDTH = 3  # Width of each brick (stretches horizontally)
-BRICK_HEIGHT = 1  # Height of each brick (stretches vertically)
-BRICK_COLORS = ["red", "orange", "yellow", "green", "blue"]  # Different colors for brick rows
+BRICK_COLORS = ["red", "orange", "yellow", "green", "blue"]  # Color for each brick type
+BRICK_TAG = "brick"  # Canvas tag shared by every brick rectangle
 
 
-class Brick(Turtle):
+class BrickManager:
     """
-    The Brick class creates a single brick that can be destroyed by the ball.
-    When the ball hits a brick, the brick disappears and the player scores points.
-    Different colored bricks may be worth different point values.
+    The BrickManager class draws all the bricks in the game.
+    Instead of one turtle per brick, every brick is a plain rectangle on the
+    screen's canvas. The rectangles are drawn once and left alone; the screen
+    only redraws the area of a brick when that brick is destroyed.
     """
 
-    def __init__(self, position, color):
+    def __init__(self, state, canvas, pool=None):
         """
-        Initialize a brick at a specific position with a specific color.
+        Initialize the brick manager and draw the initial wall of bricks.
 
         Args:
-            position: A tuple (x, y) representing where to place the brick
-            color: The color of the brick (affects its appearance)
-        """
-        super().__init__()  # Initialize the parent Turtle class
-
-        # Set up the brick's appearance
-        self.shape("square")  # Start with a square shape
-        self.color(color)  # Set the brick color based on its row
-        self.shapesize(stretch_wid=BRICK_HEIGHT, stretch_len=BRICK_WIDTH)  # Stretch to brick shape
-        self.penup()  # Don't draw lines when moving
-        self.goto(position)  # Move to the specified position
-
-    def destroy(self):
-        """
-        Remove the brick from the screen when it's hit by the ball.
-        This makes the brick disappear and allows the ball to pass through.
-        """
-        # Hide the brick by making it invisible
-        self.goto(1000, 1000)  # Move off-screen
-        self.hideturtle()  # Make it invisible
-
-
-class BrickManager:
-    """
-    The BrickManager class creates and manages all the bricks in the game.
-    It creates a grid of colored bricks at the top of the screen and
-    provides methods to check for collisions and remove bricks.
-    """
-
-    def __init__(self):
-        """
-        Initialize the brick manager and create the initial grid of bricks.
+            state: The GameState whose bricks this manager shows
+            canvas: The canvas to draw on (screen.getcanvas() in the game)
+            pool: The ItemPool to take rectangles from and give them back to
+                (a new one if not given)
         """
-        self.bricks = []  # List to store all brick objects
-        self.create_bricks()  # Create the initial brick layout
+        self.state = state
+        self.canvas = canvas
+        self.pool = ItemPool(canvas) if pool is None else pool
+        self.items = array("I")  # Canvas item of each brick, 0 once it is gone (same order as the game state)
+        self.create_bricks()  # Draw the initial brick layout
 
     def create_bricks(self):
         """
-        Create a grid of colored bricks at the top of the screen.
-        The bricks are arranged in rows with different colors.
-        Each row has a specific color from the BRICK_COLORS list.
+        Draw a rectangle for every brick in the game state that is still alive.
+        Each brick gets the color of its type from the BRICK_COLORS list
+        (types past the end of the list use the last color).
         """
-        # Starting position for the first brick (top-left area)
-        start_x = -360  # Left side of the screen
-        start_y = 250  # Near the top of the screen
-
-        # Space between bricks
-        brick_spacing_x = 65  # Horizontal space between brick centers
-        brick_spacing_y = 25  # Vertical space between rows
-
-        # Create 5 rows of bricks
-        for row in range(5):
-            # Each row has a different color from the BRICK_COLORS list
-            color = BRICK_COLORS[row]
-
-            # Create 11 bricks in each row
-            for col in range(11):
-                # Calculate the position for this brick
-                x_pos = start_x + (col * brick_spacing_x)
-                y_pos = start_y - (row * brick_spacing_y)
-
-                # Create a new brick at this position
-                brick = Brick((x_pos, y_pos), color)
-
-                # Add the brick to our list
-                self.bricks.append(brick)
-
-    def check_collision(self, ball):
+        state = self.state
+        take = self.pool.take
+        for i in range(len(state.brick_x)):
+            if not brick_is_alive(state, i):
+                self.items.append(0)
+                continue
+
+            # Turtle y grows upwards but canvas y grows downwards, so flip it
+            x = state.brick_x[i]
+            y = -state.brick_y[i]
+            color = BRICK_COLORS[min(state.brick_type[i], len(BRICK_COLORS) - 1)]
+            self.items.append(take("rectangle", (x - BRICK_HALF_WIDTH, y - BRICK_HALF_HEIGHT,
+                                                 x + BRICK_HALF_WIDTH, y + BRICK_HALF_HEIGHT),
+                                   fill=color, outline=color, tags=BRICK_TAG))
+
+        # Keep the bricks underneath the turtles (ball, paddle and text)
+        self.canvas.tag_lower(BRICK_TAG)
+
+    def destroy(self, index):
         """
-        Check if the ball has collided with any brick.
-        If a collision is detected, destroy the brick and return the score value.
+        Hide the rectangle of a brick that the game engine destroyed and keep it
+        for the next level. Only the area of this one brick is redrawn.
 
         Args:
-            ball: The ball object to check for collisions
+            index: The index of the brick in the game state
+        """
+        item = self.items[index]
+        if item:
+            self.pool.give("rectangle", item)
+            self.items[index] = 0
 
-        Returns:
-            The point value of the destroyed brick, or 0 if no collision
+    def load_level(self):
+        """
+        Draw the bricks of a new level after load_level() in engine.py.
+        Bricks still showing are given back to the pool first, and the new
+        bricks reuse the pool's rectangles.
         """
-        # Loop through all bricks to check for collision
-        for brick in self.bricks:
-            # Check if the ball is close enough to this brick to count as a hit
-            # We use distance() to measure how close the ball is to the brick center
-            if brick.distance(ball) < 40:  # 40 pixels is the collision threshold
-                # Destroy the brick
-                brick.destroy()
-
-                # Remove the brick from our list
-                self.bricks.remove(brick)
-
-                # Calculate points based on brick color (higher rows = more points)
-                if brick.color()[0] == "red":
-                    return 10  # Red bricks worth 10 points
-                elif brick.color()[0] == "orange":
-                    return 8  # Orange bricks worth 8 points
-                elif brick.color()[0] == "yellow":
-                    return 6  # Yellow bricks worth 6 points
-                elif brick.color()[0] == "green":
-                    return 4  # Green bricks worth 4 points
-                elif brick.color()[0] == "blue":
-                    return 2  # Blue bricks worth 2 points
-
-        # No collision detected
-        return 0
+        for item in self.items:
+            if item:
+                self.pool.give("rectangle", item)
+        self.items = array("I")
+        self.create_bricks()
 
     def all_bricks_destroyed(self):
         """
@@ -143,4 +106,4 @@ class BrickManager:
         Returns:
             True if no bricks remain, False otherwise
         """
-        return len(self.bricks) == 0
+        return self.state.bricks_left == 0
@@ -0,0 +1,496 @@
+"""
+Spectator Broadcasting for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file lets other programs watch a running game over a network socket
+(TCP, or a Unix socket on the same computer). The game publishes what happens
+every tick; any number of spectators (see viewer.py) can connect and draw it.
+
+The stream is made of two kinds of binary messages:
+- A keyframe holds the whole game: every brick (position, type, alive or not),
+  the balls, the paddle, the score and lives, and the falling power-ups. A
+  spectator gets one as soon as it connects, and everyone gets one when a new
+  level starts.
+- A delta holds only what changed in one tick: the paddle or ball positions,
+  the numbers of the bricks destroyed, the score and lives, and the falling
+  power-ups and paddle width (only sent while they change). Positions are sent
+  as whole quarter pixels in 2 bytes each, so a typical tick costs about 20
+  bytes.
+
+Each message is encoded once and the same bytes go to every spectator. The
+deltas of one frame are sent together in a single write, and the sockets never
+block, so a slow spectator cannot hold up the game; one that falls too far
+behind is disconnected.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import os
+import socket
+import struct
+
+from engine import GameState
+
+# Constants for the stream format (all numbers are little-endian)
+MESSAGE = struct.Struct("<BI")  # Kind of message, length of what follows
+KEYFRAME = 1
+DELTA = 2
+KEYFRAME_HEADER = struct.Struct("<IIBHBhBI")  # Tick, score, lives, level, status, paddle x, balls, bricks
+DELTA_HEADER = struct.Struct("<IB")  # Tick, which parts changed (CHANGED_* flags)
+POSITION = struct.Struct("<hh")  # x and y in quarter pixels
+BRICK = struct.Struct("<ffB")  # Brick x, y and type
+PADDLE = struct.Struct("<h")  # Paddle x in quarter pixels
+COUNT = struct.Struct("<B")  # Number of balls
+SCORE = struct.Struct("<IB")  # Score, lives
+DESTROYED = struct.Struct("<H")  # Number of destroyed brick numbers that follow (each an unsigned int)
+STATUS = struct.Struct("<B")  # STATUS_* flags
+POWERUPS = struct.Struct("<hH")  # Paddle half width in quarter pixels, number of falling power-ups
+POWERUP = struct.Struct("<hhB")  # Power-up x and y in quarter pixels, and its kind
+
+# Flags of a delta saying which parts follow its header, in this order
+CHANGED_PADDLE = 1
+CHANGED_BALLS = 2
+CHANGED_SCORE = 4
+CHANGED_BRICKS = 8
+CHANGED_STATUS = 16
+CHANGED_POWERUPS = 32
+
+# Flags of the game status
+STATUS_PLAYING = 1
+STATUS_WON = 2
+
+# Constants for the broadcaster
+POSITION_SCALE = 4  # Positions are sent in 1/4 pixel steps
+MAX_BACKLOG = 256 * 1024  # A spectator with more unsent bytes than this is disconnected
+MAX_SPECTATORS = 64  # Connections waiting to be accepted
+DEFAULT_PORT = 8765
+
+
+def parse_address(text):
+    """
+    Turn an address from the command line into a socket family and address.
+    "HOST:PORT" or "PORT" is TCP (HOST defaults to 127.0.0.1); anything with a "/"
+    in it is the path of a Unix socket.
+
+    Args:
+        text: The address
+
+    Returns:
+        A tuple (family, address) for socket.socket() and bind()/connect()
+    """
+    if "/" in text:
+        return socket.AF_UNIX, text
+    host, _, port = text.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def quantize(value):
+    """
+    Returns:
+        A position in whole quarter pixels, kept inside the range a 2 byte number holds
+    """
+    return max(-32768, min(32767, round(value * POSITION_SCALE)))
+
+
+def status_of(state):
+    """
+    Returns:
+        The STATUS_* flags of a game
+    """
+    return (STATUS_PLAYING if state.game_is_on else 0) | (STATUS_WON if state.won else 0)
+
+
+def powerups_of(state):
+    """
+    Returns:
+        The paddle width and falling power-ups of a game, as sent to spectators
+    """
+    return quantize(state.paddle_half_width), [
+        (quantize(state.powerup_x[index]), quantize(state.powerup_y[index]), state.powerup_kind[index])
+        for index in range(len(state.powerup_x))]
+
+
+def encode_powerups(powerups):
+    """
+    Encode the paddle width and falling power-ups from powerups_of().
+
+    Returns:
+        The encoded bytes
+    """
+    half_width, falling = powerups
+    return POWERUPS.pack(half_width, len(falling)) + b"".join(POWERUP.pack(*powerup) for powerup in falling)
+
+
+def encode_keyframe(state, first_level=0):
+    """
+    Encode the whole game as a keyframe message.
+
+    Args:
+        state: The GameState
+        first_level: Number of the level the game started at, added to the level sent
+
+    Returns:
+        The message as bytes
+    """
+    count = len(state.ball_x)
+    parts = [KEYFRAME_HEADER.pack(state.tick, state.score, state.lives, first_level + state.level,
+                                  status_of(state), quantize(state.paddle_x), count, len(state.brick_x))]
+    for ball in range(count):
+        parts.append(POSITION.pack(quantize(state.ball_x[ball]), quantize(state.ball_y[ball])))
+    for brick in range(len(state.brick_x)):
+        parts.append(BRICK.pack(state.brick_x[brick], state.brick_y[brick], state.brick_type[brick]))
+    parts.append(bytes(state.brick_alive))
+    parts.append(encode_powerups(powerups_of(state)))
+    payload = b"".join(parts)
+    return MESSAGE.pack(KEYFRAME, len(payload)) + payload
+
+
+class Broadcaster:
+    """
+    The Broadcaster class publishes a game to every connected spectator.
+    Call record() after every step and flush() once per frame.
+    """
+
+    def __init__(self, state, address, first_level=0):
+        """
+        Start listening for spectators.
+
+        Args:
+            state: The GameState to publish
+            address: Where to listen (see parse_address), like "127.0.0.1:8765"
+            first_level: Number of the level pack level the game started at (0 = the first);
+                spectators are sent the level number counted from the start of the pack
+        """
+        self.state = state
+        self.first_level = first_level
+        family, self.address = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)  # Left behind by an earlier game
+        self.server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen(MAX_SPECTATORS)
+        self.server.setblocking(False)
+        if family == socket.AF_INET:
+            self.address = self.server.getsockname()  # The real port when port 0 was asked for
+        self.family = family
+
+        self.spectators = {}  # Socket of each spectator -> bytes still to send it
+        self.pending = []  # Messages recorded since the last flush()
+        self.bytes_sent = 0
+
+        # What the spectators were last told, so only changes are sent
+        self.level = None
+        self.paddle = None
+        self.balls = None
+        self.score = None
+        self.status = None
+        self.powerups = None
+
+    def remember(self):
+        """
+        Remember the game as it is now as what the spectators have been told.
+        """
+        state = self.state
+        self.level = (state.level, len(state.brick_x))
+        self.paddle = quantize(state.paddle_x)
+        self.balls = [(quantize(state.ball_x[ball]), quantize(state.ball_y[ball])) for ball in range(len(state.ball_x))]
+        self.score = (state.score, state.lives)
+        self.status = status_of(state)
+        self.powerups = powerups_of(state)
+
+    def record(self):
+        """
+        Encode what changed in the last step (call after every step()).
+        """
+        state = self.state
+        if (state.level, len(state.brick_x)) != self.level:
+            # A new level (or the first tick): everyone gets the whole game
+            self.pending.append(encode_keyframe(state, self.first_level))
+            self.remember()
+            return
+
+        changed = 0
+        parts = []
+        paddle = quantize(state.paddle_x)
+        if paddle != self.paddle:
+            changed |= CHANGED_PADDLE
+            parts.append(PADDLE.pack(paddle))
+            self.paddle = paddle
+        balls = [(quantize(state.ball_x[ball]), quantize(state.ball_y[ball])) for ball in range(len(state.ball_x))]
+        if balls != self.balls:
+            changed |= CHANGED_BALLS
+            parts.append(COUNT.pack(len(balls)))
+            parts.extend(POSITION.pack(x, y) for x, y in balls)
+            self.balls = balls
+        score = (state.score, state.lives)
+        if score != self.score:
+            changed |= CHANGED_SCORE
+            parts.append(SCORE.pack(*score))
+            self.score = score
+        if state.hit_bricks:
+            changed |= CHANGED_BRICKS
+            parts.append(DESTROYED.pack(len(state.hit_bricks)))
+            parts.append(struct.pack(f"<{len(state.hit_bricks)}I", *state.hit_bricks))
+        status = status_of(state)
+        if status != self.status:
+            changed |= CHANGED_STATUS
+            parts.append(STATUS.pack(status))
+            self.status = status
+        # Power-ups only cost something while some are falling or the paddle width changes
+        if state.powerup_x or self.powerups[1] or quantize(state.paddle_half_width) != self.powerups[0]:
+            powerups = powerups_of(state)
+            if powerups != self.powerups:
+                changed |= CHANGED_POWERUPS
+                parts.append(encode_powerups(powerups))
+                self.powerups = powerups
+
+        if changed:
+            payload = DELTA_HEADER.pack(state.tick, changed) + b"".join(parts)
+            self.pending.append(MESSAGE.pack(DELTA, len(payload)) + payload)
+
+    def flush(self):
+        """
+        Let new spectators in and send everything recorded since the last flush().
+        Never waits: whatever a spectator's connection cannot take now is kept for later.
+        """
+        data = b"".join(self.pending)
+        self.pending.clear()
+        if data:
+            for connection in self.spectators:
+                self.spectators[connection] += data
+
+        # New spectators start with the whole game as it is now
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            connection.setblocking(False)
+            if self.family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.spectators[connection] = bytearray(encode_keyframe(self.state, self.first_level))
+
+        for connection, backlog in list(self.spectators.items()):
+            if not backlog:
+                continue
+            try:
+                sent = connection.send(backlog)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except OSError:
+                self.drop(connection)  # The spectator went away
+                continue
+            del backlog[:sent]
+            self.bytes_sent += sent
+            if len(backlog) > MAX_BACKLOG:
+                self.drop(connection)  # Too far behind to ever catch up
+
+    def drop(self, connection):
+        """
+        Disconnect a spectator.
+
+        Args:
+            connection: The spectator's socket
+        """
+        del self.spectators[connection]
+        connection.close()
+
+    def close(self):
+        """
+        Disconnect every spectator and stop listening.
+        """
+        for connection in list(self.spectators):
+            self.drop(connection)
+        self.server.close()
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+class Spectator:
+    """
+    The Spectator class connects to a Broadcaster and keeps a copy of the game
+    up to date from the stream. The copy is a normal GameState, so everything that
+    draws a game (the turtle classes, the Rasterizer) can draw it.
+    """
+
+    def __init__(self, address):
+        """
+        Connect to a broadcasting game.
+
+        Args:
+            address: Where the game is broadcasting (see parse_address)
+        """
+        family, address = parse_address(address)
+        self.connection = socket.socket(family, socket.SOCK_STREAM)
+        self.connection.connect(address)
+        self.connection.setblocking(False)
+        self.buffer = bytearray()  # Received bytes not yet decoded
+        self.state = None  # The copy of the game, once the first keyframe has arrived
+        self.new_level = False  # True after a keyframe, until the drawing catches up
+        self.destroyed = []  # Bricks destroyed since the last receive()
+        self.connected = True
+
+    def receive(self):
+        """
+        Read and apply everything that has arrived (never waits).
+
+        Returns:
+            True if the game copy changed
+        """
+        self.destroyed = []
+        while True:
+            try:
+                data = self.connection.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                data = b""
+            if not data:
+                self.connected = False  # The game has ended or dropped us
+                break
+            self.buffer += data
+
+        changed = False
+        position = 0
+        buffer = self.buffer
+        while len(buffer) - position >= MESSAGE.size:
+            kind, length = MESSAGE.unpack_from(buffer, position)
+            start = position + MESSAGE.size
+            if len(buffer) - start < length:
+                break  # The rest of this message has not arrived yet
+            payload = memoryview(buffer)[start:start + length]
+            if kind == KEYFRAME:
+                self.apply_keyframe(payload)
+            elif kind == DELTA and self.state is not None:
+                self.apply_delta(payload)
+            payload.release()
+            position = start + length
+            changed = True
+        del buffer[:position]
+        return changed
+
+    def apply_keyframe(self, payload):
+        """
+        Replace the game copy with the game in a keyframe.
+
+        Args:
+            payload: The keyframe without its message header
+        """
+        tick, score, lives, level, status, paddle, balls, bricks = KEYFRAME_HEADER.unpack_from(payload)
+        offset = KEYFRAME_HEADER.size
+        positions = [POSITION.unpack_from(payload, offset + ball * POSITION.size) for ball in range(balls)]
+        offset += balls * POSITION.size
+        records = []
+        for brick in range(bricks):
+            x, y, brick_type = BRICK.unpack_from(payload, offset + brick * BRICK.size)
+            records.append((x, y, brick_type, 1, 0))
+        offset += bricks * BRICK.size
+
+        state = GameState(bricks=records, balls=0)
+        state.brick_alive = bytearray(payload[offset:offset + (bricks + 7) // 8])
+        self.set_powerups(state, payload, offset + (bricks + 7) // 8)
+        state.bricks_left = sum(bin(byte).count("1") for byte in state.brick_alive)
+        state.tick = tick
+        state.score = score
+        state.lives = lives
+        state.level = level
+        state.game_is_on = bool(status & STATUS_PLAYING)
+        state.won = bool(status & STATUS_WON)
+        state.paddle_x = paddle / POSITION_SCALE
+        self.set_balls(state, positions)
+        self.state = state
+        self.new_level = True
+        self.destroyed = []  # Bricks of the old level no longer matter
+
+    def apply_delta(self, payload):
+        """
+        Apply the changes of one tick to the game copy.
+
+        Args:
+            payload: The delta without its message header
+        """
+        state = self.state
+        state.tick, changed = DELTA_HEADER.unpack_from(payload)
+        offset = DELTA_HEADER.size
+        if changed & CHANGED_PADDLE:
+            state.paddle_x = PADDLE.unpack_from(payload, offset)[0] / POSITION_SCALE
+            offset += PADDLE.size
+        if changed & CHANGED_BALLS:
+            count = COUNT.unpack_from(payload, offset)[0]
+            offset += COUNT.size
+            self.set_balls(state, [POSITION.unpack_from(payload, offset + ball * POSITION.size)
+                                   for ball in range(count)])
+            offset += count * POSITION.size
+        if changed & CHANGED_SCORE:
+            state.score, state.lives = SCORE.unpack_from(payload, offset)
+            offset += SCORE.size
+        if changed & CHANGED_BRICKS:
+            count = DESTROYED.unpack_from(payload, offset)[0]
+            offset += DESTROYED.size
+            for index in struct.unpack_from(f"<{count}I", payload, offset):
+                state.brick_alive[index >> 3] &= ~(1 << (index & 7))
+                state.bricks_left -= 1
+                self.destroyed.append(index)
+            offset += count * 4
+        if changed & CHANGED_STATUS:
+            status = STATUS.unpack_from(payload, offset)[0]
+            state.game_is_on = bool(status & STATUS_PLAYING)
+            state.won = bool(status & STATUS_WON)
+            offset += STATUS.size
+        if changed & CHANGED_POWERUPS:
+            self.set_powerups(state, payload, offset)
+
+    def set_powerups(self, state, payload, offset):
+        """
+        Set the paddle width and falling power-ups of the game copy from the stream.
+
+        Args:
+            state: The game copy
+            payload: The message holding them
+            offset: Where they start in the message
+
+        Returns:
+            The offset just past them
+        """
+        half_width, count = POWERUPS.unpack_from(payload, offset)
+        offset += POWERUPS.size
+        state.paddle_half_width = half_width / POSITION_SCALE
+        for column in (state.powerup_x, state.powerup_y, state.powerup_kind):
+            del column[:]
+        for index in range(count):
+            x, y, kind = POWERUP.unpack_from(payload, offset + index * POWERUP.size)
+            state.powerup_x.append(x / POSITION_SCALE)
+            state.powerup_y.append(y / POSITION_SCALE)
+            state.powerup_kind.append(kind)
+        return offset + count * POWERUP.size
+
+    def set_balls(self, state, positions):
+        """
+        Put the balls of the game copy at new positions (quarter pixels).
+
+        Args:
+            state: The game copy
+            positions: A list of (x, y) pairs
+        """
+        for column in (state.ball_x, state.ball_y, state.prev_x, state.prev_y, state.x_move, state.y_move):
+            del column[:]
+        for x, y in positions:
+            x /= POSITION_SCALE
+            y /= POSITION_SCALE
+            state.ball_x.append(x)
+            state.ball_y.append(y)
+            state.prev_x.append(x)  # The spectator draws the balls where they are (no smoothing)
+            state.prev_y.append(y)
+            state.x_move.append(0.0)
+            state.y_move.append(0.0)
+
+    def close(self):
+        """
+        Disconnect from the game.
+        """
+        self.connection.close()
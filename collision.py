@@ -0,0 +1,179 @@
+"""
+Swept Collision Detection for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file works out exactly when a moving ball first touches a rectangle (a brick
+or the paddle). Instead of moving the ball and then checking whether it is close to
+something, we look at the whole path the ball travels during a step. This means a
+fast ball can never jump through a brick or the paddle, however big the step is.
+
+The trick is to grow the rectangle by the ball's radius (giving a rectangle with
+rounded corners) and shoot a single point (the ball's center) at it. The flat sides
+are found with the "slab" method and the rounded corners with a circle test.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import math
+
+
+def sweep_circle_corner(x, y, dx, dy, radius, corner_x, corner_y):
+    """
+    Find when a point moving by (dx, dy) comes within radius of a corner.
+
+    Args:
+        x, y: Start position of the ball center
+        dx, dy: How far the ball moves during the step
+        radius: The ball radius
+        corner_x, corner_y: Position of the corner
+
+    Returns:
+        A tuple (t, normal_x, normal_y) where t is the fraction of the step (0 to 1),
+        or None if the ball does not reach the corner during the step
+    """
+    # Solve |start + t * move - corner| = radius for the smallest t
+    px = x - corner_x
+    py = y - corner_y
+    a = dx * dx + dy * dy
+    b = px * dx + py * dy
+    c = px * px + py * py - radius * radius
+    if a == 0 or b >= 0:
+        # Not moving, or moving away from the corner
+        return None
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        # The path misses the corner
+        return None
+    t = (-b - math.sqrt(discriminant)) / a
+    if t > 1:
+        return None
+    t = max(t, 0.0)
+
+    # The surface normal points from the corner to the ball center at the moment of contact
+    nx = (px + dx * t) / radius
+    ny = (py + dy * t) / radius
+    return t, nx, ny
+
+
+def sweep_circle_box(x, y, dx, dy, radius, left, bottom, right, top):
+    """
+    Find when a ball moving by (dx, dy) first touches a rectangle.
+
+    Args:
+        x, y: Start position of the ball center
+        dx, dy: How far the ball moves during the step
+        radius: The ball radius
+        left, bottom, right, top: The edges of the rectangle
+
+    Returns:
+        A tuple (t, normal_x, normal_y) where t is the fraction of the step (0 to 1)
+        at which the ball touches, and (normal_x, normal_y) is the direction to bounce
+        away from. Returns None if the ball does not touch the rectangle, or is
+        already moving away from it.
+    """
+    # Find the closest point of the rectangle to the ball at the start
+    closest_x = min(max(x, left), right)
+    closest_y = min(max(y, bottom), top)
+    gap_x = x - closest_x
+    gap_y = y - closest_y
+    gap = math.hypot(gap_x, gap_y)
+
+    if gap < radius:
+        # The ball already overlaps the rectangle (for example the paddle moved into it)
+        if gap > 0:
+            nx = gap_x / gap
+            ny = gap_y / gap
+        else:
+            # The center is inside: push out through the nearest side
+            sides = (
+                (x - left, -1.0, 0.0), (right - x, 1.0, 0.0),
+                (y - bottom, 0.0, -1.0), (top - y, 0.0, 1.0),
+            )
+            _, nx, ny = min(sides)
+        if dx * nx + dy * ny < 0:
+            return 0.0, nx, ny
+        return None
+
+    if dx == 0 and dy == 0:
+        # A ball that is not moving cannot hit anything new
+        return None
+
+    # Slab method against the rectangle grown by the ball radius
+    grown_left = left - radius
+    grown_right = right + radius
+    grown_bottom = bottom - radius
+    grown_top = top + radius
+
+    if dx > 0:
+        tx_enter = (grown_left - x) / dx
+        tx_exit = (grown_right - x) / dx
+    elif dx < 0:
+        tx_enter = (grown_right - x) / dx
+        tx_exit = (grown_left - x) / dx
+    elif grown_left <= x <= grown_right:
+        tx_enter = -math.inf
+        tx_exit = math.inf
+    else:
+        return None
+
+    if dy > 0:
+        ty_enter = (grown_bottom - y) / dy
+        ty_exit = (grown_top - y) / dy
+    elif dy < 0:
+        ty_enter = (grown_top - y) / dy
+        ty_exit = (grown_bottom - y) / dy
+    elif grown_bottom <= y <= grown_top:
+        ty_enter = -math.inf
+        ty_exit = math.inf
+    else:
+        return None
+
+    t_enter = max(tx_enter, ty_enter)
+    t_exit = min(tx_exit, ty_exit)
+    if t_enter > t_exit or t_enter > 1 or t_exit < 0:
+        # The path misses the grown rectangle, or does not reach it this step
+        return None
+
+    if t_enter < 0:
+        # The ball starts inside the grown rectangle but clear of the real one,
+        # which only happens next to a corner (the closest point is that corner)
+        return sweep_circle_corner(x, y, dx, dy, radius, closest_x, closest_y)
+
+    # Where the ball center is when it reaches the grown rectangle
+    t = t_enter
+    hit_x = x + dx * t
+    hit_y = y + dy * t
+
+    if tx_enter >= ty_enter:
+        # Entered through the left or right side
+        if bottom <= hit_y <= top:
+            return t, (-1.0 if dx > 0 else 1.0), 0.0
+        corner_x = left if dx > 0 else right
+        corner_y = bottom if hit_y < bottom else top
+    else:
+        # Entered through the top or bottom side
+        if left <= hit_x <= right:
+            return t, 0.0, (-1.0 if dy > 0 else 1.0)
+        corner_x = left if hit_x < left else right
+        corner_y = bottom if dy > 0 else top
+
+    # Near a corner the grown rectangle is rounded, so test against a circle
+    return sweep_circle_corner(x, y, dx, dy, radius, corner_x, corner_y)
+
+
+def reflect(vx, vy, nx, ny):
+    """
+    Bounce a velocity off a surface with the given normal.
+
+    Args:
+        vx, vy: The velocity before the bounce
+        nx, ny: The surface normal (length 1)
+
+    Returns:
+        A tuple (vx, vy) with the velocity after the bounce
+    """
+    dot = vx * nx + vy * ny
+    return vx - 2 * dot * nx, vy - 2 * dot * ny
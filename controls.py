@@ -0,0 +1,92 @@
+"""
+Keyboard Controls for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the KeyboardInput class which keeps a table of which keys are
+held down. Pressing or releasing a key only changes an entry in the table; the
+game loop reads the table once per simulation step and the game engine moves the
+paddle with a speed and acceleration (see move_paddle in engine.py).
+
+This means the paddle speed no longer depends on how fast the operating system
+repeats a held key, a key press reaches the game within one step, and a flood of
+repeated key events can no longer slow down drawing on a slow computer.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+from functools import partial
+
+from engine import INPUT_LEFT, INPUT_RIGHT
+
+# Which INPUT_* flag each key sets while it is held
+KEY_BINDINGS = {
+    "Left": INPUT_LEFT,
+    "Right": INPUT_RIGHT,
+    "a": INPUT_LEFT,
+    "d": INPUT_RIGHT,
+}
+
+
+class KeyboardInput:
+    """
+    The KeyboardInput class tracks which keys are pressed using the screen's
+    onkeypress and onkeyrelease events.
+    """
+
+    def __init__(self, screen, bindings=KEY_BINDINGS):
+        """
+        Initialize the key table and start listening to the keyboard.
+
+        Args:
+            screen: The turtle Screen to listen on
+            bindings: A dictionary mapping key names to INPUT_* flags
+        """
+        self.bindings = bindings
+        self.pressed = dict.fromkeys(bindings, False)  # True while the key is held down
+
+        for key in bindings:
+            screen.onkeypress(partial(self.press, key), key)
+            screen.onkeyrelease(partial(self.release, key), key)
+        screen.listen()
+
+    def press(self, key):
+        """
+        Remember that a key is held down (called by the screen).
+
+        Args:
+            key: The name of the key
+        """
+        self.pressed[key] = True
+
+    def release(self, key):
+        """
+        Remember that a key was let go (called by the screen).
+
+        Args:
+            key: The name of the key
+        """
+        self.pressed[key] = False
+
+    def release_all(self):
+        """
+        Let go of every key, for example when the window loses focus and the
+        key releases would otherwise be missed.
+        """
+        for key in self.pressed:
+            self.pressed[key] = False
+
+    def inputs(self):
+        """
+        Read the keys held right now. Called once per simulation step.
+
+        Returns:
+            The INPUT_* flags of every held key combined with |
+        """
+        flags = 0
+        for key, held in self.pressed.items():
+            if held:
+                flags |= self.bindings[key]
+        return flags
@@ -0,0 +1,734 @@
+"""
+Game Engine for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file contains the game rules without any graphics. The GameState class holds
+the balls, paddle, bricks, score and lives as plain numbers, and the step() function
+advances the game by one fixed time step. Speeds are in pixels per second, so the
+game plays the same however often it is stepped. Because nothing here touches turtle
+or tkinter, the game can be simulated without a window, far faster than real time.
+
+With power-ups turned on, some destroyed bricks drop a power-up that falls towards
+the paddle: a wider paddle, a slower ball, an extra life or an extra ball. The
+wider paddle and the slower ball last EFFECT_TICKS ticks and stack when caught
+again. Their end ticks are kept in a heap, so starting an effect costs O(log n)
+and each step only looks at the effect that ends first, however many are running.
+
+The turtle classes (Ball, Paddle, BrickManager, Scoreboard) only draw this state.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import heapq
+import math
+from array import array
+from collision import sweep_circle_box, reflect
+from spatial import BrickGrid
+from gameloop import TIME_STEP
+
+# Constants for the ball
+INITIAL_MOVE_SPEED = 100  # Starting speed of the ball in pixels per second (in x and in y)
+SPEED_INCREMENT = 1.1  # How much faster the ball gets after hitting paddle
+BALL_RADIUS = 10  # Radius of the ball in pixels (the turtle circle is 20 pixels wide)
+
+# Constants for the paddle
+PADDLE_WIDTH = 5  # Width of the paddle (stretches horizontally)
+PADDLE_Y = -250  # The paddle always sits at this height
+PADDLE_HALF_WIDTH = PADDLE_WIDTH * 10  # Half the paddle width in pixels
+PADDLE_HALF_HEIGHT = 10  # Half the paddle height in pixels
+PADDLE_MAX_SPEED = 600  # Fastest paddle speed in pixels per second
+PADDLE_ACCELERATION = 4000  # How quickly the paddle speeds up while a key is held (pixels per second per second)
+PADDLE_DECELERATION = 8000  # How quickly the paddle stops once the keys are released
+SCREEN_EDGE = 350  # The right edge of the screen to prevent paddle from going off
+
+# Constants for the brick layout
+BRICK_ROWS = 5  # Number of brick rows
+BRICK_COLUMNS = 11  # Number of bricks in each row
+BRICK_START_X = -360  # x position of the first brick (left side of the screen)
+BRICK_START_Y = 250  # y position of the first row (near the top of the screen)
+BRICK_SPACING_X = 65  # Horizontal space between brick centers
+BRICK_SPACING_Y = 25  # Vertical space between rows
+BRICK_POINTS = [10, 8, 6, 4, 2]  # Points for each brick type in the standard layout (one type per row)
+BRICK_HALF_WIDTH = 30  # Half the brick width in pixels
+BRICK_HALF_HEIGHT = 10  # Half the brick height in pixels
+
+# Constants for the power-ups
+POWERUP_WIDE = 0  # Kind of power-up: a wider paddle for a while
+POWERUP_SLOW = 1  # Kind of power-up: slower balls for a while
+POWERUP_LIFE = 2  # Kind of power-up: one more life
+POWERUP_BALL = 3  # Kind of power-up: one more ball, served from the paddle
+POWERUP_KINDS = 4  # Number of kinds of power-up
+POWERUP_CHANCE = 15  # Percent of destroyed bricks that drop a power-up (when power-ups are on)
+POWERUP_SPEED = 150  # How fast a power-up falls in pixels per second
+POWERUP_HALF_WIDTH = 15  # Half the width of a falling power-up in pixels
+POWERUP_HALF_HEIGHT = 6  # Half the height of a falling power-up in pixels
+EFFECT_TICKS = 1200  # How long a wider paddle or slower ball lasts (10 seconds at 120 steps per second)
+WIDE_GROWTH = 15  # Pixels added to each side of the paddle for every wider paddle effect running
+MAX_PADDLE_HALF_WIDTH = 150  # The paddle never grows wider than this (half width in pixels)
+SLOW_FACTOR = 0.75  # Ball speed is multiplied by this for every slower ball effect running
+MIN_BALL_SPEED_SCALE = 0.4  # The balls never slow down more than this
+
+# Constants for the game rules
+STARTING_LIVES = 3  # Number of lives the player starts with
+TOP_WALL = 280  # The ball bounces down when it goes above this
+SIDE_WALL = 380  # The ball bounces sideways when it goes past this (left or right)
+BOTTOM_EDGE = -290  # The player loses a life when the ball falls below this
+MAX_BOUNCES = 8  # Most bounces worked out within a single step
+
+# Input flags passed to step() (they can be combined with |)
+INPUT_LEFT = 1  # Move the paddle left
+INPUT_RIGHT = 2  # Move the paddle right
+
+# Event flags returned by step() so the graphics know what to redraw
+EVENT_WALL = 1  # The ball bounced off a wall
+EVENT_PADDLE = 2  # The ball bounced off the paddle
+EVENT_BRICK = 4  # The ball hit a brick (destroyed bricks are listed in GameState.hit_bricks)
+EVENT_LIFE_LOST = 8  # The ball fell off the bottom of the screen
+EVENT_WIN = 16  # All bricks are destroyed
+EVENT_GAME_OVER = 32  # The player ran out of lives
+EVENT_BALL_LOST = 64  # A ball fell off the bottom (a life is only lost with the last ball)
+EVENT_POWERUP = 128  # A power-up was caught or an effect ran out (paddle width, ball speed or lives changed)
+
+
+class GameState:
+    """
+    The GameState class stores everything needed to play one game.
+    It uses __slots__ so each game is small and attribute access is fast,
+    and keeps the bricks in parallel typed arrays (columns) instead of one object
+    per brick, so each brick costs a few dozen bytes.
+    """
+
+    __slots__ = (
+        "ball_x", "ball_y", "prev_x", "prev_y", "x_move", "y_move", "serve_balls",
+        "paddle_x", "paddle_speed",
+        "brick_x", "brick_y", "brick_type", "brick_hp", "brick_points", "brick_alive",
+        "bricks_left", "brick_grid",
+        "hit_bricks", "score", "lives", "tick", "level", "game_is_on", "won",
+        "paddle_half_width", "ball_speed_scale", "powerup_chance", "random_seed",
+        "powerup_x", "powerup_y", "powerup_kind", "effect_ends", "effect_stacks",
+    )
+
+    def __init__(self, rows=BRICK_ROWS, columns=BRICK_COLUMNS, bricks=None, balls=1, powerups=False):
+        """
+        Set up a new game: ball in the center, paddle at the bottom,
+        a full wall of bricks, no points and all lives remaining.
+
+        Args:
+            rows: Number of brick rows (5 in the normal game)
+            columns: Number of bricks in each row (11 in the normal game)
+            bricks: Brick records (x, y, type, hit points, points) to use instead of
+                the standard grid, for example Level.bricks() from levels.py
+            balls: Number of balls served at the start and after each lost life
+                (1 in the normal game, more for multi-ball mode)
+            powerups: True to let destroyed bricks drop power-ups
+        """
+        # Parallel arrays describing the balls in play (index i is one ball)
+        # x_move and y_move are each ball's velocity in pixels per second
+        self.ball_x = array("d")
+        self.ball_y = array("d")
+        self.prev_x = array("d")  # Ball position before the last step (for smooth drawing)
+        self.prev_y = array("d")
+        self.x_move = array("d")
+        self.y_move = array("d")
+        self.serve_balls = balls
+
+        # The balls start in the center moving up and to the right
+        serve(self, 1.0, 1.0)
+
+        # The paddle starts at the bottom center (its y never changes), standing still
+        self.paddle_x = 0.0
+        self.paddle_speed = 0.0  # Pixels per second, negative when moving left
+
+        # Parallel arrays describing the bricks (index i is one brick)
+        self.brick_x = array("d")
+        self.brick_y = array("d")
+        self.brick_type = array("B")  # Brick type, used for the color
+        self.brick_hp = array("B")  # Hits still needed to destroy the brick
+        self.brick_points = array("H")  # Points earned for destroying the brick
+        self.brick_alive = bytearray()  # One bit per brick, set while the brick has not been destroyed
+        self.bricks_left = 0  # Counter so we never have to scan for a win
+        self.hit_bricks = []  # Indices of the bricks destroyed during the last step
+
+        # Grid index so collision checks only look at bricks near the ball
+        self.brick_grid = BrickGrid(BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y)
+        self.create_bricks(grid_layout(rows, columns) if bricks is None else bricks)
+
+        # Score, lives and game progress
+        self.score = 0
+        self.lives = STARTING_LIVES
+        self.tick = 0
+        self.level = 0  # Levels cleared so far in this game (see load_level)
+        self.game_is_on = True
+        self.won = False
+
+        # Power-ups falling towards the paddle (parallel arrays, index i is one power-up)
+        self.powerup_x = array("d")
+        self.powerup_y = array("d")
+        self.powerup_kind = array("B")  # One of the POWERUP_* kinds
+        self.powerup_chance = POWERUP_CHANCE if powerups else 0  # Percent of destroyed bricks that drop one
+        self.random_seed = 1  # Decides which bricks drop power-ups (the same every game, so replays match)
+
+        # Effects of caught power-ups that are running
+        # effect_ends is a heap of (end tick, kind) pairs, so the effect that ends first is always at index 0
+        self.effect_ends = []
+        self.effect_stacks = array("H", [0] * POWERUP_KINDS)  # Number of effects of each kind running
+        self.paddle_half_width = PADDLE_HALF_WIDTH  # Half the paddle width in pixels (wider paddle effect)
+        self.ball_speed_scale = 1.0  # Speed of every ball compared to normal (slower ball effect)
+
+    def create_bricks(self, bricks):
+        """
+        Fill the brick arrays from a sequence of brick records.
+
+        Args:
+            bricks: Records (x, y, type, hit points, points), one per brick
+        """
+        for x_pos, y_pos, brick_type, hp, points in bricks:
+            self.brick_x.append(x_pos)
+            self.brick_y.append(y_pos)
+            self.brick_type.append(brick_type)
+            self.brick_hp.append(hp)
+            self.brick_points.append(points)
+
+        # Every brick starts alive: set all bits, then clear the unused bits of the last byte
+        count = len(self.brick_x)
+        self.brick_alive = bytearray(b"\xff" * ((count + 7) // 8))
+        if count % 8:
+            self.brick_alive[-1] = (1 << (count % 8)) - 1
+        self.bricks_left = count
+        self.brick_grid.build(self.brick_x, self.brick_y)
+
+    def copy(self):
+        """
+        Make an independent copy of the game (used for replay checkpoints).
+
+        Returns:
+            A new GameState with the same values
+        """
+        other = GameState.__new__(GameState)
+        for name in GameState.__slots__:
+            value = getattr(self, name)
+            # The brick grid never changes during a level (a new level gets a new grid), so both copies share it
+            if isinstance(value, array):
+                value = value[:]
+            elif isinstance(value, (list, bytearray)):
+                value = value.copy()
+            setattr(other, name, value)
+        return other
+
+
+def load_level(state, bricks):
+    """
+    Start the next level of a game whose bricks were all destroyed.
+    The score and lives carry over; the bricks are replaced, the paddle goes back
+    to the center and the balls are served again.
+
+    Args:
+        state: The GameState to continue
+        bricks: Brick records (x, y, type, hit points, points) of the new level
+    """
+    # Empty the brick columns in place and build a new grid (copies may share the old one)
+    for column in (state.brick_x, state.brick_y, state.brick_type, state.brick_hp, state.brick_points):
+        del column[:]
+    state.brick_grid = BrickGrid(BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y)
+    state.create_bricks(bricks)
+    state.hit_bricks.clear()
+
+    # Power-ups still falling are gone; effects that are running carry over
+    for column in (state.powerup_x, state.powerup_y, state.powerup_kind):
+        del column[:]
+
+    # Serve again from the center with the paddle standing still in the middle
+    for column in (state.ball_x, state.ball_y, state.prev_x, state.prev_y, state.x_move, state.y_move):
+        del column[:]
+    serve(state, 1.0, 1.0)
+    state.paddle_x = 0.0
+    state.paddle_speed = 0.0
+
+    state.level += 1
+    state.won = False
+    state.game_is_on = True
+
+
+def grid_layout(rows=BRICK_ROWS, columns=BRICK_COLUMNS):
+    """
+    Make the records of the standard brick wall (5 rows and 11 columns normally).
+    The top row is type 0 (worth the most points); rows past the last brick
+    type reuse the last type. Every brick breaks with one hit.
+
+    Args:
+        rows: Number of brick rows
+        columns: Number of bricks in each row
+
+    Returns:
+        A list of records (x, y, type, hit points, points), row by row
+    """
+    bricks = []
+    for row in range(rows):
+        brick_type = min(row, len(BRICK_POINTS) - 1)
+        for col in range(columns):
+            x_pos = BRICK_START_X + col * BRICK_SPACING_X
+            y_pos = BRICK_START_Y - row * BRICK_SPACING_Y
+            bricks.append((x_pos, y_pos, brick_type, 1, BRICK_POINTS[brick_type]))
+    return bricks
+
+
+def serve(state, x_sign, y_sign):
+    """
+    Put state.serve_balls new balls in the center at the starting speed.
+    The first ball moves diagonally; the others fan out at steeper angles.
+
+    Args:
+        state: The GameState to serve in (it should have no balls in play)
+        x_sign: 1 to send the balls right, -1 to send them left
+        y_sign: 1 to send the balls up, -1 to send them down
+    """
+    count = state.serve_balls
+    for ball in range(count):
+        add_ball(state, 0.0, 0.0,
+                 math.copysign(INITIAL_MOVE_SPEED * (1 - ball / count), x_sign),
+                 math.copysign(INITIAL_MOVE_SPEED, y_sign))
+
+
+def add_ball(state, x, y, x_move, y_move):
+    """
+    Put a new ball into play.
+
+    Args:
+        state: The GameState to add the ball to
+        x, y: Position of the ball
+        x_move, y_move: Velocity of the ball in pixels per second
+    """
+    state.ball_x.append(x)
+    state.ball_y.append(y)
+    state.prev_x.append(x)
+    state.prev_y.append(y)
+    state.x_move.append(x_move)
+    state.y_move.append(y_move)
+
+
+def remove_ball(state, index):
+    """
+    Take a ball out of play. The last ball is moved into its place, so this takes
+    the same time however many balls there are.
+
+    Args:
+        state: The GameState holding the ball
+        index: The index of the ball
+    """
+    for column in (state.ball_x, state.ball_y, state.prev_x, state.prev_y, state.x_move, state.y_move):
+        column[index] = column[-1]
+        del column[-1]
+
+
+def drop_powerup(state, index):
+    """
+    Maybe drop a power-up where a brick was destroyed.
+    POWERUP_CHANCE percent of bricks drop one, of a random kind. The random numbers
+    come from the game state, so a replayed game drops the same power-ups.
+
+    Args:
+        state: The GameState holding the brick
+        index: The index of the destroyed brick
+    """
+    # A small linear congruential generator: the same seed always gives the same numbers
+    state.random_seed = (state.random_seed * 1103515245 + 12345) & 0x7FFFFFFF
+    roll = state.random_seed >> 16  # The high bits are the most random ones
+    if roll % 100 < state.powerup_chance:
+        state.powerup_x.append(state.brick_x[index])
+        state.powerup_y.append(state.brick_y[index])
+        state.powerup_kind.append(roll // 100 % POWERUP_KINDS)
+
+
+def remove_powerup(state, index):
+    """
+    Take a falling power-up out of play. The last one is moved into its place,
+    so this takes the same time however many are falling.
+
+    Args:
+        state: The GameState holding the power-up
+        index: The index of the power-up
+    """
+    for column in (state.powerup_x, state.powerup_y, state.powerup_kind):
+        column[index] = column[-1]
+        del column[-1]
+
+
+def move_powerups(state, dt):
+    """
+    Move the falling power-ups down for one time step. A power-up that touches
+    the paddle is caught and its effect starts; one that falls off the bottom is gone.
+
+    Args:
+        state: The GameState to update
+        dt: Length of the step in seconds
+
+    Returns:
+        EVENT_POWERUP if a power-up was caught, otherwise 0
+    """
+    events = 0
+    fall = POWERUP_SPEED * dt
+    reach = state.paddle_half_width + POWERUP_HALF_WIDTH
+    powerup_x = state.powerup_x
+    powerup_y = state.powerup_y
+
+    # Go from last to first, so removing one (the last moves into its place) skips none
+    for index in range(len(powerup_x) - 1, -1, -1):
+        y = powerup_y[index] - fall
+        powerup_y[index] = y
+        if (y - POWERUP_HALF_HEIGHT <= PADDLE_Y + PADDLE_HALF_HEIGHT
+                and y + POWERUP_HALF_HEIGHT >= PADDLE_Y - PADDLE_HALF_HEIGHT
+                and abs(powerup_x[index] - state.paddle_x) <= reach):
+            start_effect(state, state.powerup_kind[index])
+            remove_powerup(state, index)
+            events |= EVENT_POWERUP
+        elif y < BOTTOM_EDGE:
+            remove_powerup(state, index)
+    return events
+
+
+def start_effect(state, kind):
+    """
+    Start the effect of a caught power-up.
+    An extra life or an extra ball happens straight away. A wider paddle or slower
+    ball lasts EFFECT_TICKS ticks; catching another one while it runs adds to the
+    effect, and every one caught runs out on its own, so the effect keeps going
+    until the last one caught has run out. Adding the end tick to the heap costs O(log n).
+
+    Args:
+        state: The GameState to change
+        kind: One of the POWERUP_* kinds
+    """
+    if kind == POWERUP_LIFE:
+        state.lives += 1
+    elif kind == POWERUP_BALL:
+        # Serve the new ball from just above the paddle, moving up
+        add_ball(state, state.paddle_x, PADDLE_Y + PADDLE_HALF_HEIGHT + BALL_RADIUS + 1,
+                 INITIAL_MOVE_SPEED, INITIAL_MOVE_SPEED)
+    else:
+        heapq.heappush(state.effect_ends, (state.tick + EFFECT_TICKS, kind))
+        state.effect_stacks[kind] += 1
+        apply_effects(state)
+
+
+def end_effects(state):
+    """
+    End the effects whose time is up. Only the effect that ends first is looked at
+    (the top of the heap), so a step with no effect ending costs the same however
+    many effects are running.
+
+    Args:
+        state: The GameState to update
+
+    Returns:
+        EVENT_POWERUP if an effect ended, otherwise 0
+    """
+    effect_ends = state.effect_ends
+    if not effect_ends or effect_ends[0][0] > state.tick:
+        return 0
+    while effect_ends and effect_ends[0][0] <= state.tick:
+        _, kind = heapq.heappop(effect_ends)
+        state.effect_stacks[kind] -= 1
+    apply_effects(state)
+    return EVENT_POWERUP
+
+
+def apply_effects(state):
+    """
+    Work out the paddle width and ball speed from the number of effects running.
+
+    Args:
+        state: The GameState to update
+    """
+    stacks = state.effect_stacks
+    state.paddle_half_width = min(PADDLE_HALF_WIDTH + WIDE_GROWTH * stacks[POWERUP_WIDE], MAX_PADDLE_HALF_WIDTH)
+    state.ball_speed_scale = max(SLOW_FACTOR ** stacks[POWERUP_SLOW], MIN_BALL_SPEED_SCALE)
+
+
+def brick_is_alive(state, index):
+    """
+    Check if a brick has not been destroyed yet.
+
+    Args:
+        state: The GameState holding the brick
+        index: The index of the brick
+
+    Returns:
+        True if the brick is still alive, False otherwise
+    """
+    return bool(state.brick_alive[index >> 3] & (1 << (index & 7)))
+
+
+def move_paddle(state, inputs, dt):
+    """
+    Move the paddle for one time step, staying inside the screen.
+    While a direction key is held the paddle speeds up towards PADDLE_MAX_SPEED in
+    that direction; with no key (or both keys) held it slows down to a stop.
+
+    Args:
+        state: The GameState to update
+        inputs: INPUT_LEFT and/or INPUT_RIGHT flags held during this step
+        dt: Length of the step in seconds
+    """
+    direction = (1 if inputs & INPUT_RIGHT else 0) - (1 if inputs & INPUT_LEFT else 0)
+    if direction:
+        target = direction * PADDLE_MAX_SPEED
+        change = PADDLE_ACCELERATION * dt
+    else:
+        target = 0.0
+        change = PADDLE_DECELERATION * dt
+
+    # Move the speed towards the target speed, without overshooting it
+    speed = state.paddle_speed
+    if speed < target:
+        speed = min(speed + change, target)
+    else:
+        speed = max(speed - change, target)
+
+    # Stop at the edge of the screen
+    # We use half the paddle width (in pixels) to account for paddle size
+    new_x = state.paddle_x + speed * dt
+    limit = SCREEN_EDGE - state.paddle_half_width
+    if new_x > limit or new_x < -limit:
+        new_x = math.copysign(limit, new_x)
+        speed = 0.0
+
+    state.paddle_x = new_x
+    state.paddle_speed = speed
+
+
+def find_brick_hit(state, x, y, dx, dy):
+    """
+    Find the first brick a ball at (x, y) would touch while moving by (dx, dy).
+    Only bricks in the grid cells along the ball's path that are still alive are checked. If several
+    bricks are touched at the same moment, the one created first wins.
+
+    Args:
+        state: The GameState to check
+        x, y: Position of the ball
+        dx, dy: How far the ball moves
+
+    Returns:
+        A tuple (t, index, normal_x, normal_y) where t is the fraction of the move,
+        or None if the ball does not touch any brick
+    """
+    brick_x = state.brick_x
+    brick_y = state.brick_y
+    alive = state.brick_alive
+
+    # Any brick we could touch has its center within this distance of the path
+    reach_x = BALL_RADIUS + BRICK_HALF_WIDTH
+    reach_y = BALL_RADIUS + BRICK_HALF_HEIGHT
+    candidates = state.brick_grid.query_box(min(x, x + dx) - reach_x, min(y, y + dy) - reach_y,
+                                            max(x, x + dx) + reach_x, max(y, y + dy) + reach_y)
+
+    best = None
+    for i in candidates:
+        if not alive[i >> 3] & (1 << (i & 7)):
+            continue
+        bx = brick_x[i]
+        by = brick_y[i]
+        hit = sweep_circle_box(x, y, dx, dy, BALL_RADIUS,
+                               bx - BRICK_HALF_WIDTH, by - BRICK_HALF_HEIGHT,
+                               bx + BRICK_HALF_WIDTH, by + BRICK_HALF_HEIGHT)
+        if hit is not None and (best is None or hit[0] < best[0] or (hit[0] == best[0] and i < best[1])):
+            best = (hit[0], i, hit[1], hit[2])
+    return best
+
+
+def destroy_brick(state, index):
+    """
+    Destroy a brick and return its points.
+
+    Args:
+        state: The GameState holding the brick
+        index: The index of the brick
+
+    Returns:
+        The point value of the destroyed brick
+    """
+    # Clear the brick's alive bit (collision checks skip bricks whose bit is clear)
+    state.brick_alive[index >> 3] &= ~(1 << (index & 7))
+    state.bricks_left -= 1
+    state.hit_bricks.append(index)
+    return state.brick_points[index]
+
+
+def step(state, inputs=0, dt=TIME_STEP):
+    """
+    Advance the game by one time step.
+    Each ball follows its whole path for the step: whenever it would touch a wall,
+    the paddle or a brick, it is moved to the exact point of contact, bounces, and
+    carries on for the rest of the step. This means large steps give the same
+    result as many small ones and a fast ball cannot pass through anything.
+
+    Args:
+        state: The GameState to advance
+        inputs: INPUT_LEFT and/or INPUT_RIGHT flags (the keys held during this step)
+        dt: Length of the step in seconds
+
+    Returns:
+        A combination of EVENT_* flags describing what happened this step
+    """
+    if not state.game_is_on:
+        return 0
+
+    # A level without any bricks is cleared straight away (it could never be won otherwise)
+    if state.bricks_left == 0:
+        state.won = True
+        state.game_is_on = False
+        return EVENT_WIN
+
+    events = 0
+    state.tick += 1
+    state.hit_bricks.clear()
+
+    # End the power-up effects whose time is up
+    if state.effect_ends:
+        events |= end_effects(state)
+
+    # Apply the player's input before moving the balls
+    move_paddle(state, inputs, dt)
+
+    # Move the falling power-ups (the paddle may catch some)
+    if state.powerup_x:
+        events |= move_powerups(state, dt)
+
+    # Move the balls from last to first, so a lost ball can be replaced by the
+    # last ball (which has already moved) without skipping any
+    for ball in range(len(state.ball_x) - 1, -1, -1):
+        ball_events = move_ball(state, ball, dt)
+        events |= ball_events
+        if not state.game_is_on:
+            return events
+
+        if ball_events & EVENT_BALL_LOST:
+            x_move = state.x_move[ball]
+            y_move = state.y_move[ball]
+            remove_ball(state, ball)
+            if len(state.ball_x) == 0:
+                # The last ball is gone: lose a life and serve again from the center,
+                # reset to the starting speed and sent the other way
+                events |= EVENT_LIFE_LOST
+                state.lives -= 1
+                serve(state, x_move, -y_move)
+
+                # Check if player has run out of lives
+                if state.lives <= 0:
+                    state.game_is_on = False
+                    events |= EVENT_GAME_OVER
+                return events
+
+    return events
+
+
+def move_ball(state, ball, dt):
+    """
+    Move one ball for one time step, bouncing it off everything it touches.
+    A ball that falls off the bottom stops there and is removed by step().
+
+    Args:
+        state: The GameState holding the ball
+        ball: The index of the ball
+        dt: Length of the step in seconds
+
+    Returns:
+        A combination of EVENT_* flags describing what happened to this ball
+    """
+    events = 0
+    x = state.ball_x[ball]
+    y = state.ball_y[ball]
+    x_move = state.x_move[ball]
+    y_move = state.y_move[ball]
+
+    # Remember where the ball started (for smooth drawing)
+    state.prev_x[ball] = x
+    state.prev_y[ball] = y
+
+    # The slower ball effect makes the ball cover less of its path in each step
+    time_left = dt * state.ball_speed_scale
+    for _ in range(MAX_BOUNCES):
+        dx = x_move * time_left
+        dy = y_move * time_left
+
+        # Find the first thing the ball touches along its path
+        # first_t is the fraction of the remaining path (1 = nothing touched)
+        first_t = 1.0
+        first_hit = 0
+        normal_x = normal_y = 0.0
+        brick = -1
+
+        # The ball center bounces off the top wall and the left and right walls
+        if dy > 0 and y + dy > TOP_WALL:
+            first_t, first_hit, normal_x, normal_y = max((TOP_WALL - y) / dy, 0.0), EVENT_WALL, 0.0, -1.0
+        if dx > 0 and x + dx > SIDE_WALL:
+            t = max((SIDE_WALL - x) / dx, 0.0)
+            if t < first_t:
+                first_t, first_hit, normal_x, normal_y = t, EVENT_WALL, -1.0, 0.0
+        elif dx < 0 and x + dx < -SIDE_WALL:
+            t = max((-SIDE_WALL - x) / dx, 0.0)
+            if t < first_t:
+                first_t, first_hit, normal_x, normal_y = t, EVENT_WALL, 1.0, 0.0
+
+        # Check if ball hits the paddle
+        hit = sweep_circle_box(x, y, dx, dy, BALL_RADIUS,
+                               state.paddle_x - state.paddle_half_width, PADDLE_Y - PADDLE_HALF_HEIGHT,
+                               state.paddle_x + state.paddle_half_width, PADDLE_Y + PADDLE_HALF_HEIGHT)
+        if hit is not None and hit[0] < first_t:
+            first_t, normal_x, normal_y = hit
+            first_hit = EVENT_PADDLE
+
+        # Check if ball hits any bricks
+        hit = find_brick_hit(state, x, y, dx, dy)
+        if hit is not None and hit[0] < first_t:
+            first_t, brick, normal_x, normal_y = hit
+            first_hit = EVENT_BRICK
+
+        # Check if ball falls off the bottom of the screen
+        if dy < 0 and y + dy < BOTTOM_EDGE:
+            t = max((BOTTOM_EDGE - y) / dy, 0.0)
+            if t < first_t:
+                first_t = t
+                first_hit = EVENT_BALL_LOST
+
+        # Move the ball up to the point of contact (or to the end of the step)
+        x += dx * first_t
+        y += dy * first_t
+        if not first_hit:
+            break
+        time_left *= 1.0 - first_t
+        events |= first_hit
+
+        if first_hit == EVENT_BALL_LOST:
+            break
+
+        # Bounce off whatever the ball touched
+        x_move, y_move = reflect(x_move, y_move, normal_x, normal_y)
+
+        if first_hit == EVENT_PADDLE:
+            # Make the game harder by speeding up the ball
+            x_move *= SPEED_INCREMENT
+            y_move *= SPEED_INCREMENT
+        elif first_hit == EVENT_BRICK:
+            # Tougher bricks need several hits before they break
+            state.brick_hp[brick] -= 1
+            if state.brick_hp[brick] > 0:
+                continue
+            state.score += destroy_brick(state, brick)
+            if state.powerup_chance:
+                drop_powerup(state, brick)
+
+            # Check if all bricks are destroyed (player wins)
+            if state.bricks_left == 0:
+                state.won = True
+                state.game_is_on = False
+                events |= EVENT_WIN
+                break
+
+    state.ball_x[ball] = x
+    state.ball_y[ball] = y
+    state.x_move[ball] = x_move
+    state.y_move[ball] = y_move
+    return events
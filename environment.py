@@ -0,0 +1,413 @@
+"""
+Training Environments for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file lets learning agents play the game without a window, through a
+reset/step interface:
+- Environment is one game. step(action) holds a paddle key for a few ticks
+  (the frame skip) and writes down what the agent sees, the points scored and
+  whether the game is over.
+- VectorEnv runs many games at once, shared out over worker processes.
+
+What the agent sees (the observation) is kept in a block of shared memory with
+a fixed layout: the ball's position and velocity, the paddle position, one
+alive flag for each brick, the score and the lives, for every game. The worker
+processes write straight into the block, and the agent reads it through NumPy
+arrays that look at the same memory, so nothing is copied or pickled between
+processes. The actions travel the same way; the only messages sent to the
+workers are the word "step" and a short reply.
+
+Observations are views: the next step() changes them in place, so copy them
+(np.copy) if you need to keep them.
+
+Try it with random actions (prints steps per second):
+    python environment.py --envs 64 --workers 4 --steps 2000
+
+It requires NumPy (pip install numpy).
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import multiprocessing
+import random
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from engine import GameState, step, serve, BRICK_ROWS, BRICK_COLUMNS, INPUT_LEFT, INPUT_RIGHT
+
+# The actions an agent can take (the paddle keys held during a step)
+ACTION_STAY = 0
+ACTION_LEFT = INPUT_LEFT
+ACTION_RIGHT = INPUT_RIGHT
+ACTIONS = [ACTION_STAY, ACTION_LEFT, ACTION_RIGHT]
+
+# Constants for the environments
+DEFAULT_FRAME_SKIP = 4  # Ticks each action is held for
+ALIGNMENT = 8  # Every array in the shared block starts on a multiple of 8 bytes
+
+
+class ObservationLayout:
+    """
+    The ObservationLayout class works out where each array lives inside the
+    shared memory block. Index i of every array belongs to game i.
+    """
+
+    def __init__(self, envs, bricks):
+        """
+        Work out the layout for a number of games.
+
+        Args:
+            envs: Number of games
+            bricks: Number of bricks in each game
+        """
+        self.envs = envs
+        self.bricks = bricks
+        # (name, type, shape of one game's entry)
+        self.fields = [
+            ("ball", np.float64, (4,)),  # x, y, x velocity, y velocity of the first ball in play
+            ("paddle_x", np.float64, ()),
+            ("bricks", np.uint8, (bricks,)),  # 1 while the brick is alive, 0 once destroyed
+            ("score", np.int32, ()),
+            ("lives", np.int32, ()),
+            ("reward", np.float64, ()),  # Points scored during the last step
+            ("done", np.bool_, ()),  # True once the game is over (won or lost)
+            ("actions", np.uint8, ()),  # The action of the next step, written by the agent
+        ]
+        self.offsets = {}
+        size = 0
+        for name, dtype, shape in self.fields:
+            size = -(-size // ALIGNMENT) * ALIGNMENT
+            self.offsets[name] = size
+            size += int(np.dtype(dtype).itemsize * envs * np.prod(shape, dtype=np.int64))
+        self.size = max(size, 1)
+
+    def views(self, buffer):
+        """
+        Make NumPy arrays that look straight at the memory of a block.
+
+        Args:
+            buffer: The block's memory (SharedMemory.buf)
+
+        Returns:
+            A dictionary mapping each field name to its array
+        """
+        return {name: np.ndarray((self.envs,) + shape, dtype=dtype, buffer=buffer, offset=self.offsets[name])
+                for name, dtype, shape in self.fields}
+
+
+class Environment:
+    """
+    The Environment class is one headless game driven by actions.
+    It writes its observation into row `index` of a set of arrays (see ObservationLayout).
+    """
+
+    def __init__(self, views, index, frame_skip=DEFAULT_FRAME_SKIP,
+                 rows=BRICK_ROWS, columns=BRICK_COLUMNS, balls=1):
+        """
+        Initialize the environment. Call reset() before the first step().
+
+        Args:
+            views: The dictionary of arrays from ObservationLayout.views()
+            index: Which row of the arrays belongs to this game
+            frame_skip: Ticks each action is held for
+            rows, columns: Size of the brick wall
+            balls: Balls served at the start and after each lost life
+        """
+        self.views = views
+        self.index = index
+        self.frame_skip = frame_skip
+        self.rows = rows
+        self.columns = columns
+        self.balls = balls
+        self.state = None
+
+    def reset(self, seed=None):
+        """
+        Start a new game.
+
+        Args:
+            seed: If given, the first serve goes left or right at random using this seed
+                  (otherwise every game starts the same way, like the normal game)
+        """
+        self.state = state = GameState(self.rows, self.columns, balls=self.balls)
+        if seed is not None:
+            for column in (state.ball_x, state.ball_y, state.prev_x, state.prev_y, state.x_move, state.y_move):
+                del column[:]
+            serve(state, random.Random(seed).choice((-1.0, 1.0)), 1.0)
+
+        views = self.views
+        index = self.index
+        bricks = views["bricks"][index]
+        bricks[:len(state.brick_x)] = 1
+        bricks[len(state.brick_x):] = 0
+        views["reward"][index] = 0.0
+        views["done"][index] = False
+        self.observe()
+
+    def step(self, action):
+        """
+        Hold a paddle key for frame_skip ticks (less if the game ends first).
+
+        Args:
+            action: One of the ACTIONS
+        """
+        state = self.state
+        bricks = self.views["bricks"][self.index]
+        score = state.score
+        for _ in range(self.frame_skip):
+            step(state, action)
+            for brick in state.hit_bricks:
+                bricks[brick] = 0
+            if not state.game_is_on:
+                break
+        self.views["reward"][self.index] = state.score - score
+        self.views["done"][self.index] = not state.game_is_on
+        self.observe()
+
+    def observe(self):
+        """
+        Write the ball, paddle, score and lives into this game's row of the arrays.
+        """
+        state = self.state
+        views = self.views
+        index = self.index
+        if len(state.ball_x):
+            views["ball"][index] = (state.ball_x[0], state.ball_y[0], state.x_move[0], state.y_move[0])
+        views["paddle_x"][index] = state.paddle_x
+        views["score"][index] = state.score
+        views["lives"][index] = state.lives
+
+
+def step_envs(envs, views, auto_reset):
+    """
+    Step a group of environments with the actions in the shared arrays.
+
+    Args:
+        envs: The Environments to step
+        views: The dictionary of shared arrays
+        auto_reset: Start a new game first in every environment whose game is over
+            (if False, finished environments are left as they are, with reward 0)
+    """
+    actions = views["actions"]
+    done = views["done"]
+    rewards = views["reward"]
+    for env in envs:
+        if done[env.index]:
+            if not auto_reset:
+                # The game is still over, so this step earned nothing (done stays set)
+                rewards[env.index] = 0
+                continue
+            env.reset()
+        env.step(int(actions[env.index]))
+
+
+def worker_main(name, envs, bricks, first, last, frame_skip, rows, columns, balls, auto_reset, connection):
+    """
+    Run a group of environments in a worker process until told to stop.
+    Commands come through the connection; all data goes through the shared block.
+
+    Args:
+        name: Name of the shared memory block
+        envs: Number of environments in the whole block
+        bricks: Number of bricks in each game
+        first, last: The range of environments this worker runs (last not included)
+        frame_skip, rows, columns, balls: Settings of the environments
+        auto_reset: Start a new game when stepping a finished one
+        connection: The worker's end of a Pipe
+    """
+    block = SharedMemory(name=name)
+    views = ObservationLayout(envs, bricks).views(block.buf)
+    group = [Environment(views, index, frame_skip, rows, columns, balls) for index in range(first, last)]
+    try:
+        while True:
+            command, argument = connection.recv()
+            if command == "step":
+                step_envs(group, views, auto_reset)
+            elif command == "reset":
+                for env in group:
+                    env.reset(None if argument is None else argument + env.index)
+            elif command == "close":
+                break
+            connection.send(True)
+    finally:
+        del views, group  # The arrays must let go of the memory before it is closed
+        block.close()
+
+
+class VectorEnv:
+    """
+    The VectorEnv class runs many environments side by side, on worker processes
+    that share one block of memory with the agent.
+    """
+
+    def __init__(self, envs, workers=None, frame_skip=DEFAULT_FRAME_SKIP,
+                 rows=BRICK_ROWS, columns=BRICK_COLUMNS, balls=1, auto_reset=True):
+        """
+        Create the shared block and start the workers.
+
+        Args:
+            envs: Number of environments
+            workers: Number of worker processes (all CPU cores if None, 0 to run
+                everything in this process)
+            frame_skip: Ticks each action is held for
+            rows, columns: Size of the brick wall
+            balls: Balls served at the start and after each lost life
+            auto_reset: Start a new game when a finished one is stepped (if False,
+                a finished one stays done and its reward is 0)
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        workers = min(workers, envs)
+        self.layout = ObservationLayout(envs, rows * columns)
+        self.block = SharedMemory(create=True, size=self.layout.size)
+        views = self.layout.views(self.block.buf)
+        self.views = views
+        self.auto_reset = auto_reset
+
+        # The arrays the agent reads (and writes the actions into)
+        self.ball = views["ball"]
+        self.paddle_x = views["paddle_x"]
+        self.bricks = views["bricks"]
+        self.score = views["score"]
+        self.lives = views["lives"]
+        self.rewards = views["reward"]
+        self.dones = views["done"]
+        self.actions = views["actions"]
+
+        self.envs = []  # The environments run in this process (only with workers=0)
+        self.connections = []
+        self.processes = []
+        if workers == 0:
+            self.envs = [Environment(views, index, frame_skip, rows, columns, balls) for index in range(envs)]
+            return
+
+        # Give each worker a run of neighbouring environments
+        for worker in range(workers):
+            first = worker * envs // workers
+            last = (worker + 1) * envs // workers
+            ours, theirs = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=worker_main, daemon=True,
+                args=(self.block.name, envs, self.layout.bricks, first, last,
+                      frame_skip, rows, columns, balls, auto_reset, theirs))
+            process.start()
+            self.connections.append(ours)
+            self.processes.append(process)
+
+    def observations(self):
+        """
+        Returns:
+            A dictionary of the observation arrays (views of the shared block)
+        """
+        return {"ball": self.ball, "paddle_x": self.paddle_x, "bricks": self.bricks,
+                "score": self.score, "lives": self.lives}
+
+    def command(self, command, argument=None):
+        """
+        Send a command to every worker and wait until all of them are done.
+        """
+        for connection in self.connections:
+            connection.send((command, argument))
+        for connection in self.connections:
+            connection.recv()
+
+    def reset(self, seed=None):
+        """
+        Start a new game in every environment.
+
+        Args:
+            seed: If given, environment i uses seed + i for its first serve
+
+        Returns:
+            The observation arrays
+        """
+        if self.envs:
+            for env in self.envs:
+                env.reset(None if seed is None else seed + env.index)
+        else:
+            self.command("reset", seed)
+        return self.observations()
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+        With auto_reset, a game that was over is started again first.
+
+        Args:
+            actions: One of the ACTIONS for each environment (a sequence or array)
+
+        Returns:
+            A tuple (observations, rewards, dones) of views of the shared block
+        """
+        self.actions[:] = actions
+        if self.envs:
+            step_envs(self.envs, self.views, self.auto_reset)
+        else:
+            self.command("step")
+        return self.observations(), self.rewards, self.dones
+
+    def close(self):
+        """
+        Stop the workers and free the shared block.
+        """
+        if self.connections:
+            for connection in self.connections:
+                connection.send(("close", None))
+            for process in self.processes:
+                process.join()
+            self.connections = []
+        self.views = self.ball = self.paddle_x = self.bricks = None
+        self.score = self.lives = self.rewards = self.dones = self.actions = None
+        self.envs = []
+        try:
+            self.block.close()
+        except BufferError:
+            pass  # The agent still holds some of the arrays; the memory is freed when they are gone
+        self.block.unlink()
+
+    def __enter__(self):
+        """
+        Use the environments in a with statement (they are closed at the end).
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the environments at the end of a with statement.
+        """
+        self.close()
+
+
+def main():
+    """
+    Time the environments with random actions from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Run BreakOut training environments with random actions.")
+    parser.add_argument("--envs", type=int, default=64, help="number of environments")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all CPU cores, 0 = none)")
+    parser.add_argument("--steps", type=int, default=1000, help="number of steps to run")
+    parser.add_argument("--frame-skip", type=int, default=DEFAULT_FRAME_SKIP, help="ticks each action is held for")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with VectorEnv(args.envs, args.workers, args.frame_skip) as env:
+        env.reset(seed=0)
+        games = 0
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            _, _, dones = env.step(rng.integers(0, len(ACTIONS), args.envs).choose(ACTIONS))
+            games += int(dones.sum())
+        elapsed = time.perf_counter() - start
+    steps = args.steps * args.envs
+    print(f"{steps} steps ({steps * args.frame_skip} ticks) in {elapsed:.2f} s: "
+          f"{steps / elapsed:.0f} steps/s, {games} games finished")
+
+
+if __name__ == "__main__":
+    main()
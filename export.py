@@ -0,0 +1,354 @@
+"""
+Picture and Clip Export for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file turns games into pictures without a window: single PNG thumbnails,
+numbered PNG frames, or an animated GIF clip. The frames are drawn by the
+Rasterizer (see rasterizer.py) and the files are written by hand with zlib and
+struct, so nothing beyond NumPy needs to be installed and no display server is
+needed.
+
+The game can come from a recording made with main.py --record, or be played by
+the bot (see autoplayer.py):
+    python export.py game.rec --thumbnail thumb.png --at 3000
+    python export.py game.rec --gif clip.gif --start 1200 --end 2400
+    python export.py game.rec --frames frames --fps 10
+    python export.py --autoplay --end 6000 --gif bot.gif --shrink 2
+
+GIF frames only store the box of pixels that changed since the previous frame,
+and a frame where nothing changed just makes the previous one stay longer, so
+clips stay small and are quick to write.
+
+It requires NumPy (pip install numpy).
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from engine import GameState, step, TIME_STEP
+from rasterizer import Rasterizer, COLORS
+
+# Constants for exporting
+DEFAULT_FPS = 25  # Frames per second of clips and frame sequences
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"  # First bytes of every PNG file
+GIF_COLOR_BITS = 4  # The GIF palette has 2 ** 4 = 16 entries
+MAX_LZW_CODE = 4095  # GIF's LZW codes are at most 12 bits
+
+
+def write_png(path, pixels):
+    """
+    Save an RGB picture as a PNG file.
+
+    Args:
+        path: The file to write
+        pixels: A NumPy uint8 array of shape (height, width, 3)
+    """
+    height, width, _ = pixels.shape
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    # Every row starts with a 0 byte (no filter)
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+    with open(path, "wb") as file:
+        file.write(PNG_SIGNATURE)
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))  # 8-bit RGB
+        file.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        file.write(chunk(b"IEND", b""))
+
+
+def lzw_encode(indices, code_size):
+    """
+    Compress palette indices with the variable-width LZW used by GIF files.
+
+    Args:
+        indices: The palette index of each pixel, as bytes
+        code_size: Bits per palette index (at least 2)
+
+    Returns:
+        The compressed codes packed into bytes (lowest bit first)
+    """
+    clear = 1 << code_size
+    end = clear + 1
+    output = bytearray()
+    bits = 0  # Bits waiting to be written, lowest first
+    bit_count = 0
+
+    def emit(code, width):
+        nonlocal bits, bit_count
+        bits |= code << bit_count
+        bit_count += width
+        while bit_count >= 8:
+            output.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+
+    width = code_size + 1
+    table = {}  # (code of a run of pixels << 8 | next pixel) -> code of the longer run
+    next_code = end + 1
+    emit(clear, width)
+    prefix = indices[0]
+    for pixel in indices[1:]:
+        key = prefix << 8 | pixel
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix, width)
+        if next_code >= (1 << width) and width < 12:
+            width += 1
+        if next_code < MAX_LZW_CODE:
+            table[key] = next_code
+            next_code += 1
+        else:
+            # The table is full: start a new one
+            emit(clear, width)
+            table.clear()
+            next_code = end + 1
+            width = code_size + 1
+        prefix = pixel
+    emit(prefix, width)
+    if next_code >= (1 << width) and width < 12:
+        width += 1
+    emit(end, width)
+    if bit_count:
+        output.append(bits & 0xFF)
+    return bytes(output)
+
+
+class GifWriter:
+    """
+    The GifWriter class writes an animated GIF one frame at a time.
+    Every color the game uses is in one shared palette, and each frame only
+    stores the box of pixels that changed since the frame before.
+    """
+
+    def __init__(self, path, width, height, delay):
+        """
+        Start a GIF file.
+
+        Args:
+            path: The file to write
+            width, height: Size of the frames in pixels
+            delay: How long each frame is shown, in hundredths of a second
+        """
+        self.file = open(path, "wb")
+        self.width = width
+        self.height = height
+        self.delay = delay
+        self.previous = None  # Palette indices of the last frame added
+        self.pending = None  # The last frame's (box, indices, delay), written once the next frame is known
+
+        # Palette: the game's colors, padded to 16 entries
+        colors = list(COLORS.values())
+        colors += [(0, 0, 0)] * ((1 << GIF_COLOR_BITS) - len(colors))
+        keys = np.array([r << 16 | g << 8 | b for r, g, b in colors[:len(COLORS)]], dtype=np.int32)
+        self.palette_order = np.argsort(keys)
+        self.palette_keys = keys[self.palette_order]
+
+        self.file.write(b"GIF89a")
+        # Screen size, global palette of 2 ** GIF_COLOR_BITS colors, background color 0
+        self.file.write(struct.pack("<HHBBB", width, height, 0xF0 | (GIF_COLOR_BITS - 1), 0, 0))
+        self.file.write(bytes(channel for color in colors for channel in color))
+        # Play the clip over and over
+        self.file.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def indices(self, pixels):
+        """
+        Turn RGB pixels into palette indices (every pixel must be one of the game's colors).
+
+        Args:
+            pixels: A NumPy uint8 array of shape (height, width, 3)
+
+        Returns:
+            A NumPy uint8 array of shape (height, width)
+        """
+        keys = (pixels[:, :, 0].astype(np.int32) << 16) | (pixels[:, :, 1].astype(np.int32) << 8) | pixels[:, :, 2]
+        return self.palette_order[np.searchsorted(self.palette_keys, keys)].astype(np.uint8)
+
+    def add_frame(self, pixels):
+        """
+        Add a frame to the clip.
+
+        Args:
+            pixels: A NumPy uint8 array of shape (height, width, 3)
+        """
+        indices = self.indices(pixels)
+        if self.previous is None:
+            box = (0, 0, self.width, self.height)
+        else:
+            changed = indices != self.previous
+            if not changed.any():
+                # Nothing changed: show the last frame for longer
+                self.pending[2] += self.delay
+                return
+            rows = np.flatnonzero(changed.any(axis=1))
+            columns = np.flatnonzero(changed.any(axis=0))
+            box = (columns[0], rows[0], columns[-1] + 1, rows[-1] + 1)
+        self.previous = indices
+        self.flush()
+        left, top, right, bottom = box
+        self.pending = [box, indices[top:bottom, left:right], self.delay]
+
+    def flush(self):
+        """
+        Write the frame waiting to be written, now that its delay is known.
+        """
+        if self.pending is None:
+            return
+        (left, top, right, bottom), indices, delay = self.pending
+        self.pending = None
+        # Graphic control: keep the frame on screen under the next one, and its delay
+        self.file.write(struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 1 << 2, min(delay, 0xFFFF), 0, 0))
+        self.file.write(struct.pack("<BHHHHB", 0x2C, left, top, right - left, bottom - top, 0))
+        data = lzw_encode(indices.tobytes(), max(GIF_COLOR_BITS, 2))
+        self.file.write(bytes([max(GIF_COLOR_BITS, 2)]))
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            self.file.write(bytes([len(block)]) + block)
+        self.file.write(b"\x00")
+
+    def close(self):
+        """
+        Write the last frame and finish the file.
+        """
+        self.flush()
+        self.file.write(b"\x3B")
+        self.file.close()
+
+
+def shrink(pixels, factor):
+    """
+    Make a picture smaller by keeping every factor-th pixel.
+
+    Args:
+        pixels: A NumPy array of shape (height, width, 3)
+        factor: 1 to keep the size, 2 for half the width and height, ...
+
+    Returns:
+        The smaller picture
+    """
+    return pixels if factor == 1 else pixels[::factor, ::factor]
+
+
+def recorded_game(path):
+    """
+    Set up a recording made with main.py --record for playing forward.
+
+    Args:
+        path: The recording file
+
+    Returns:
+        A tuple (state, advance, last tick) where advance(state, tick) plays the
+        recording forward to the tick
+    """
+    from replay import Replay
+    replay = Replay.load(path)
+    return GameState(), replay.play, replay.last_tick
+
+
+def bot_game(balls=1, powerups=False):
+    """
+    Set up a game played by the bot.
+
+    Args:
+        balls: Balls served at the start and after each lost life
+        powerups: True to let destroyed bricks drop power-ups
+
+    Returns:
+        A tuple (state, advance, None) where advance(state, tick) lets the bot
+        play to the tick
+    """
+    from autoplayer import AutoPlayer
+    state = GameState(balls=balls, powerups=powerups)
+    bot = AutoPlayer(state)
+
+    def advance(state, until_tick):
+        while state.game_is_on and state.tick < until_tick:
+            step(state, bot.inputs())
+    return state, advance, None
+
+
+def main():
+    """
+    Export pictures or a clip of a game from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Make pictures and clips of BreakOut games without a window.")
+    parser.add_argument("recording", nargs="?", help="a recording made with main.py --record")
+    parser.add_argument("--autoplay", action="store_true", help="let the bot play a new game instead of a recording")
+    parser.add_argument("--balls", type=int, default=1, help="with --autoplay: balls served in the game")
+    parser.add_argument("--powerups", action="store_true", help="with --autoplay: let bricks drop power-ups")
+    parser.add_argument("--thumbnail", metavar="FILE", help="save one PNG picture of the game at tick --at")
+    parser.add_argument("--at", type=int, default=0, help="tick of the thumbnail (default: the start)")
+    parser.add_argument("--frames", metavar="DIR", help="save numbered PNG frames into DIR")
+    parser.add_argument("--gif", metavar="FILE", help="save an animated GIF clip")
+    parser.add_argument("--start", type=int, default=0, help="first tick of the frames or clip")
+    parser.add_argument("--end", type=int, help="last tick of the frames or clip (default: the end of the game)")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS, help="frames per second of the frames or clip")
+    parser.add_argument("--shrink", type=int, default=1, help="make pictures 2, 3, ... times smaller")
+    args = parser.parse_args()
+
+    if bool(args.recording) == args.autoplay:
+        parser.error("give either a recording or --autoplay")
+    if not (args.thumbnail or args.frames or args.gif):
+        parser.error("nothing to do: give --thumbnail, --frames or --gif")
+    if args.autoplay and args.end is None and (args.frames or args.gif):
+        parser.error("--autoplay needs --end for frames and clips (bot games can last for hours)")
+
+    if args.recording:
+        state, advance, last_tick = recorded_game(args.recording)
+    else:
+        state, advance, last_tick = bot_game(args.balls, args.powerups)
+    end = args.end if args.end is not None else last_tick
+
+    rasterizer = Rasterizer(state)
+
+    # A thumbnail is one picture, so only the whole picture is drawn once
+    if args.thumbnail:
+        advance(state, args.at)
+        rasterizer.render()
+        write_png(args.thumbnail, shrink(rasterizer.pixels, args.shrink))
+        print(f"Saved {args.thumbnail} at tick {state.tick}")
+        if not (args.frames or args.gif):
+            return
+        if state.tick > args.start:
+            parser.error("--thumbnail must come before --start when making frames or a clip as well")
+
+    # Frames and clips: play forward a few ticks at a time, repainting only what changed
+    ticks_per_frame = max(round(1 / (args.fps * TIME_STEP)), 1)
+    delay = round(ticks_per_frame * TIME_STEP * 100)
+    if args.frames:
+        os.makedirs(args.frames, exist_ok=True)
+    gif = None
+    advance(state, args.start)
+    frame = 0
+    while True:
+        rasterizer.render()
+        pixels = shrink(rasterizer.pixels, args.shrink)
+        if gif is None and args.gif:
+            gif = GifWriter(args.gif, pixels.shape[1], pixels.shape[0], delay)
+        if gif:
+            gif.add_frame(pixels)
+        if args.frames:
+            write_png(os.path.join(args.frames, f"frame_{frame:06d}.png"), pixels)
+        frame += 1
+        if not state.game_is_on or state.tick >= end:
+            break
+        advance(state, min(state.tick + ticks_per_frame, end))
+    if gif:
+        gif.close()
+    print(f"Exported {frame} frames (ticks {args.start} to {state.tick})")
+
+
+if __name__ == "__main__":
+    main()
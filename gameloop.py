@@ -0,0 +1,123 @@
+"""
+Game Loop Timing for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the timing helpers used by the main game loop.
+
+FixedTimestep decides how many simulation steps to run for the real time that has
+passed. The game is always advanced in steps of exactly TIME_STEP seconds, so it
+plays at the same speed on fast and slow machines. Leftover time is kept for the
+next frame and tells the renderer how far it is between two steps (interpolation).
+If the computer falls behind, at most MAX_STEPS_PER_FRAME steps are run before the
+next frame is drawn (frame-skip) and any time beyond that is dropped.
+
+FrameLimiter keeps drawing at a steady RENDER_RATE frames per second, either by
+sleeping or by telling the event loop how long to wait before the next frame.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import time
+
+# Constants for the game loop
+TIME_STEP = 1 / 120  # Length of one simulation step in seconds (120 steps per second)
+RENDER_RATE = 60  # Maximum number of frames drawn per second
+MAX_STEPS_PER_FRAME = 8  # Most simulation steps run before drawing a frame
+
+
+class FixedTimestep:
+    """
+    The FixedTimestep class turns real time into a number of fixed-size simulation steps.
+    """
+
+    def __init__(self, step_size=TIME_STEP, max_steps=MAX_STEPS_PER_FRAME):
+        """
+        Initialize the timestep with an empty time accumulator.
+
+        Args:
+            step_size: Length of one simulation step in seconds
+            max_steps: Most steps returned by one call to advance()
+        """
+        self.step_size = step_size
+        self.max_steps = max_steps
+        self.accumulator = 0.0  # Real time not yet simulated, in seconds
+        self.last_time = None  # Time of the previous call to advance()
+        self.dropped_time = 0.0  # Total time thrown away because we fell too far behind
+
+    def advance(self, now):
+        """
+        Add the real time since the last call and work out how many steps are due.
+
+        Args:
+            now: The current time in seconds (for example time.perf_counter())
+
+        Returns:
+            The number of simulation steps to run before drawing the next frame
+        """
+        if self.last_time is not None:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator / self.step_size)
+        if steps > self.max_steps:
+            # We fell behind: skip the time we cannot catch up on instead of
+            # running more and more steps every frame
+            self.dropped_time += (steps - self.max_steps) * self.step_size
+            steps = self.max_steps
+            self.accumulator = steps * self.step_size + self.accumulator % self.step_size
+
+        self.accumulator -= steps * self.step_size
+        return steps
+
+    def alpha(self):
+        """
+        How far the current moment is between the last step and the next one.
+
+        Returns:
+            A number from 0 (just stepped) up to 1 (the next step is due)
+        """
+        return self.accumulator / self.step_size
+
+
+class FrameLimiter:
+    """
+    The FrameLimiter class waits just long enough to draw at a steady frame rate.
+    """
+
+    def __init__(self, rate=RENDER_RATE):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Maximum number of frames per second
+        """
+        self.frame_time = 1 / rate
+        self.next_frame = None  # Time at which the next frame should be drawn
+
+    def delay(self):
+        """
+        Work out how long to wait before the next frame is due, without sleeping
+        (used to set the timer for the next frame). If we are already late, the
+        next frame is due now and counting starts again from now, so one slow
+        frame does not cause a burst.
+
+        Returns:
+            The number of seconds to wait
+        """
+        now = time.perf_counter()
+        if self.next_frame is None or now - self.next_frame > self.frame_time:
+            self.next_frame = now
+        wait = max(self.next_frame - now, 0.0)
+        self.next_frame += self.frame_time
+        return wait
+
+    def wait(self):
+        """
+        Sleep until the next frame is due.
+        """
+        wait = self.delay()
+        if wait > 0:
+            time.sleep(wait)
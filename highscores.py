@@ -0,0 +1,431 @@
+"""
+High Scores for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file keeps the result of every game on disk, so high scores survive when
+the game is closed. It uses two files:
+- The run log (for example scores.brs) gets one small binary record appended
+  for every game played: when it ended, the player, the score, how many ticks
+  it lasted and whether it was won. Records are never changed or removed, so
+  the log is the full history of every run.
+- The index (the same name with .idx added) is a small JSON file with the top
+  scores and each player's best score, plus how much of the log it covers.
+
+At startup only the index is read, so looking up the top 10 takes the same time
+after ten runs or a hundred thousand. If the game stopped before the index was
+updated, only the records after the point the index covers are read. Looking at
+the scores never changes the files; a record cut short by a crash is only cut
+off when the game opens the log to add more.
+
+Writing to disk happens on a background thread. At game over the main thread
+only puts the record on a queue; the writer thread collects everything waiting
+into one batch, appends it to the log, makes sure it really reached the disk
+(fsync) and then replaces the index. The game never freezes waiting for a disk.
+
+Look at the stored scores with:
+    python highscores.py top scores.brs
+    python highscores.py history scores.brs --player hemant
+    python highscores.py rebuild scores.brs
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import json
+import os
+import queue
+import struct
+import threading
+import time
+
+# Constants for the run log file format (all numbers are little-endian)
+MAGIC = b"BRKSCORE"  # First bytes of every run log
+FORMAT_VERSION = 1  # Bump when the file layout changes
+HEADER = struct.Struct("<8sH")  # Magic, version
+RECORD = struct.Struct("<dIIBB")  # Time the game ended, score, ticks played, won, length of the name
+MAX_NAME_LENGTH = 255  # Longest player name stored, in bytes (longer names are cut)
+INDEX_VERSION = 1  # Bump when the index layout changes
+
+# Constants for the high score table and the writer thread
+TOP_SIZE = 10  # Number of top scores kept in the index
+BATCH_DELAY = 0.25  # Seconds the writer waits for more records before writing a batch
+MAX_BATCH = 1000  # Most records written in one batch
+
+
+class Run:
+    """
+    The Run class holds the result of one game.
+    """
+
+    __slots__ = ("player", "score", "ticks", "won", "ended")
+
+    def __init__(self, player, score, ticks=0, won=False, ended=None):
+        """
+        Initialize a run.
+
+        Args:
+            player: Name of the player
+            score: Final score
+            ticks: Number of simulation steps the game lasted
+            won: True if every brick was destroyed
+            ended: When the game ended, in seconds since 1970 (None = now)
+        """
+        self.player = player
+        self.score = score
+        self.ticks = ticks
+        self.won = bool(won)
+        self.ended = time.time() if ended is None else ended
+
+    def pack(self):
+        """
+        Turn the run into a log record.
+
+        Returns:
+            The record as bytes
+        """
+        name = self.player.encode("utf-8")[:MAX_NAME_LENGTH]
+        return RECORD.pack(self.ended, self.score, self.ticks, self.won, len(name)) + name
+
+
+def read_runs(path, start=0):
+    """
+    Read the runs of a run log, starting at a position in the file.
+    Reading stops at a record that was only partly written (the game was stopped
+    while writing it).
+
+    Args:
+        path: The run log
+        start: File position to start at (0 = the first record)
+
+    Yields:
+        Tuples (run, file position just after the run's record)
+    """
+    with open(path, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, FORMAT_VERSION):
+            raise ValueError(f"{path} is not a run log (or was written by another version of the game)")
+        file.seek(max(start, HEADER.size))
+        while True:
+            fixed = file.read(RECORD.size)
+            if len(fixed) < RECORD.size:
+                return
+            ended, score, ticks, won, name_length = RECORD.unpack(fixed)
+            name = file.read(name_length)
+            if len(name) < name_length:
+                return
+            yield Run(name.decode("utf-8", "replace"), score, ticks, won, ended), file.tell()
+
+
+class ScoreIndex:
+    """
+    The ScoreIndex class holds the top scores, each player's best score and how
+    much of the run log they cover. It is what the index file stores.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty index (for an empty run log).
+        """
+        self.log_size = HEADER.size  # Bytes of the run log included in the index
+        self.runs = 0  # Number of runs included
+        self.top = []  # Top scores as [player, score, time], best first
+        self.best = {}  # Best score of each player
+
+    def add(self, run):
+        """
+        Include one run in the index.
+
+        Args:
+            run: The Run to include
+        """
+        self.runs += 1
+        if run.score > self.best.get(run.player, -1):
+            self.best[run.player] = run.score
+
+        # Only a run that beats the lowest top score has to be placed in the table
+        if len(self.top) < TOP_SIZE or run.score > self.top[-1][1]:
+            self.top.append([run.player, run.score, run.ended])
+            # Higher scores first; with the same score, whoever got it first ranks higher
+            self.top.sort(key=lambda entry: (-entry[1], entry[2]))
+            del self.top[TOP_SIZE:]
+
+    def copy(self):
+        """
+        Returns:
+            A separate copy of the index
+        """
+        index = ScoreIndex()
+        index.log_size = self.log_size
+        index.runs = self.runs
+        index.top = [list(entry) for entry in self.top]
+        index.best = dict(self.best)
+        return index
+
+    def to_dict(self):
+        """
+        Returns:
+            The index as a dictionary for the JSON file
+        """
+        return {"version": INDEX_VERSION, "log_size": self.log_size, "runs": self.runs,
+                "top": self.top, "best": self.best}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Make an index from a dictionary read from the JSON file.
+
+        Args:
+            data: The dictionary
+
+        Returns:
+            A new ScoreIndex
+        """
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError("the index was written by another version of the game")
+        index = cls()
+        index.log_size = data["log_size"]
+        index.runs = data["runs"]
+        index.top = data["top"]
+        index.best = data["best"]
+        return index
+
+
+def index_path(path):
+    """
+    Args:
+        path: The run log
+
+    Returns:
+        The index file that belongs to a run log
+    """
+    return path + ".idx"
+
+
+def write_index(index, path):
+    """
+    Write the index of a run log. The file is written under a temporary name and
+    then renamed, so a crash never leaves half an index behind.
+
+    Args:
+        index: The ScoreIndex to write
+        path: The run log the index belongs to
+    """
+    temporary = index_path(path) + ".tmp"
+    with open(temporary, "w") as file:
+        json.dump(index.to_dict(), file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, index_path(path))
+
+
+def rebuild_index(path):
+    """
+    Read the whole run log and make a fresh index from it.
+
+    Args:
+        path: The run log
+
+    Returns:
+        The new ScoreIndex
+    """
+    index = ScoreIndex()
+    for run, end in read_runs(path):
+        index.add(run)
+        index.log_size = end
+    return index
+
+
+def read_log(path):
+    """
+    Read the index of a run log without changing either file.
+    The index is read from its file and only the records added after it was
+    written are read from the log; if the index is missing or damaged it is
+    rebuilt (in memory) from the whole log.
+
+    Args:
+        path: The run log
+
+    Returns:
+        The ScoreIndex for the whole log
+    """
+    try:
+        with open(index_path(path)) as file:
+            index = ScoreIndex.from_dict(json.load(file))
+        if index.log_size > os.path.getsize(path):
+            raise ValueError("the index covers more than the log holds")
+    except (OSError, ValueError, KeyError):
+        return rebuild_index(path)
+
+    # Catch up with runs that reached the log but not the index
+    for run, end in read_runs(path, index.log_size):
+        index.add(run)
+        index.log_size = end
+    return index
+
+
+def open_log(path):
+    """
+    Get a run log ready for appending and read its index (see read_log()).
+    A new log is created if there is none, and a record that was only partly
+    written when the game stopped is cut off, so new records follow whole ones.
+
+    Args:
+        path: The run log
+
+    Returns:
+        The ScoreIndex for the whole log
+    """
+    if not os.path.exists(path):
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+            file.flush()
+            os.fsync(file.fileno())
+
+    index = read_log(path)
+    if os.path.getsize(path) > index.log_size:
+        with open(path, "r+b") as file:
+            file.truncate(index.log_size)
+    return index
+
+
+class HighScores:
+    """
+    The HighScores class records finished games in a run log and answers high
+    score questions from memory. Records are written by a background thread.
+    """
+
+    def __init__(self, path):
+        """
+        Open (or create) a run log and start the writer thread.
+
+        Args:
+            path: The run log; its index is kept next to it
+        """
+        self.path = path
+        self.index = open_log(path)  # What the main thread answers questions from
+        self.error = None  # The last error of the writer thread, if writing failed
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.write_batches, args=(self.index.copy(),),
+                                       name="highscores", daemon=True)
+        self.thread.start()
+
+    def add(self, run):
+        """
+        Record a finished game. Returns straight away; the writer thread saves it.
+
+        Args:
+            run: The Run to record
+        """
+        self.index.add(run)
+        self.queue.put(run)
+
+    def top(self, count=TOP_SIZE):
+        """
+        Get the top scores.
+
+        Args:
+            count: Number of scores wanted (at most TOP_SIZE)
+
+        Returns:
+            A list of (player, score) pairs, best first
+        """
+        return [(player, score) for player, score, _ in self.index.top[:count]]
+
+    def best(self, player):
+        """
+        Get a player's best score.
+
+        Args:
+            player: Name of the player
+
+        Returns:
+            The best score, or None if the player has not finished a game
+        """
+        return self.index.best.get(player)
+
+    def write_batches(self, index):
+        """
+        Append the queued runs to the log in batches (writer thread).
+        Runs until close() is called.
+
+        Args:
+            index: The writer's own copy of the index
+        """
+        running = True
+        while running:
+            batch = [self.queue.get()]
+
+            # Collect whatever else arrives shortly, so a burst of games costs one write
+            deadline = time.monotonic() + BATCH_DELAY
+            while batch[-1] is not None and len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self.queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+            if not batch:
+                continue
+
+            try:
+                with open(self.path, "ab") as file:
+                    for run in batch:
+                        file.write(run.pack())
+                    file.flush()
+                    os.fsync(file.fileno())
+                    log_size = file.tell()
+                for run in batch:
+                    index.add(run)
+                index.log_size = log_size
+                write_index(index, self.path)
+            except OSError as error:
+                self.error = error  # Kept so the game can report it; the game itself goes on
+
+    def close(self):
+        """
+        Write the runs still waiting and stop the writer thread.
+        """
+        self.queue.put(None)
+        self.thread.join()
+
+
+def main():
+    """
+    Show or repair the high scores from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Show the high scores of BreakOut Clone.")
+    parser.add_argument("command", choices=["top", "history", "rebuild"],
+                        help="top: the best scores (read from the index), history: every run in the log, "
+                             "rebuild: make the index again from the whole log")
+    parser.add_argument("log", help="run log made with main.py --scores")
+    parser.add_argument("--player", help="history: only show this player's runs")
+    args = parser.parse_args()
+
+    # top and history only read the files; only rebuild writes (the new index)
+    try:
+        if args.command == "top":
+            index = read_log(args.log)
+            print(f"{index.runs} runs by {len(index.best)} players")
+            for place, (player, score, ended) in enumerate(index.top, start=1):
+                print(f"{place:3}. {score:7}  {player}  "
+                      f"({time.strftime('%Y-%m-%d %H:%M', time.localtime(ended))})")
+        elif args.command == "history":
+            for run, _ in read_runs(args.log):
+                if args.player is None or run.player == args.player:
+                    result = "won" if run.won else "lost"
+                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run.ended))}  {run.player}  "
+                          f"{run.score} points  {run.ticks} ticks  {result}")
+        else:
+            index = rebuild_index(args.log)
+            write_index(index, args.log)
+            print(f"Index rebuilt from {index.runs} runs")
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Level Packs for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file reads and writes level packs: many brick layouts stored in one compact
+binary file. The file starts with a small header, then a table with the position
+and size of every level, then the bricks themselves. Every brick is a fixed-width
+8-byte record holding its position, type, hit points and points.
+
+Every level must have at least one brick, and every brick must be where the ball
+can reach it and well above the paddle (see check_level); write_pack() refuses
+levels that break these rules, because they could never be cleared or played.
+
+A pack is opened with mmap, so opening it only reads the header. The operating
+system loads the parts of the file we actually touch, and the bricks of a level
+are only decoded when that level is played. A pack with hundreds of large levels
+opens instantly and never sits in memory as Python objects all at once.
+
+Make a pack of random levels and look inside it with:
+    python levels.py make levels.brk --levels 200 --rows 12 --columns 11
+    python levels.py info levels.brk
+Then play one of its levels with:
+    python main.py --levels levels.brk --level 3
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+
+from engine import grid_layout, BRICK_POINTS, BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y
+from engine import BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT, SIDE_WALL, TOP_WALL
+
+# Constants for the level pack file format (all numbers are little-endian)
+MAGIC = b"BRKLEVEL"  # First bytes of every level pack
+FORMAT_VERSION = 1  # Bump when the file layout changes
+HEADER = struct.Struct("<8sHI")  # Magic, version, number of levels
+LEVEL_ENTRY = struct.Struct("<QI")  # File offset of the level's first brick, number of bricks
+BRICK_RECORD = struct.Struct("<hhBBH")  # x, y, type, hit points, points
+
+# Constants for random levels
+MAX_HIT_POINTS = 3  # Toughest random brick needs this many hits
+GAP_CHANCE = 0.15  # Chance that a spot in a random level has no brick
+
+# Constants for checking levels
+LOWEST_BRICK_Y = -100  # No brick center may be lower than this, so there is room to play above the paddle
+MAX_BRICK_HIT_POINTS = 255  # Hit points are kept in one byte (see GameState.brick_hp)
+
+
+def check_level(bricks, number):
+    """
+    Make sure a level can be played: it has bricks, and each one is a playable
+    brick (see check_brick).
+
+    Args:
+        bricks: The level's brick records (x, y, type, hit points, points)
+        number: The level's number (for the error message)
+
+    Raises:
+        ValueError: If the level could not be played
+    """
+    if not bricks:
+        raise ValueError(f"level {number} has no bricks, so it could never be cleared")
+    for brick in bricks:
+        check_brick(brick, number)
+
+
+def check_brick(brick, number):
+    """
+    Make sure a brick can be played: it is inside the area the ball can reach and
+    no lower than LOWEST_BRICK_Y, its type is one of the game's brick types, and
+    it needs at least one hit to break.
+
+    Args:
+        brick: The brick record (x, y, type, hit points, points)
+        number: The number of the brick's level (for the error message)
+
+    Raises:
+        ValueError: If the brick could not be played
+    """
+    x_pos, y_pos, brick_type, hp, _ = brick
+    if y_pos < LOWEST_BRICK_Y:
+        raise ValueError(f"level {number} has a brick at y={y_pos}, below the lowest allowed row "
+                         f"(y={LOWEST_BRICK_Y}); use fewer rows")
+    if abs(x_pos) - BRICK_HALF_WIDTH >= SIDE_WALL or y_pos - BRICK_HALF_HEIGHT >= TOP_WALL:
+        raise ValueError(f"level {number} has a brick at ({x_pos}, {y_pos}), where the ball can't reach it; "
+                         f"use fewer columns")
+    if not 0 <= brick_type < len(BRICK_POINTS):
+        raise ValueError(f"level {number} has a brick of unknown type {brick_type} "
+                         f"(types go from 0 to {len(BRICK_POINTS) - 1})")
+    if not 1 <= hp <= MAX_BRICK_HIT_POINTS:
+        raise ValueError(f"level {number} has a brick with {hp} hit points "
+                         f"(it needs 1 to {MAX_BRICK_HIT_POINTS})")
+
+
+def write_pack(path, levels, count=None):
+    """
+    Write a level pack file.
+    Levels are written one at a time, so they can be made by a generator
+    without keeping the whole pack in memory.
+
+    Args:
+        path: The file to write
+        levels: Levels (a list or a generator), each a sequence of brick records
+            (x, y, type, hit points, points)
+        count: Number of levels (needed when levels is a generator)
+
+    Raises:
+        ValueError: If a level could not be played (see check_level)
+    """
+    if count is None:
+        count = len(levels)
+    try:
+        with open(path, "wb") as file:
+            # Leave room for the level table and fill it in at the end
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, count))
+            file.write(bytes(LEVEL_ENTRY.size * count))
+
+            table = []
+            for bricks in levels:
+                bricks = list(bricks)
+                check_level(bricks, len(table))
+                offset = file.tell()
+                data = bytearray()
+                for x_pos, y_pos, brick_type, hp, points in bricks:
+                    data += BRICK_RECORD.pack(round(x_pos), round(y_pos), brick_type, hp, points)
+                file.write(data)
+                table.append(LEVEL_ENTRY.pack(offset, len(data) // BRICK_RECORD.size))
+
+            if len(table) != count:
+                raise ValueError(f"expected {count} levels, got {len(table)}")
+            file.seek(HEADER.size)
+            file.write(b"".join(table))
+    except BaseException:
+        # Don't leave half a pack behind
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+
+def random_level(rows, columns, seed):
+    """
+    Make a random brick layout on the standard grid.
+    Some spots are left empty, and some bricks need several hits (and are worth more).
+
+    Args:
+        rows: Number of brick rows
+        columns: Number of bricks in each row
+        seed: Random seed, so the same seed always gives the same level
+
+    Returns:
+        A list of brick records (x, y, type, hit points, points)
+    """
+    rng = random.Random(seed)
+    bricks = []
+    for row in range(rows):
+        brick_type = min(row, len(BRICK_POINTS) - 1)
+        for col in range(columns):
+            if rng.random() < GAP_CHANCE:
+                continue
+            hp = rng.randint(1, MAX_HIT_POINTS)
+            bricks.append((BRICK_START_X + col * BRICK_SPACING_X, BRICK_START_Y - row * BRICK_SPACING_Y,
+                           brick_type, hp, BRICK_POINTS[brick_type] * hp))
+    return bricks
+
+
+class Level:
+    """
+    The Level class is one level inside an open LevelPack.
+    It only remembers where its bricks are in the file; nothing is decoded until
+    bricks() is called.
+    """
+
+    def __init__(self, pack, number, offset, count):
+        """
+        Initialize the level.
+
+        Args:
+            pack: The LevelPack the level belongs to
+            number: The level number (0 is the first level)
+            offset: File offset of the first brick record
+            count: Number of bricks in the level
+        """
+        self.pack = pack
+        self.number = number
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        """
+        Get the number of bricks in the level.
+        """
+        return self.count
+
+    def bricks(self):
+        """
+        Decode the brick records one at a time, straight from the mapped file.
+        Pass the result to GameState(bricks=...) to play the level.
+        Each brick is checked as it is decoded (see check_brick), so a damaged or
+        hand-edited pack is refused instead of breaking the game.
+
+        Returns:
+            An iterator of brick records (x, y, type, hit points, points)
+
+        Raises:
+            ValueError: If the level has no bricks or a brick could not be played
+        """
+        if not self.count:
+            raise ValueError(f"{self.pack.path}: level {self.number} has no bricks, so it could never be cleared")
+        data = self.pack.data
+        unpack_from = BRICK_RECORD.unpack_from
+        size = BRICK_RECORD.size
+        for offset in range(self.offset, self.offset + self.count * size, size):
+            brick = unpack_from(data, offset)
+            try:
+                check_brick(brick, self.number)
+            except ValueError as error:
+                raise ValueError(f"{self.pack.path}: {error}") from None
+            yield brick
+
+
+class LevelPack:
+    """
+    The LevelPack class opens a level pack file with mmap.
+    Only the header is read when the pack is opened; each level's table entry
+    is read when the level is asked for.
+    """
+
+    def __init__(self, path):
+        """
+        Open a level pack file.
+
+        Args:
+            path: The file to open
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self.count = HEADER.unpack_from(self.data)
+        except (ValueError, struct.error):
+            self.file.close()
+            raise ValueError(f"{path} is not a BreakOut level pack")
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a BreakOut level pack")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} uses level format {version}, expected {FORMAT_VERSION}")
+        if HEADER.size + self.count * LEVEL_ENTRY.size > len(self.data):
+            self.close()
+            raise ValueError(f"{path} is damaged: its level table is cut short")
+
+    def __len__(self):
+        """
+        Get the number of levels in the pack.
+        """
+        return self.count
+
+    def level(self, number):
+        """
+        Get one level of the pack (its bricks are not decoded yet).
+
+        Args:
+            number: The level number (0 is the first level)
+
+        Returns:
+            A Level
+
+        Raises:
+            IndexError: If the pack has no such level
+            ValueError: If the pack's table entry for the level is damaged
+        """
+        if not 0 <= number < self.count:
+            raise IndexError(f"{self.path} has no level {number} (it has {self.count} levels)")
+        offset, count = LEVEL_ENTRY.unpack_from(self.data, HEADER.size + number * LEVEL_ENTRY.size)
+
+        # The bricks must lie after the level table and inside the file
+        if offset < HEADER.size + self.count * LEVEL_ENTRY.size or offset + count * BRICK_RECORD.size > len(self.data):
+            raise ValueError(f"{self.path} is damaged: the bricks of level {number} are outside the file")
+        return Level(self, number, offset, count)
+
+    def close(self):
+        """
+        Close the mapped file.
+        """
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        """
+        Use the pack in a with statement (it is closed at the end).
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the pack at the end of a with statement.
+        """
+        self.close()
+
+
+def main():
+    """
+    Make or describe a level pack from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Make or inspect BreakOut level packs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    make = commands.add_parser("make", help="write a pack of random levels")
+    make.add_argument("pack", help="the level pack file to write")
+    make.add_argument("--levels", type=int, default=100, help="number of levels (the first is the standard wall)")
+    make.add_argument("--rows", type=int, default=10, help="brick rows in each random level (at most 15 fit above the paddle)")
+    make.add_argument("--columns", type=int, default=11, help="bricks in each row of a random level")
+    make.add_argument("--seed", type=int, default=0, help="random seed of the first random level")
+    info = commands.add_parser("info", help="show the size of every level in a pack")
+    info.add_argument("pack", help="the level pack file to read")
+    args = parser.parse_args()
+
+    if args.command == "make":
+        # Level 0 is the standard wall; each level is made just before it is written
+        levels = (grid_layout() if number == 0 else random_level(args.rows, args.columns, args.seed + number)
+                  for number in range(args.levels))
+        try:
+            write_pack(args.pack, levels, args.levels)
+        except ValueError as error:
+            parser.exit(1, f"Could not make {args.pack}: {error}\n")
+        print(f"Wrote {args.levels} levels to {args.pack}")
+    else:
+        with LevelPack(args.pack) as pack:
+            print(f"{args.pack}: {len(pack)} levels")
+            for number in range(len(pack)):
+                print(f"  level {number}: {len(pack.level(number))} bricks")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,18 @@
 """
 BreakOut Clone Game - Main Program
 Author: Hemant Vijay
-Last Updated: 4-Nov-2025
+Last Updated: 18-Oct-2026
 
 This is the main file that runs the BreakOut game. BreakOut is a classic arcade game
 from the 1980s where a player controls a paddle to bounce a ball and destroy bricks.
 The goal is to destroy all the bricks without letting the ball fall off the screen.
 
 Game Rules:
-- Use Left Arrow and Right Arrow keys to move the paddle
+- Hold the Left Arrow and Right Arrow keys (or A and D) to move the paddle
 - Keep the ball bouncing by hitting it with the paddle
 - Destroy all bricks to win the game
 - You have 3 lives - if the ball falls off the screen, you lose a life
+  (in multi-ball mode, only when the last ball falls off)
 - Different colored bricks are worth different points:
   Red = 10 points, Orange = 8, Yellow = 6, Green = 4, Blue = 2
 
@@ -22,13 +23,80 @@ Course URL: https://www.udemy.com/course/100-days-of-code/
 Compatibility: Works on Windows 11 Pro 64-bit and up, Ubuntu 24.04.3 LTS and up
 """
 
+import time
+
+# The moment the game was started, for --startup-time (taken before anything slow is imported)
+STARTUP_TIME = time.perf_counter()
+
 from turtle import Screen
-from paddle import Paddle
+from engine import GameState, step, load_level, grid_layout
+from engine import INPUT_LEFT, INPUT_RIGHT, EVENT_BRICK, EVENT_LIFE_LOST, EVENT_WIN, EVENT_GAME_OVER, EVENT_POWERUP
+from gameloop import FixedTimestep, FrameLimiter
+from paddle import Paddle, register_paddle_shape
 from ball import Ball
 from brick import BrickManager
+from powerup import PowerUpManager
 from scoreboard import Scoreboard
-import time
-import sys
+from controls import KeyboardInput
+from replay import InputRecorder, NullRecorder
+from profiler import FrameProfiler, NullProfiler, ProfilerOverlay
+from profiler import PHASE_SLEEP, PHASE_SIMULATE, PHASE_DRAW, PHASE_SCREEN
+from scheduler import Scheduler
+import argparse
+import getpass
+
+# Modules only some options need (the bot, level packs, background services and
+# high scores) are imported where they are used, so a plain game starts faster
+
+# Read the command line options
+parser = argparse.ArgumentParser(description="Play BreakOut Clone.")
+parser.add_argument("--record", metavar="FILE",
+                    help="save every paddle move to FILE so the game can be replayed with replay.py")
+parser.add_argument("--profile", metavar="FILE",
+                    help="time each part of every frame and save a JSON summary to FILE on exit")
+parser.add_argument("--overlay", action="store_true",
+                    help="show frame time percentiles on screen (turns on profiling)")
+parser.add_argument("--levels", metavar="PACK",
+                    help="play the levels of a level pack made with levels.py instead of the standard wall")
+parser.add_argument("--level", type=int, default=0,
+                    help="number of the level to start at in the pack (default: 0)")
+parser.add_argument("--endless", action="store_true",
+                    help="keep playing new levels: the pack starts over after its last level "
+                         "(without --levels, the standard wall comes back each time)")
+parser.add_argument("--balls", type=int, default=1,
+                    help="multi-ball mode: number of balls served at the start and after each lost life")
+parser.add_argument("--powerups", action="store_true",
+                    help="let destroyed bricks drop power-ups (wider paddle, slower ball, extra life, extra ball)")
+parser.add_argument("--autoplay", action="store_true",
+                    help="let a bot move the paddle (for soak testing the live game)")
+parser.add_argument("--telemetry", metavar="FILE",
+                    help="append a sample of the game every second to FILE (JSON lines)")
+parser.add_argument("--autosave", metavar="FILE",
+                    help="save the game to FILE every few seconds and on exit")
+parser.add_argument("--resume", metavar="FILE",
+                    help="continue a game saved with --autosave")
+parser.add_argument("--leaderboard", metavar="URL", nargs="?", const="local",
+                    help="send the score to a leaderboard service (without a URL, a local stand-in is started)")
+parser.add_argument("--scores", metavar="FILE",
+                    help="keep the result of every game in FILE and show the high scores at the end")
+parser.add_argument("--broadcast", metavar="ADDRESS", nargs="?", const="127.0.0.1:8765",
+                    help="let spectators watch the game with viewer.py (HOST:PORT or a Unix socket path, "
+                         "default 127.0.0.1:8765)")
+parser.add_argument("--name", default=getpass.getuser(),
+                    help="player name shown on the leaderboard and in the high scores")
+parser.add_argument("--startup-time", action="store_true",
+                    help="print how long it took until the first frame was on screen, then quit")
+args = parser.parse_args()
+
+# Moments the parts of startup finished, as (name, time) pairs
+startup_marks = [("imports", time.perf_counter())]
+
+# Recordings are replayed on the standard game, so they can't be made with other levels or more balls
+if args.record and (args.levels or args.balls != 1 or args.resume or args.endless or args.powerups):
+    parser.error("--record can only be used with the standard game "
+                 "(without --levels, --balls, --resume, --endless or --powerups)")
+if args.balls < 1:
+    parser.error("--balls must be at least 1")
 
 # Set up the game screen
 screen = Screen()
@@ -36,144 +104,370 @@ screen.title("BreakOut Clone")  # Window title
 screen.bgcolor("black")  # Black background like classic arcade games
 screen.setup(width=800, height=600)  # Screen dimensions: 800 pixels wide, 600 tall
 screen.tracer(0)  # Turn off automatic screen updates for smoother animation
+register_paddle_shape(screen)  # The paddle's shape is made once, already at its final size
+startup_marks.append(("window", time.perf_counter()))
 
 # Add a flag to track if the window is still valid
 # This helps prevent errors if the window is closed during gameplay
 window_active = True
 
+# Create the game state
+# This holds the ball, paddle, bricks, score and lives as plain numbers
+# The game rules in engine.py update it once per tick
+# The level pack stays open while we play (only the levels we reach are read from it)
+# A damaged pack, or a level that could not be played, is refused with a message
+pack = None
+if args.levels:
+    from levels import LevelPack
+    try:
+        pack = LevelPack(args.levels)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+if args.resume:
+    # Continue a saved game exactly where it was left
+    from services import load_save
+    try:
+        state = load_save(args.resume)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if not state.game_is_on:
+        parser.error(f"{args.resume} holds a game that is already over")
+elif pack:
+    try:
+        state = GameState(bricks=pack.level(args.level).bricks(), balls=args.balls, powerups=args.powerups)
+    except (IndexError, ValueError) as error:
+        parser.error(str(error))
+else:
+    state = GameState(balls=args.balls, powerups=args.powerups)
+
+
+def next_level_bricks():
+    """
+    Find the bricks of the level after the one just cleared.
+
+    Returns:
+        The brick records of the next level, or None if the game is won
+    """
+    number = args.level + state.level + 1
+    if pack and (number < len(pack) or args.endless):
+        # Decoded (and checked) in full before the game is changed
+        return list(pack.level(number % len(pack)).bricks())
+    if args.endless:
+        return grid_layout()
+    return None
+
 # Create the game objects
+# These only draw the game state on the screen
 # The paddle is positioned at the bottom center of the screen
-paddle = Paddle((0, -250))
+paddle = Paddle(state)
 
-# The ball starts in the center of the screen
-ball = Ball()
+# The balls start in the center of the screen (one turtle for each ball in play)
+balls = [Ball(state, index) for index in range(len(state.ball_x))]
 
-# The brick manager creates all the bricks at the top
-brick_manager = BrickManager()
+# The brick manager draws all the bricks at the top
+# Rectangles of destroyed bricks are kept in its pool and reused by the next level
+brick_manager = BrickManager(state, screen.getcanvas())
 
-# The scoreboard displays score and lives at the top
-scoreboard = Scoreboard()
+# The power-ups falling from destroyed bricks (only with --powerups) share the bricks' pool of rectangles
+powerups = PowerUpManager(state, screen.getcanvas(), brick_manager.pool)
 
-# Function to handle window close event
-# This prevents errors when the user closes the window during gameplay
-def on_window_close():
-    """
-    This function is called when the user closes the game window.
-    It sets a flag to stop the game loop gracefully.
-    """
-    global game_is_on, window_active
-    game_is_on = False
-    window_active = False
+# The scoreboard displays score and lives at the top (and the level, when there are several)
+scoreboard = Scoreboard(state, screen.getcanvas(), show_level=bool(pack) or args.endless, first_level=args.level)
 
 # Set up keyboard controls
-# Listen for keyboard input
-screen.listen()
+# Key presses and releases only update a table of held keys; the game reads it once per step
+keyboard = KeyboardInput(screen)
+
+# The bot predicts where the ball lands and holds the keys for us (only with --autoplay)
+bot = None
+if args.autoplay:
+    from autoplayer import AutoPlayer
+    bot = AutoPlayer(state)
+
+# The held keys are recorded with their tick number so the game can be replayed
+# (only with --record, otherwise nothing is kept)
+recorder = InputRecorder(state) if args.record else NullRecorder()
+
+# Set up the game loop timing
+# The game is always advanced in fixed steps of TIME_STEP seconds, so it runs at the
+# same speed on every machine, and the screen is drawn at its own steady frame rate
+timestep = FixedTimestep()
+frame_limiter = FrameLimiter()
+
+# Set up the frame profiler (only if asked for, otherwise it costs nothing)
+if args.profile or args.overlay:
+    profiler = FrameProfiler()
+else:
+    profiler = NullProfiler()
+overlay = ProfilerOverlay(profiler, screen.getcanvas()) if args.overlay else None
+startup_marks.append(("game objects", time.perf_counter()))
+
+# Everything runs on the window's event loop: each frame sets a timer for the next
+# one, and the background jobs below share the same loop, so the window keeps
+# handling its own events (like being closed) between frames
+scheduler = Scheduler(screen)
+game_is_on = True
+in_frame = False  # True while a frame is being drawn
+first_frame = True  # True until the first frame is on screen
+shut_down_done = False
 
-# When Left Arrow is pressed, move paddle left
-screen.onkey(paddle.go_left, "Left")
+# The background jobs are not needed for the first frame, so they are started after it
+telemetry = autosave = leaderboard = leaderboard_service = high_scores = broadcaster = None
 
-# When Right Arrow is pressed, move paddle right
-screen.onkey(paddle.go_right, "Right")
 
-# Set up the window close handler
-# This ensures the program exits gracefully when the window is closed
-try:
-    screen.getcanvas().winfo_toplevel().protocol("WM_DELETE_WINDOW", on_window_close)
-except:
-    # If protocol setup fails, continue anyway (for compatibility)
-    pass
+def start_background_jobs():
+    """
+    Start the background jobs asked for on the command line.
+    They take a quick copy of what they need on the main thread and do slow
+    file and network work on worker threads.
+    """
+    global telemetry, autosave, leaderboard, leaderboard_service, high_scores, broadcaster
+    if args.telemetry or args.autosave or args.leaderboard:
+        from services import Telemetry, Autosave, LeaderboardClient, LeaderboardStandIn
+        from services import TELEMETRY_INTERVAL, TELEMETRY_FLUSH_INTERVAL, AUTOSAVE_INTERVAL, LEADERBOARD_INTERVAL
+    if args.telemetry:
+        telemetry = Telemetry(state, args.telemetry)
+        scheduler.call_every(TELEMETRY_INTERVAL, telemetry.sample)
+        scheduler.call_every(TELEMETRY_FLUSH_INTERVAL, lambda: telemetry.flush(scheduler))
+    if args.autosave:
+        autosave = Autosave(state, args.autosave)
+        scheduler.call_every(AUTOSAVE_INTERVAL, lambda: autosave.save(scheduler))
+    if args.leaderboard:
+        if args.leaderboard == "local":
+            leaderboard_service = LeaderboardStandIn()
+        url = leaderboard_service.url if leaderboard_service else args.leaderboard
+        leaderboard = LeaderboardClient(url, args.name)
+        scheduler.call_every(LEADERBOARD_INTERVAL, lambda: leaderboard.sync(scheduler, state.score))
+
+    # The high scores are read from a small index file here; finished games are
+    # written to disk by their own background thread
+    if args.scores:
+        from highscores import HighScores
+        high_scores = HighScores(args.scores)
+
+    # Spectators connect to this socket; every tick is sent to them as a small delta
+    if args.broadcast:
+        from broadcast import Broadcaster
+        broadcaster = Broadcaster(state, args.broadcast, first_level=args.level)
+
+
+def report_startup():
+    """
+    Print how long each part of startup took, up to the first frame being on screen.
+    """
+    print("Time to first frame:")
+    last = STARTUP_TIME
+    for name, moment in startup_marks:
+        print(f"  {name:<14}{(moment - last) * 1000:8.1f} ms")
+        last = moment
+    print(f"  {'total':<14}{(last - STARTUP_TIME) * 1000:8.1f} ms")
 
-# Main game loop - this runs continuously while the game is active
-game_is_on = True
-while game_is_on:
-    try:
-        # Small delay to control game speed (makes the animation smooth)
-        time.sleep(ball.move_speed)
 
-        # Check if window is still active before updating
-        if not window_active:
-            break
+def frame():
+    """
+    Run the simulation steps that are due, draw one frame and set the timer for the next.
+    This function is called by the window's event loop.
+    """
+    global game_is_on, in_frame, first_frame, window_active, bot
+    in_frame = True
+    try:
+        # The time since the last frame was spent waiting in the event loop
+        profiler.mark(PHASE_SLEEP)
+
+        # Run every simulation step that is due for the time that has passed
+        # If the computer fell behind, several steps run before the next frame
+        for _ in range(timestep.advance(time.perf_counter())):
+            # Read the held keys and advance the game by one step
+            # (moves the paddle and the balls and checks all collisions)
+            inputs = bot.inputs() if bot else keyboard.inputs()
+            recorder.record(inputs)
+            events = step(state, inputs)
+            if broadcaster:
+                broadcaster.record()
+
+            # If bricks were hit, hide them
+            if events & EVENT_BRICK:
+                for index in state.hit_bricks:
+                    brick_manager.destroy(index)
+
+            # If the score or lives changed, update the scoreboard
+            if events & (EVENT_BRICK | EVENT_LIFE_LOST | EVENT_POWERUP):
+                scoreboard.update_scoreboard()
+
+            # Check if all bricks are destroyed (level cleared)
+            if events & EVENT_WIN:
+                # Go on to the next level if there is one, reusing the same turtles and rectangles
+                bricks = next_level_bricks()
+                if bricks is not None:
+                    load_level(state, bricks)
+                    brick_manager.load_level()
+                    scoreboard.update_scoreboard()
+                    if bot:
+                        bot = AutoPlayer(state)
+                    continue
+
+                # That was the last level: display victory message
+                scoreboard.you_win()
+
+                # End the game
+                game_is_on = False
+                break
+
+            # Check if player has run out of lives
+            if events & EVENT_GAME_OVER:
+                # Display game over message
+                scoreboard.game_over()
+
+                # End the game
+                game_is_on = False
+                break
+
+        profiler.mark(PHASE_SIMULATE)
+
+        # Add turtles for balls that came into play (turtles of lost balls hide themselves)
+        while len(balls) < len(state.ball_x):
+            balls.append(Ball(state, len(balls)))
+
+        # Move the paddle turtle (once per frame, however many keys were pressed; stretched while it is wider)
+        paddle.render()
+
+        # Draw the balls part way between the last two steps so they move smoothly
+        alpha = timestep.alpha()
+        for ball in balls:
+            ball.render(alpha)
+
+        # Move the falling power-ups
+        powerups.render()
+
+        # Show this frame's score changes (several changes in one frame cost one redraw)
+        scoreboard.render()
+        if overlay:
+            overlay.render()
+        profiler.mark(PHASE_DRAW)
 
         # Update the screen to show the latest positions
         screen.update()
-
-        # Move the ball to its next position
-        ball.move()
+        profiler.mark(PHASE_SCREEN)
+        profiler.end_frame()
+
+        # Send this frame's ticks to the spectators (never waits for them)
+        if broadcaster:
+            broadcaster.flush()
+
+        if first_frame:
+            # The first frame is on screen: now start what it did not need
+            first_frame = False
+            startup_marks.append(("first frame", time.perf_counter()))
+            if args.startup_time:
+                report_startup()
+                window_active = False  # Quit after this frame
+            else:
+                start_background_jobs()
     except Exception as e:
         # If any graphics error occurs (like window being closed), exit gracefully
         # This prevents the TclError that can happen on Windows
         print(f"Game window was closed or an error occurred: {type(e).__name__}")
         game_is_on = False
-        window_active = False
-        break
-
-    # Check if ball hits the top wall
-    if ball.ycor() > 280:
-        # Bounce the ball downward
-        ball.bounce_y()
-
-    # Check if ball hits the left or right walls
-    if ball.xcor() > 380 or ball.xcor() < -380:
-        # Bounce the ball horizontally
-        ball.bounce_x()
-
-    # Check if ball hits the paddle
-    # The ball must be close to the paddle's y position AND close to paddle horizontally
-    if (ball.distance(paddle) < 50 and ball.ycor() < -230):
-        # Bounce the ball upward
-        ball.bounce_y()
-
-        # Increase the ball speed slightly to make game harder
-        ball.increase_speed()
-
-    # Check if ball hits any bricks
-    # This returns the point value of any destroyed brick
-    points_earned = brick_manager.check_collision(ball)
-
-    # If a brick was hit, update the score and bounce the ball
-    if points_earned > 0:
-        # Add points to the score
-        scoreboard.increase_score(points_earned)
-
-        # Bounce the ball downward
-        ball.bounce_y()
-
-    # Check if all bricks are destroyed (player wins)
-    if brick_manager.all_bricks_destroyed():
-        # Display victory message
-        scoreboard.you_win()
-
-        # End the game
-        game_is_on = False
-
-    # Check if ball falls off the bottom of the screen (player loses a life)
-    if ball.ycor() < -290:
-        # Reset the ball to center
-        ball.reset_position()
-
-        # Decrease lives by 1
-        scoreboard.decrease_lives()
-
-        # Check if player has run out of lives
-        if scoreboard.lives <= 0:
-            # Display game over message
-            scoreboard.game_over()
+    in_frame = False
+
+    if not window_active:
+        # The window was closed while this frame was being drawn
+        shut_down()
+    elif game_is_on:
+        # Set the timer for the next frame (the event loop handles window events meanwhile)
+        profiler.start_frame()
+        scheduler.call_later(frame_limiter.delay(), frame)
+    else:
+        # The game is over: save everything and close the window when it is clicked
+        finish_game()
+        scoreboard.render()
+        screen.update()
+        screen.onclick(lambda x, y: shut_down())
 
-            # End the game
-            game_is_on = False
 
-# Keep the window open until user clicks to close it
-# Only call exitonclick if the window is still active
-if window_active:
-    try:
-        screen.exitonclick()
-    except:
-        # If exitonclick fails (window already closed), just exit
-        pass
-else:
-    # If window was closed during gameplay, exit cleanly
+def finish_game():
+    """
+    Save the recording, profile, telemetry, autosave and final score, and show the high scores.
+    The slow parts still run on worker threads.
+    """
+    global shut_down_done
+    if shut_down_done:
+        return
+    shut_down_done = True
+
+    # Save the recording and the profile if they were asked for
+    if args.record:
+        recorder.save(args.record)
+    profiler.close()
+    if args.profile:
+        profiler.dump(args.profile)
+
+    # Hand the last telemetry, save and score to the worker threads
+    if telemetry:
+        telemetry.sample()
+        telemetry.flush(scheduler)
+    if autosave:
+        autosave.save(scheduler)
+    if leaderboard:
+        leaderboard.sync(scheduler, state.score)
+
+    # Record the game in the high scores (written by the high score thread) and show the table
+    if high_scores:
+        from highscores import Run
+        high_scores.add(Run(args.name, state.score, state.tick, state.won))
+        scoreboard.show_high_scores(high_scores.top())
+
+
+def shut_down():
+    """
+    Close the window, then wait for the last background jobs and exit.
+    """
+    global game_is_on
+    game_is_on = False
+    finish_game()
     try:
         screen.bye()
     except:
         pass
-    sys.exit(0)
+    scheduler.stop(wait=True)
+    if high_scores:
+        high_scores.close()
+    if pack:
+        pack.close()
+    if broadcaster:
+        broadcaster.close()
+    if leaderboard_service:
+        leaderboard_service.close()
+
+
+# Function to handle window close event
+# This prevents errors when the user closes the window during gameplay
+def on_window_close():
+    """
+    This function is called when the user closes the game window.
+    The event loop calls it straight away (even in the middle of the game), and
+    the game shuts down after the current frame.
+    """
+    global game_is_on, window_active
+    game_is_on = False
+    window_active = False
+    if not in_frame:
+        shut_down()
+
+
+# Set up the window close handler
+# This ensures the program exits gracefully when the window is closed
+# Key releases are missed while the window is not focused, so let go of all keys then
+try:
+    screen.getcanvas().winfo_toplevel().protocol("WM_DELETE_WINDOW", on_window_close)
+    screen.getcanvas().winfo_toplevel().bind("<FocusOut>", lambda event: keyboard.release_all())
+except:
+    # If protocol setup fails, continue anyway (for compatibility)
+    pass
+
+# Start the game: draw the first frame as soon as the window is idle, then hand
+# control to the window's event loop until the window is closed
+profiler.start_frame()
+scheduler.call_later(0, frame)
+screen.mainloop()
@@ -1,72 +1,89 @@
 """
 Paddle Class for BreakOut Clone Game
 Author: Hemant Vijay
-Last Updated: 4-Nov-2025
+Last Updated: 18-Oct-2026
 
-This file defines the Paddle class which represents the player-controlled paddle
+This file defines the Paddle class which draws the player-controlled paddle
 at the bottom of the game screen. The paddle moves left and right to bounce the ball
 and prevent it from falling off the screen.
 
+The paddle's shape is registered with the screen once, already at its final size,
+so the turtle does not have to be restyled and stretched when it is created. It is
+only stretched while a wider paddle power-up is running.
+
 Project Credit: This project is part of the assignment for Angela Yu's course
 "100 Days of Code: The Complete Python Pro Bootcamp"
 Course URL: https://www.udemy.com/course/100-days-of-code/
 """
 
 from turtle import Turtle
+from engine import PADDLE_WIDTH, PADDLE_Y, PADDLE_HALF_WIDTH
 
-# Constants for paddle dimensions and movement
-PADDLE_WIDTH = 5  # Width of the paddle (stretches horizontally)
+# Constants for paddle appearance
 PADDLE_HEIGHT = 1  # Height of the paddle (thin vertical size)
 PADDLE_COLOR = "white"  # Color of the paddle on the screen
-MOVE_DISTANCE = 20  # How many pixels the paddle moves per key press
-SCREEN_EDGE = 350  # The right edge of the screen to prevent paddle from going off
+PADDLE_SHAPE = "paddle"  # Name the paddle's shape is registered under
+
+
+def register_paddle_shape(screen):
+    """
+    Register the paddle's shape with the screen: a rectangle PADDLE_WIDTH squares
+    wide and PADDLE_HEIGHT squares tall (a square is 20 pixels).
+    Call this once before creating the Paddle.
+
+    Args:
+        screen: The turtle Screen
+    """
+    # Shapes point up and the turtle faces right, so x and y are swapped here
+    half_width = PADDLE_WIDTH * 10
+    half_height = PADDLE_HEIGHT * 10
+    screen.register_shape(PADDLE_SHAPE, ((-half_height, -half_width), (half_height, -half_width),
+                                         (half_height, half_width), (-half_height, half_width)))
 
 
 class Paddle(Turtle):
     """
-    The Paddle class creates a controllable paddle at the bottom of the screen.
+    The Paddle class draws the controllable paddle at the bottom of the screen.
     This paddle is used by the player to bounce the ball and keep it in play.
-    The player can move the paddle left and right using keyboard controls.
+    The player moves it left and right with the keyboard (see controls.py);
+    the game engine works out its speed and position every step.
     """
 
-    def __init__(self, position):
+    def __init__(self, state):
         """
-        Initialize the paddle at a given position on the screen.
+        Initialize the paddle drawing at the paddle's position in the game state.
 
         Args:
-            position: A tuple (x, y) representing where to place the paddle
+            state: The GameState whose paddle this turtle shows
         """
-        super().__init__()  # Initialize the parent Turtle class
+        # Start hidden with the ready-made paddle shape (see register_paddle_shape)
+        # and without an undo history, which the game never uses
+        super().__init__(shape=PADDLE_SHAPE, undobuffersize=0, visible=False)
 
         # Set up the paddle's appearance
-        self.shape("square")  # Start with a square shape
         self.color(PADDLE_COLOR)  # Make it white to stand out on dark background
-        self.shapesize(stretch_wid=PADDLE_HEIGHT, stretch_len=PADDLE_WIDTH)  # Stretch to paddle shape
         self.penup()  # Don't draw lines when moving
-        self.goto(position)  # Move to starting position
-
-    def go_left(self):
-        """
-        Move the paddle to the left by MOVE_DISTANCE pixels.
-        This method checks that the paddle doesn't go past the left edge of the screen.
-        """
-        # Calculate new x position (current x minus move distance)
-        new_x = self.xcor() - MOVE_DISTANCE
 
-        # Only move if the paddle won't go past the left edge (-350 pixels)
-        # We subtract half the paddle width to account for paddle size
-        if new_x > -SCREEN_EDGE + (PADDLE_WIDTH * 10):
-            self.goto(new_x, self.ycor())
+        # Remember which game we are drawing and show the starting position
+        self.state = state
+        self.shown_x = None  # The x position the turtle was last moved to
+        self.shown_half_width = PADDLE_HALF_WIDTH  # The half width the shape was last stretched to
+        self.render()
+        self.showturtle()
 
-    def go_right(self):
+    def render(self):
         """
-        Move the paddle to the right by MOVE_DISTANCE pixels.
-        This method checks that the paddle doesn't go past the right edge of the screen.
+        Move the paddle turtle to the paddle's current position in the game state.
+        This method is called once per frame; the turtle is only moved if the paddle moved,
+        and only stretched if its width changed (wider paddle power-up).
         """
-        # Calculate new x position (current x plus move distance)
-        new_x = self.xcor() + MOVE_DISTANCE
+        half_width = self.state.paddle_half_width
+        if half_width != self.shown_half_width:
+            # The shape faces right, so its length is the paddle's width
+            self.shapesize(stretch_wid=1, stretch_len=half_width / PADDLE_HALF_WIDTH)
+            self.shown_half_width = half_width
 
-        # Only move if the paddle won't go past the right edge (350 pixels)
-        # We add half the paddle width to account for paddle size
-        if new_x < SCREEN_EDGE - (PADDLE_WIDTH * 10):
-            self.goto(new_x, self.ycor())
+        paddle_x = self.state.paddle_x
+        if paddle_x != self.shown_x:
+            self.goto(paddle_x, PADDLE_Y)
+            self.shown_x = paddle_x
@@ -0,0 +1,75 @@
+"""
+Canvas Item Pool for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the ItemPool class which hands out canvas items (rectangles,
+ovals and so on) and takes them back when they are no longer needed. An item
+that is given back is only hidden; the next time an item of the same kind is
+wanted, a hidden one is moved into place and shown again instead of making a
+new one.
+
+This keeps the number of items on the canvas flat however many levels are
+played: a new level reuses the rectangles of the bricks destroyed in the last
+one, so the canvas never has more items than the biggest level needs.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+
+class ItemPool:
+    """
+    The ItemPool class keeps hidden canvas items of each kind ready for reuse.
+    """
+
+    def __init__(self, canvas):
+        """
+        Initialize an empty pool.
+
+        Args:
+            canvas: The canvas the items are on (screen.getcanvas() in the game)
+        """
+        self.canvas = canvas
+        self.free = {}  # Hidden items ready for reuse, for each kind ("rectangle", "oval", ...)
+        self.created = 0  # Number of items the pool has ever made
+
+    def take(self, kind, coords, **options):
+        """
+        Get a visible item, reusing a hidden one of the same kind if there is one.
+
+        Args:
+            kind: The kind of item, as in the canvas's create_<kind> method ("rectangle", "oval", ...)
+            coords: The item's points (x1, y1, x2, y2 for rectangles and ovals) in canvas coordinates
+            **options: Item options such as fill, outline and tags
+
+        Returns:
+            The canvas item id
+        """
+        free = self.free.get(kind)
+        if free:
+            item = free.pop()
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state="normal", **options)
+            return item
+        self.created += 1
+        return getattr(self.canvas, "create_" + kind)(*coords, **options)
+
+    def give(self, kind, item):
+        """
+        Hide an item and keep it for reuse.
+
+        Args:
+            kind: The kind of item it was made as
+            item: The canvas item id
+        """
+        self.canvas.itemconfigure(item, state="hidden")
+        self.free.setdefault(kind, []).append(item)
+
+    def __len__(self):
+        """
+        Returns:
+            The number of hidden items waiting to be reused
+        """
+        return sum(len(items) for items in self.free.values())
@@ -0,0 +1,86 @@
+"""
+Power-up Drawing for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the PowerUpManager class which draws the power-ups falling from
+destroyed bricks (see engine.py). Each power-up is a small colored capsule: cyan
+for a wider paddle, magenta for a slower ball, pink for an extra life and white
+for an extra ball.
+
+Like the bricks, the capsules are plain rectangles on the canvas, taken from an
+ItemPool (see pool.py) and given back to it when caught or lost, so however many
+power-ups fall, no new canvas items are made once the pool has enough.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+from array import array
+
+from engine import POWERUP_HALF_WIDTH, POWERUP_HALF_HEIGHT
+from pool import ItemPool
+
+# Constants for power-up appearance
+POWERUP_COLORS = ["cyan", "magenta", "pink", "white"]  # Color for each kind of power-up (POWERUP_* in engine.py)
+POWERUP_TAG = "powerup"  # Canvas tag shared by every capsule
+
+
+class PowerUpManager:
+    """
+    The PowerUpManager class draws every power-up that is falling.
+    Capsule number i always shows power-up number i of the game state.
+    """
+
+    def __init__(self, state, canvas, pool=None):
+        """
+        Initialize the power-up drawing (nothing is falling yet).
+
+        Args:
+            state: The GameState whose power-ups this manager shows
+            canvas: The canvas to draw on (screen.getcanvas() in the game)
+            pool: The ItemPool to take rectangles from and give them back to
+                (a new one if not given, or the BrickManager's to share it)
+        """
+        self.state = state
+        self.canvas = canvas
+        self.pool = ItemPool(canvas) if pool is None else pool
+        self.items = []  # Canvas item of each capsule shown
+        self.kinds = array("B")  # Kind of power-up each capsule is colored for
+
+    def render(self):
+        """
+        Move the capsules to where the power-ups are in the game state.
+        This method is called once per frame. Capsules are only taken from the pool
+        or given back when the number of falling power-ups changes (after a new
+        level starts there are none left, so they all go back).
+        """
+        state = self.state
+        count = len(state.powerup_x)
+        items = self.items
+        if not count and not items:
+            return
+
+        # Give back the capsules of power-ups that were caught or lost
+        while len(items) > count:
+            self.pool.give("rectangle", items.pop())
+            self.kinds.pop()
+
+        for index in range(count):
+            # Turtle y grows upwards but canvas y grows downwards, so flip it
+            x = state.powerup_x[index]
+            y = -state.powerup_y[index]
+            coords = (x - POWERUP_HALF_WIDTH, y - POWERUP_HALF_HEIGHT, x + POWERUP_HALF_WIDTH, y + POWERUP_HALF_HEIGHT)
+            kind = state.powerup_kind[index]
+            color = POWERUP_COLORS[kind]
+            if index == len(items):
+                items.append(self.pool.take("rectangle", coords, fill=color, outline=color,
+                                             tags=POWERUP_TAG))
+                self.kinds.append(kind)
+                continue
+            self.canvas.coords(items[index], *coords)
+            if self.kinds[index] != kind:
+                # A power-up was removed and the last one moved into its place
+                self.canvas.itemconfigure(items[index], fill=color, outline=color)
+                self.kinds[index] = kind
@@ -0,0 +1,260 @@
+"""
+Frame Profiler for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the FrameProfiler class which measures where the time of each
+frame goes: sleeping until the frame is due, simulating the game, brick collision
+checks, drawing the game objects and updating the screen. The last few thousand
+frame times are kept in a ring buffer (a fixed-size array that wraps around), so
+the profiler never grows however long the game runs. From it we get p50/p95/p99
+frame times and a histogram, which can be shown on screen and saved as JSON.
+
+When profiling is turned off the game uses NullProfiler, whose methods do nothing,
+and the collision timer is never installed, so the cost is close to zero.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import json
+import time
+from array import array
+
+import engine
+
+# Names of the phases of a frame, in the order they happen
+PHASE_SLEEP = "sleep"  # Waiting for the next frame to be due
+PHASE_SIMULATE = "simulate"  # Running engine steps (not counting collision checks)
+PHASE_COLLISION = "collision"  # Brick collision checks inside the engine steps
+PHASE_DRAW = "draw"  # Moving turtles and updating canvas items
+PHASE_SCREEN = "screen_update"  # screen.update() redrawing the window
+PHASES = [PHASE_SLEEP, PHASE_SIMULATE, PHASE_COLLISION, PHASE_DRAW, PHASE_SCREEN]
+
+# Constants for the profiler
+HISTORY_SIZE = 4096  # Number of frames kept in the ring buffers
+HISTOGRAM_BUCKETS_MS = [1, 2, 4, 8, 16.7, 33.3, 50, 100]  # Upper edges of the histogram buckets
+OVERLAY_REFRESH = 0.5  # Seconds between updates of the on-screen overlay
+OVERLAY_FONT = ("Courier", 10, "normal")  # Font of the on-screen overlay
+OVERLAY_COLOR = "gray"  # Color of the on-screen overlay
+OVERLAY_POSITION = (-390, 290)  # Top-left corner of the overlay (turtle coordinates)
+
+
+def percentiles(samples):
+    """
+    Summarize a list of timings.
+
+    Args:
+        samples: A list of numbers
+
+    Returns:
+        A dictionary with the p50, p95, p99 and max values (all 0 if there are no samples)
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": 0, "p95": 0, "p99": 0, "max": 0}
+    last = len(ordered) - 1
+    return {
+        "p50": ordered[round(last * 0.50)],
+        "p95": ordered[round(last * 0.95)],
+        "p99": ordered[round(last * 0.99)],
+        "max": ordered[last],
+    }
+
+
+class NullProfiler:
+    """
+    The NullProfiler class is used when profiling is turned off.
+    Every method does nothing.
+    """
+
+    def start_frame(self):
+        """
+        Do nothing (see FrameProfiler.start_frame).
+        """
+
+    def mark(self, phase):
+        """
+        Do nothing (see FrameProfiler.mark).
+        """
+
+    def end_frame(self):
+        """
+        Do nothing (see FrameProfiler.end_frame).
+        """
+
+    def close(self):
+        """
+        Do nothing (see FrameProfiler.close).
+        """
+
+
+class FrameProfiler:
+    """
+    The FrameProfiler class times each phase of every frame using perf_counter_ns.
+    """
+
+    def __init__(self, history=HISTORY_SIZE):
+        """
+        Initialize the profiler and start timing brick collision checks.
+
+        Args:
+            history: Number of frames kept in the ring buffers
+        """
+        self.history = history
+        self.frames = 0  # Total number of frames measured
+        self.frame_times = array("q", bytes(8 * history))  # Frame times in nanoseconds (ring buffer)
+        self.phase_times = {phase: array("q", bytes(8 * history)) for phase in PHASES}
+        self.current = dict.fromkeys(PHASES, 0)  # Phase times of the frame being measured
+        self.frame_start = 0
+        self.last_mark = 0
+        self.collision_time = 0  # Collision time measured since the last mark
+
+        # Time the engine's brick collision checks by wrapping the function
+        self.find_brick_hit = engine.find_brick_hit
+        engine.find_brick_hit = self.timed_find_brick_hit
+
+    def timed_find_brick_hit(self, state, x, y, dx, dy):
+        """
+        Call the engine's brick collision check and add its time to the collision phase.
+        """
+        start = time.perf_counter_ns()
+        hit = self.find_brick_hit(state, x, y, dx, dy)
+        self.collision_time += time.perf_counter_ns() - start
+        return hit
+
+    def close(self):
+        """
+        Stop timing brick collision checks (puts back the original engine function).
+        """
+        engine.find_brick_hit = self.find_brick_hit
+
+    def start_frame(self):
+        """
+        Start timing a new frame.
+        """
+        self.frame_start = self.last_mark = time.perf_counter_ns()
+        self.collision_time = 0
+        for phase in PHASES:
+            self.current[phase] = 0
+
+    def mark(self, phase):
+        """
+        Add the time since the last mark to a phase.
+        Collision checks made during that time are counted separately.
+
+        Args:
+            phase: One of the PHASE_* names
+        """
+        now = time.perf_counter_ns()
+        self.current[phase] += now - self.last_mark - self.collision_time
+        self.current[PHASE_COLLISION] += self.collision_time
+        self.collision_time = 0
+        self.last_mark = now
+
+    def end_frame(self):
+        """
+        Finish the frame and store its times in the ring buffers.
+        """
+        slot = self.frames % self.history
+        self.frame_times[slot] = time.perf_counter_ns() - self.frame_start
+        for phase in PHASES:
+            self.phase_times[phase][slot] = self.current[phase]
+        self.frames += 1
+
+    def recent(self, buffer):
+        """
+        Get the values of a ring buffer that hold real measurements.
+
+        Args:
+            buffer: One of the ring buffers
+
+        Returns:
+            The stored values (in no particular order)
+        """
+        return buffer[:min(self.frames, self.history)]
+
+    def histogram(self):
+        """
+        Count how many recent frames fall into each frame time bucket.
+
+        Returns:
+            A dictionary mapping a bucket label (like "<=16.7ms") to a frame count
+        """
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for ns in self.recent(self.frame_times):
+            ms = ns / 1e6
+            bucket = 0
+            while bucket < len(HISTOGRAM_BUCKETS_MS) and ms > HISTOGRAM_BUCKETS_MS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        labels = [f"<={edge}ms" for edge in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, counts))
+
+    def summary(self):
+        """
+        Summarize the recent frames.
+
+        Returns:
+            A dictionary with frame time percentiles, per-phase percentiles and
+            the histogram, with all times in milliseconds
+        """
+        def in_ms(buffer):
+            stats = percentiles(self.recent(buffer))
+            return {name: round(ns / 1e6, 4) for name, ns in stats.items()}
+
+        return {
+            "frames": self.frames,
+            "frames_kept": min(self.frames, self.history),
+            "frame_time_ms": in_ms(self.frame_times),
+            "phase_time_ms": {phase: in_ms(self.phase_times[phase]) for phase in PHASES},
+            "histogram": self.histogram(),
+        }
+
+    def dump(self, path):
+        """
+        Save the summary as a JSON file.
+
+        Args:
+            path: The file to write
+        """
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+            file.write("\n")
+
+
+class ProfilerOverlay:
+    """
+    The ProfilerOverlay class shows the frame time percentiles in a corner of the screen.
+    Like the scoreboard, it uses one canvas text item and only changes its text.
+    """
+
+    def __init__(self, profiler, canvas):
+        """
+        Initialize the overlay.
+
+        Args:
+            profiler: The FrameProfiler to show
+            canvas: The canvas to draw on (screen.getcanvas() in the game)
+        """
+        self.profiler = profiler
+        self.canvas = canvas
+        x, y = OVERLAY_POSITION
+        self.text = canvas.create_text(x, -y, text="", anchor="nw", fill=OVERLAY_COLOR, font=OVERLAY_FONT)
+        self.next_refresh = 0.0
+
+    def render(self):
+        """
+        Update the overlay text, at most every OVERLAY_REFRESH seconds.
+        """
+        now = time.perf_counter()
+        if now < self.next_refresh:
+            return
+        self.next_refresh = now + OVERLAY_REFRESH
+
+        stats = percentiles(self.profiler.recent(self.profiler.frame_times))
+        self.canvas.itemconfigure(self.text, text=(
+            f"frame p50 {stats['p50'] / 1e6:.1f} ms  "
+            f"p95 {stats['p95'] / 1e6:.1f} ms  "
+            f"p99 {stats['p99'] / 1e6:.1f} ms"))
@@ -0,0 +1,398 @@
+"""
+Offscreen Renderer for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the Rasterizer class which draws the game (bricks, paddle,
+balls, falling power-ups and the scoreboard) straight into a NumPy array of RGB pixels, without a
+window, Tk or a display server. It is used to make pictures and clips of games
+on servers (see export.py).
+
+The same pixel array is kept from frame to frame. Each frame only the areas
+that changed are painted again: where a ball, a power-up or the paddle was and
+where it is now, a destroyed brick, or the score when it changes. For each such area the
+background is filled in and everything overlapping it is drawn again, so a
+typical frame touches a few thousand pixels out of 480,000.
+
+Text is drawn with a small built-in 5 x 7 pixel font (capital letters, digits
+and a few signs), made bigger by repeating its pixels.
+
+It requires NumPy (pip install numpy).
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import numpy as np
+
+from engine import (
+    BALL_RADIUS, PADDLE_Y, PADDLE_HALF_HEIGHT,
+    BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT, POWERUP_HALF_WIDTH, POWERUP_HALF_HEIGHT,
+)
+from brick import BRICK_COLORS
+from powerup import POWERUP_COLORS
+from scoreboard import SCORE_POSITION, MESSAGE_POSITION
+
+# Constants for the picture
+WIDTH = 800  # Width of the picture in pixels (the same as the game window)
+HEIGHT = 600  # Height of the picture in pixels
+BACKGROUND_COLOR = "black"
+PADDLE_COLOR = "white"
+BALL_COLOR = "white"
+TEXT_COLOR = "white"
+SCORE_SCALE = 2  # Each font pixel of the score is drawn as a 2 x 2 block
+MESSAGE_SCALE = 5  # Each font pixel of the game over / victory message is drawn as a 5 x 5 block
+
+# RGB values of the colors the game uses (the same as Tk's color names)
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "orange": (255, 165, 0),
+    "yellow": (255, 255, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "gray": (190, 190, 190),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+    "pink": (255, 192, 203),
+}
+
+# The 5 x 7 pixel font: each character is 7 rows of 5 pixels ("#" = ink)
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+FONT = {
+    " ": (".....", ".....", ".....", ".....", ".....", ".....", "....."),
+    "A": (".###.", "#...#", "#...#", "#####", "#...#", "#...#", "#...#"),
+    "B": ("####.", "#...#", "#...#", "####.", "#...#", "#...#", "####."),
+    "C": (".###.", "#...#", "#....", "#....", "#....", "#...#", ".###."),
+    "D": ("####.", "#...#", "#...#", "#...#", "#...#", "#...#", "####."),
+    "E": ("#####", "#....", "#....", "####.", "#....", "#....", "#####"),
+    "F": ("#####", "#....", "#....", "####.", "#....", "#....", "#...."),
+    "G": (".###.", "#...#", "#....", "#.###", "#...#", "#...#", ".####"),
+    "H": ("#...#", "#...#", "#...#", "#####", "#...#", "#...#", "#...#"),
+    "I": (".###.", "..#..", "..#..", "..#..", "..#..", "..#..", ".###."),
+    "J": ("..###", "...#.", "...#.", "...#.", "...#.", "#..#.", ".##.."),
+    "K": ("#...#", "#..#.", "#.#..", "##...", "#.#..", "#..#.", "#...#"),
+    "L": ("#....", "#....", "#....", "#....", "#....", "#....", "#####"),
+    "M": ("#...#", "##.##", "#.#.#", "#.#.#", "#...#", "#...#", "#...#"),
+    "N": ("#...#", "#...#", "##..#", "#.#.#", "#..##", "#...#", "#...#"),
+    "O": (".###.", "#...#", "#...#", "#...#", "#...#", "#...#", ".###."),
+    "P": ("####.", "#...#", "#...#", "####.", "#....", "#....", "#...."),
+    "Q": (".###.", "#...#", "#...#", "#...#", "#.#.#", "#..#.", ".##.#"),
+    "R": ("####.", "#...#", "#...#", "####.", "#.#..", "#..#.", "#...#"),
+    "S": (".####", "#....", "#....", ".###.", "....#", "....#", "####."),
+    "T": ("#####", "..#..", "..#..", "..#..", "..#..", "..#..", "..#.."),
+    "U": ("#...#", "#...#", "#...#", "#...#", "#...#", "#...#", ".###."),
+    "V": ("#...#", "#...#", "#...#", "#...#", "#...#", ".#.#.", "..#.."),
+    "W": ("#...#", "#...#", "#...#", "#.#.#", "#.#.#", "#.#.#", ".#.#."),
+    "X": ("#...#", "#...#", ".#.#.", "..#..", ".#.#.", "#...#", "#...#"),
+    "Y": ("#...#", "#...#", ".#.#.", "..#..", "..#..", "..#..", "..#.."),
+    "Z": ("#####", "....#", "...#.", "..#..", ".#...", "#....", "#####"),
+    "0": (".###.", "#...#", "#..##", "#.#.#", "##..#", "#...#", ".###."),
+    "1": ("..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."),
+    "2": (".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"),
+    "3": ("#####", "...#.", "..#..", "...#.", "....#", "#...#", ".###."),
+    "4": ("...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."),
+    "5": ("#####", "#....", "####.", "....#", "....#", "#...#", ".###."),
+    "6": ("..##.", ".#...", "#....", "####.", "#...#", "#...#", ".###."),
+    "7": ("#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."),
+    "8": (".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."),
+    "9": (".###.", "#...#", "#...#", ".####", "....#", "...#.", ".##.."),
+    ":": (".....", "..#..", "..#..", ".....", "..#..", "..#..", "....."),
+    "|": ("..#..", "..#..", "..#..", "..#..", "..#..", "..#..", "..#.."),
+    "!": ("..#..", "..#..", "..#..", "..#..", "..#..", ".....", "..#.."),
+    ".": (".....", ".....", ".....", ".....", ".....", ".##..", ".##.."),
+    "-": (".....", ".....", ".....", "#####", ".....", ".....", "....."),
+}
+
+
+def text_mask(text, scale):
+    """
+    Turn a line of text into a true/false pixel mask using the built-in font.
+    Lowercase letters are drawn as capitals and unknown characters as spaces.
+
+    Args:
+        text: The text to draw
+        scale: How many pixels wide and tall each font pixel is
+
+    Returns:
+        A 2D NumPy bool array (True where there is ink)
+    """
+    columns = []
+    for char in text.upper():
+        glyph = FONT.get(char, FONT[" "])
+        columns.append(np.array([[pixel == "#" for pixel in row] for row in glyph], dtype=bool))
+        columns.append(np.zeros((GLYPH_HEIGHT, 1), dtype=bool))  # One pixel gap between characters
+    if not columns:
+        return np.zeros((0, 0), dtype=bool)
+    mask = np.hstack(columns[:-1])
+    return mask.repeat(scale, axis=0).repeat(scale, axis=1)
+
+
+def scoreboard_text(state, show_level=False, first_level=0):
+    """
+    Make the score line the game shows (the same as Scoreboard.update_scoreboard).
+
+    Args:
+        state: The GameState
+        show_level: Also show the level number
+        first_level: Number of the level the game started at (0 = the first)
+
+    Returns:
+        The text
+    """
+    text = f"Score: {state.score} | Lives: {state.lives}"
+    if show_level:
+        text += f" | Level: {first_level + state.level + 1}"
+    return text
+
+
+def message_text(state):
+    """
+    Make the message shown in the middle of the screen when the game has ended.
+
+    Args:
+        state: The GameState
+
+    Returns:
+        "YOU WIN!", "GAME OVER" or "" while the game is still going
+    """
+    if state.game_is_on:
+        return ""
+    return "YOU WIN!" if state.won else "GAME OVER"
+
+
+class Rasterizer:
+    """
+    The Rasterizer class draws a game into an RGB pixel array that is kept and
+    only partly repainted from one frame to the next.
+    """
+
+    def __init__(self, state, width=WIDTH, height=HEIGHT, show_level=False, first_level=0):
+        """
+        Initialize the renderer. Nothing is drawn until the first render().
+
+        Args:
+            state: The GameState to draw
+            width: Width of the picture in pixels
+            height: Height of the picture in pixels
+            show_level: Also show the level number in the score line
+            first_level: Number of the level the game started at (0 = the first)
+        """
+        self.state = state
+        self.width = width
+        self.height = height
+        self.show_level = show_level
+        self.first_level = first_level
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)  # The picture, row by row (y grows downwards)
+
+        # A filled circle the size of the ball, used as a stamp
+        offsets = np.arange(-BALL_RADIUS, BALL_RADIUS + 1)
+        self.ball_mask = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= BALL_RADIUS * BALL_RADIUS
+
+        # What the picture shows right now, to work out what changed at the next render()
+        self.shown_level = None  # Level number and brick count the bricks were drawn for
+        self.shown_alive = bytearray()  # The brick alive bits when the bricks were last drawn
+        self.paddle_box = None  # Pixel box of the paddle
+        self.ball_boxes = []  # Pixel box of each ball
+        self.powerup_boxes = []  # (pixel box, color) of each falling power-up
+        self.texts = {}  # Text shown at each position: (scale, x, y) -> (text, mask, box)
+
+    def box(self, x, y, half_width, half_height):
+        """
+        Work out the pixel box of something centered on a point in game coordinates.
+
+        Args:
+            x, y: The center in game coordinates (y grows upwards, 0 is the middle)
+            half_width, half_height: Half its size in pixels
+
+        Returns:
+            A tuple (left, top, right, bottom) in pixels, right and bottom not included
+        """
+        left = round(x - half_width + self.width / 2)
+        top = round(self.height / 2 - y - half_height)
+        return left, top, left + round(2 * half_width), top + round(2 * half_height)
+
+    def ball_box(self, ball):
+        """
+        Returns:
+            The pixel box of a ball (its circle stamp)
+        """
+        left = round(self.state.ball_x[ball] + self.width / 2) - BALL_RADIUS
+        top = round(self.height / 2 - self.state.ball_y[ball]) - BALL_RADIUS
+        size = 2 * BALL_RADIUS + 1
+        return left, top, left + size, top + size
+
+    def text_box(self, text, position, scale):
+        """
+        Work out where a line of text goes: its bottom center sits on the position,
+        like the scoreboard's text.
+
+        Args:
+            text: The text
+            position: A tuple (x, y) in game coordinates
+            scale: The font scale
+
+        Returns:
+            A tuple (mask, box)
+        """
+        mask = text_mask(text, scale)
+        height, width = mask.shape
+        left = round(position[0] + self.width / 2 - width / 2)
+        bottom = round(self.height / 2 - position[1])
+        return mask, (left, bottom - height, left + width, bottom)
+
+    def render(self):
+        """
+        Bring the picture up to date with the game state.
+        Only the areas that changed since the last render() are painted again.
+
+        Returns:
+            The list of pixel boxes (left, top, right, bottom) that were painted
+        """
+        state = self.state
+        dirty = []
+
+        # A new level (or the first frame) repaints everything
+        level = (state.level, len(state.brick_x))
+        if level != self.shown_level:
+            self.shown_level = level
+            dirty.append((0, 0, self.width, self.height))
+        else:
+            # Destroyed bricks: compare the alive bits with the ones drawn last time
+            alive = state.brick_alive
+            for byte in range(len(alive)):
+                gone = self.shown_alive[byte] & ~alive[byte]
+                while gone:
+                    bit = gone & -gone
+                    index = byte * 8 + bit.bit_length() - 1
+                    dirty.append(self.box(state.brick_x[index], state.brick_y[index],
+                                          BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT))
+                    gone ^= bit
+        self.shown_alive = bytearray(state.brick_alive)
+
+        # The paddle and the balls: repaint where they were and where they are now
+        paddle_box = self.box(state.paddle_x, PADDLE_Y, state.paddle_half_width, PADDLE_HALF_HEIGHT)
+        if paddle_box != self.paddle_box:
+            if self.paddle_box:
+                dirty.append(self.paddle_box)
+            dirty.append(paddle_box)
+            self.paddle_box = paddle_box
+        ball_boxes = [self.ball_box(ball) for ball in range(len(state.ball_x))]
+        if ball_boxes != self.ball_boxes:
+            dirty.extend(self.ball_boxes)
+            dirty.extend(ball_boxes)
+            self.ball_boxes = ball_boxes
+        powerup_boxes = [(self.box(state.powerup_x[index], state.powerup_y[index],
+                                   POWERUP_HALF_WIDTH, POWERUP_HALF_HEIGHT),
+                          POWERUP_COLORS[state.powerup_kind[index]]) for index in range(len(state.powerup_x))]
+        if powerup_boxes != self.powerup_boxes:
+            dirty.extend(box for box, _ in self.powerup_boxes)
+            dirty.extend(box for box, _ in powerup_boxes)
+            self.powerup_boxes = powerup_boxes
+
+        # The score line and the message: repaint when their text changes
+        score_line = scoreboard_text(state, self.show_level, self.first_level)
+        for text, position, scale in ((score_line, SCORE_POSITION, SCORE_SCALE),
+                                      (message_text(state), MESSAGE_POSITION, MESSAGE_SCALE)):
+            key = (scale,) + position
+            shown = self.texts.get(key)
+            if shown is None or shown[0] != text:
+                if shown:
+                    dirty.append(shown[2])
+                mask, box = self.text_box(text, position, scale)
+                self.texts[key] = (text, mask, box)
+                dirty.append(box)
+
+        painted = []
+        for area in dirty:
+            area = self.clip(area)
+            if area:
+                self.paint(area)
+                painted.append(area)
+        return painted
+
+    def clip(self, area):
+        """
+        Cut a pixel box down to the part inside the picture.
+
+        Args:
+            area: A tuple (left, top, right, bottom)
+
+        Returns:
+            The clipped box, or None if nothing of it is inside the picture
+        """
+        left, top, right, bottom = area
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, self.width), min(bottom, self.height)
+        if left >= right or top >= bottom:
+            return None
+        return left, top, right, bottom
+
+    def paint(self, area):
+        """
+        Paint one area of the picture again: background first, then every
+        brick, the power-ups, the paddle, the balls and the text that overlap it.
+
+        Args:
+            area: A clipped pixel box (left, top, right, bottom)
+        """
+        state = self.state
+        left, top, right, bottom = area
+        self.pixels[top:bottom, left:right] = COLORS[BACKGROUND_COLOR]
+
+        # Bricks: ask the game's brick grid which bricks are near this area
+        half_width = self.width / 2
+        half_height = self.height / 2
+        candidates = state.brick_grid.query_box(
+            left - half_width - BRICK_HALF_WIDTH, half_height - bottom - BRICK_HALF_HEIGHT,
+            right - half_width + BRICK_HALF_WIDTH, half_height - top + BRICK_HALF_HEIGHT)
+        alive = state.brick_alive
+        for index in candidates:
+            if alive[index >> 3] & (1 << (index & 7)):
+                color = BRICK_COLORS[min(state.brick_type[index], len(BRICK_COLORS) - 1)]
+                self.fill(area, self.box(state.brick_x[index], state.brick_y[index],
+                                         BRICK_HALF_WIDTH, BRICK_HALF_HEIGHT), color)
+
+        for box, color in self.powerup_boxes:
+            self.fill(area, box, color)
+        if self.paddle_box:
+            self.fill(area, self.paddle_box, PADDLE_COLOR)
+        for box in self.ball_boxes:
+            self.stamp(area, box, self.ball_mask, BALL_COLOR)
+        for text, mask, box in self.texts.values():
+            if text:
+                self.stamp(area, box, mask, TEXT_COLOR)
+
+    def fill(self, area, box, color):
+        """
+        Fill the part of a box that lies inside an area with one color.
+
+        Args:
+            area: The area being painted (left, top, right, bottom)
+            box: The box to fill
+            color: A color name from COLORS
+        """
+        left, top = max(area[0], box[0]), max(area[1], box[1])
+        right, bottom = min(area[2], box[2]), min(area[3], box[3])
+        if left < right and top < bottom:
+            self.pixels[top:bottom, left:right] = COLORS[color]
+
+    def stamp(self, area, box, mask, color):
+        """
+        Color the pixels of a mask (like the ball's circle or a line of text)
+        that lie inside an area.
+
+        Args:
+            area: The area being painted (left, top, right, bottom)
+            box: Where the mask's pixels go (its size matches the mask)
+            mask: A 2D NumPy bool array
+            color: A color name from COLORS
+        """
+        left, top = max(area[0], box[0]), max(area[1], box[1])
+        right, bottom = min(area[2], box[2]), min(area[3], box[3])
+        if left < right and top < bottom:
+            part = mask[top - box[1]:bottom - box[1], left - box[0]:right - box[0]]
+            self.pixels[top:bottom, left:right][part] = COLORS[color]
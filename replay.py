@@ -0,0 +1,239 @@
+"""
+Input Recording and Replay for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file records which paddle keys the player holds, together with the tick the
+keys changed on, and plays them back later. The game engine is deterministic,
+so feeding the same keys into the same ticks gives exactly the same game.
+
+A recording is a small binary file: a header followed by one 4-byte record each
+time the held keys change (the tick number and the INPUT_* flags packed into one
+integer). Replays
+run without sleeping or drawing, so a 10-minute game replays in a fraction of a
+second. While replaying, a copy of the game is kept every CHECKPOINT_INTERVAL
+ticks, so jumping to any tick only replays the ticks since the nearest checkpoint.
+
+Run a recording from the command line with:
+    python replay.py game.rec
+    python replay.py game.rec --seek 5000
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+
+from engine import GameState, step, TIME_STEP
+
+# Constants for the recording file format
+MAGIC = b"BRKREPLY"  # First bytes of every recording file
+FORMAT_VERSION = 2  # Bump when the file layout changes (2: records hold the keys held from that tick on)
+HEADER = struct.Struct("<8sHdI")  # Magic, version, time step, last tick
+INPUT_BITS = 2  # Low bits of each record hold the INPUT_* flags, the rest the tick
+CHECKPOINT_INTERVAL = 1200  # Ticks between saved copies of the game (10 seconds)
+
+
+def pack_record(tick, inputs):
+    """
+    Pack one change of the held keys into a single integer.
+
+    Args:
+        tick: The tick the keys changed on
+        inputs: The INPUT_* flags held from that tick on
+
+    Returns:
+        The packed record
+    """
+    return (tick << INPUT_BITS) | inputs
+
+
+class InputRecorder:
+    """
+    The InputRecorder class remembers every change of the held paddle keys during a game.
+    """
+
+    def __init__(self, state):
+        """
+        Initialize an empty recording for a game.
+
+        Args:
+            state: The GameState being played (its tick number is recorded with each change)
+        """
+        self.state = state
+        self.records = array("I")  # Packed (tick, inputs) records in the order they happened
+        self.inputs = 0  # The keys held at the last record
+
+    def record(self, inputs):
+        """
+        Record the keys held for the next tick. Called before every step, but
+        only stored when the keys are different from the last step.
+
+        Args:
+            inputs: The INPUT_* flags held during the next step
+        """
+        if inputs != self.inputs:
+            self.records.append(pack_record(self.state.tick, inputs))
+            self.inputs = inputs
+
+    def save(self, path):
+        """
+        Write the recording to a binary file.
+
+        Args:
+            path: The file to write
+        """
+        records = array("I", self.records)
+        if sys.byteorder == "big":
+            records.byteswap()  # The file is always little-endian
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, TIME_STEP, self.state.tick))
+            records.tofile(file)
+
+
+class NullRecorder:
+    """
+    The NullRecorder class is used when the game is not being recorded.
+    Every method does nothing, so no recording is kept in memory.
+    """
+
+    def record(self, inputs):
+        """
+        Do nothing (see InputRecorder.record).
+        """
+
+    def save(self, path):
+        """
+        Do nothing (see InputRecorder.save).
+        """
+
+
+class Replay:
+    """
+    The Replay class plays a recording back without a window.
+    """
+
+    def __init__(self, records, last_tick, time_step=TIME_STEP):
+        """
+        Initialize the replay from a list of records.
+
+        Args:
+            records: Packed (tick, inputs) records in tick order
+            last_tick: The tick the recording stopped at
+            time_step: The time step the game was recorded with
+        """
+        self.records = records
+        self.last_tick = last_tick
+        self.time_step = time_step
+
+        # Copies of the game every CHECKPOINT_INTERVAL ticks, starting with tick 0
+        self.checkpoints = [GameState()]
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording file.
+
+        Args:
+            path: The file to read
+
+        Returns:
+            A Replay ready to play
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, time_step, last_tick = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a BreakOut recording")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} uses recording format {version}, expected {FORMAT_VERSION}")
+
+        records = array("I")
+        records.frombytes(data[HEADER.size:])
+        if sys.byteorder == "big":
+            records.byteswap()
+        return cls(records, last_tick, time_step)
+
+    def play(self, state, until_tick):
+        """
+        Play the recorded keys forward from the state's current tick.
+        Checkpoints are saved along the way.
+
+        Args:
+            state: The GameState to advance (changed in place)
+            until_tick: Stop once the game reaches this tick (or is over)
+        """
+        records = self.records
+        position = bisect_left(records, state.tick << INPUT_BITS)
+        count = len(records)
+        mask = (1 << INPUT_BITS) - 1
+
+        # The keys held at the start are the ones from the last earlier record
+        inputs = records[position - 1] & mask if position > 0 else 0
+
+        while state.game_is_on and state.tick < until_tick:
+            # Pick up any change of the held keys made before this tick
+            while position < count and records[position] >> INPUT_BITS == state.tick:
+                inputs = records[position] & mask
+                position += 1
+
+            step(state, inputs, self.time_step)
+
+            # Keep a copy of the game every CHECKPOINT_INTERVAL ticks
+            if state.tick % CHECKPOINT_INTERVAL == 0 and state.tick // CHECKPOINT_INTERVAL == len(self.checkpoints):
+                self.checkpoints.append(state.copy())
+
+    def seek(self, tick):
+        """
+        Get the game as it was at a given tick.
+        Only the ticks since the nearest earlier checkpoint are replayed.
+
+        Args:
+            tick: The tick to jump to
+
+        Returns:
+            A new GameState at that tick (or at the end of the game if it ended earlier)
+        """
+        tick = min(tick, self.last_tick)
+        index = min(tick // CHECKPOINT_INTERVAL, len(self.checkpoints) - 1)
+        state = self.checkpoints[index].copy()
+        self.play(state, tick)
+        return state
+
+    def run(self):
+        """
+        Play the whole recording.
+
+        Returns:
+            The GameState at the end of the recording
+        """
+        return self.seek(self.last_tick)
+
+
+def main():
+    """
+    Replay a recording from the command line and print the result.
+    """
+    parser = argparse.ArgumentParser(description="Replay a BreakOut recording without a window.")
+    parser.add_argument("recording", help="the recording file (made with main.py --record)")
+    parser.add_argument("--seek", type=int, help="stop at this tick instead of the end")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.recording)
+    start = time.perf_counter()
+    state = replay.seek(replay.last_tick if args.seek is None else args.seek)
+    elapsed = time.perf_counter() - start
+
+    print(f"Tick: {state.tick} of {replay.last_tick} ({state.tick * replay.time_step:.1f} s of game time)")
+    print(f"Score: {state.score} | Lives: {state.lives} | Bricks left: {state.bricks_left}")
+    print(f"Replayed {state.tick} ticks ({len(replay.records)} recorded key changes in total) in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
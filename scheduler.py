@@ -0,0 +1,129 @@
+"""
+Event Loop Scheduler for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the Scheduler class which runs the game on the window's own
+event loop instead of a while loop with sleeps. Every frame, and every background
+job such as saving telemetry, is a timer (screen.ontimer, which is Tk's "after").
+Between timers the window handles its own events, so closing the window or
+pressing a key is noticed straight away.
+
+Slow work that waits on files or the network runs on a small pool of worker
+threads so it never holds up a frame. When a job finishes, its result is handed
+back on the main thread, because turtle and Tk may only be used from there.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+# Constants for the scheduler
+BACKGROUND_WORKERS = 2  # Threads used for slow background jobs (file and network I/O)
+POLL_INTERVAL = 0.05  # Seconds between checks for finished background jobs
+
+
+class Scheduler:
+    """
+    The Scheduler class runs callbacks on the screen's event loop, once or
+    repeatedly, and runs slow jobs on worker threads.
+    """
+
+    def __init__(self, screen, workers=BACKGROUND_WORKERS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            screen: The turtle Screen whose event loop runs the callbacks
+            workers: Number of threads for background jobs
+        """
+        self.screen = screen
+        self.running = True  # Timers stop firing once this is False
+        self.workers = workers
+        self.executor = None  # The worker threads, started by the first background job
+        self.pending = []  # (future, done callback) of background jobs still to hand back
+        self.call_every(POLL_INTERVAL, self.poll)
+
+    def call_later(self, delay, callback):
+        """
+        Call a function once on the event loop.
+
+        Args:
+            delay: Seconds to wait (0 = as soon as the window is idle)
+            callback: A function with no arguments; it should return quickly
+        """
+        def fire():
+            if self.running:
+                callback()
+        self.screen.ontimer(fire, max(round(delay * 1000), 0))
+
+    def call_every(self, interval, callback):
+        """
+        Call a function on the event loop every few seconds until the scheduler stops.
+
+        Args:
+            interval: Seconds between calls
+            callback: A function with no arguments; it should return quickly
+        """
+        def fire():
+            if not self.running:
+                return
+            try:
+                callback()
+            except Exception as error:
+                # Report the error, but keep the job going: it may well work next time
+                print(f"Repeating job {getattr(callback, '__qualname__', callback)} failed: "
+                      f"{type(error).__name__}: {error}")
+            self.call_later(interval, fire)
+        self.call_later(interval, fire)
+
+    def run_in_background(self, function, *args, done=None):
+        """
+        Run a slow function on a worker thread. The function must not use turtle or Tk.
+
+        Args:
+            function: The function to run
+            *args: Arguments for the function
+            done: Optional function called on the main thread with the finished
+                  Future (use future.result() to get the result or the error)
+
+        Returns:
+            The Future of the job
+        """
+        if self.executor is None:
+            # Imported and started here, so games without background jobs start faster
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="background")
+        future = self.executor.submit(function, *args)
+        if done is not None:
+            self.pending.append((future, done))
+        return future
+
+    def poll(self):
+        """
+        Hand every finished background job to its done callback.
+        Runs on the event loop every POLL_INTERVAL seconds.
+        """
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        for future, done in pending:
+            if not future.done():
+                self.pending.append((future, done))
+                continue
+            try:
+                done(future)
+            except Exception as error:
+                # One bad callback must not stop the others from being handed their results
+                print(f"Background job callback failed: {type(error).__name__}: {error}")
+
+    def stop(self, wait=True):
+        """
+        Stop all timers and the worker threads.
+
+        Args:
+            wait: Wait for background jobs that were already started (such as a last save)
+        """
+        self.running = False
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
@@ -1,110 +1,141 @@
 """
 Scoreboard Class for BreakOut Clone Game
 Author: Hemant Vijay
-Last Updated: 4-Nov-2025
+Last Updated: 18-Oct-2026
 
 This file defines the Scoreboard class which displays the player's score and
 remaining lives on the screen. It updates as the player destroys bricks and
-loses lives when the ball falls off the screen.
+loses lives when the ball falls off the screen. The numbers themselves are
+kept in the game state (see engine.py).
 
 Project Credit: This project is part of the assignment for Angela Yu's course
 "100 Days of Code: The Complete Python Pro Bootcamp"
 Course URL: https://www.udemy.com/course/100-days-of-code/
 """
 
-from turtle import Turtle
-
 # Constants for scoreboard properties
 FONT = ("Courier", 16, "normal")  # Font style for displaying text
-ALIGNMENT = "center"  # Center-align the text
+MESSAGE_FONT = ("Courier", 40, "bold")  # Font style for the game over / victory message
+ALIGNMENT = "s"  # Anchor text by its bottom center (like turtle's "center" alignment)
 SCORE_COLOR = "white"  # Color of the score text
-STARTING_LIVES = 3  # Number of lives the player starts with
+SCORE_POSITION = (0, 270)  # Position of the score text (top center of screen)
+MESSAGE_POSITION = (0, 0)  # Position of the game over / victory message
+TABLE_FONT = ("Courier", 14, "normal")  # Font style for the high score table
+TABLE_POSITION = (0, -20)  # Position of the top of the high score table (below the message)
 
 
-class Scoreboard(Turtle):
+class Scoreboard:
     """
     The Scoreboard class displays the current score and lives remaining.
     It updates whenever the player destroys a brick or loses a life.
     The scoreboard is positioned at the top of the screen.
+
+    The text is drawn as canvas text items that are created once and then only
+    have their text changed. Changes are collected during a frame and shown
+    together by render(), so many score events in one frame cost one redraw.
     """
 
-    def __init__(self):
+    def __init__(self, state, canvas, show_level=False, first_level=0):
         """
-        Initialize the scoreboard with starting score and lives.
-        Display the initial scoreboard at the top of the screen.
+        Initialize the scoreboard and display the starting score and lives.
+
+        Args:
+            state: The GameState whose score and lives this scoreboard shows
+            canvas: The canvas to draw on (screen.getcanvas() in the game)
+            show_level: Also show the level number (when several levels are played)
+            first_level: Number of the level pack level the game started at (0 = the first),
+                so the level shown is the one in the pack
         """
-        super().__init__()  # Initialize the parent Turtle class
+        # Remember which game we are showing and where to draw it
+        self.state = state
+        self.canvas = canvas
+        self.show_level = show_level
+        self.first_level = first_level
 
-        # Initialize score and lives
-        self.score = 0  # Player starts with 0 points
-        self.lives = STARTING_LIVES  # Player starts with 3 lives
+        # Create the text items once (turtle y grows upwards, canvas y grows downwards)
+        self.score_text = self.create_text(SCORE_POSITION, FONT)
+        self.message_text = self.create_text(MESSAGE_POSITION, MESSAGE_FONT)
+        self.table_text = self.create_text(TABLE_POSITION, TABLE_FONT, anchor="n")
 
-        # Set up the scoreboard appearance
-        self.color(SCORE_COLOR)  # Make text white
-        self.penup()  # Don't draw lines
-        self.hideturtle()  # Hide the turtle cursor
-        self.goto(0, 270)  # Position at top center of screen
+        self.shown = {}  # The text each item currently shows
+        self.pending = {}  # New text for each item, shown at the next render()
 
         # Display the initial scoreboard
         self.update_scoreboard()
+        self.render()
 
-    def update_scoreboard(self):
+    def create_text(self, position, font, anchor=ALIGNMENT):
         """
-        Clear the old scoreboard and display the updated score and lives.
-        This method is called whenever the score or lives change.
-        """
-        # Clear the previous text
-        self.clear()
+        Create an empty text item on the canvas.
 
-        # Write the new score and lives to the screen
-        # Format: "Score: 0 | Lives: 3"
-        self.write(f"Score: {self.score} | Lives: {self.lives}",
-                   align=ALIGNMENT,
-                   font=FONT)
+        Args:
+            position: A tuple (x, y) in turtle coordinates
+            font: The font to use
+            anchor: Which point of the text sits at the position (like "s" for bottom center)
 
-    def increase_score(self, points):
+        Returns:
+            The canvas item id
         """
-        Increase the player's score by a certain number of points.
-        This is called when a brick is destroyed.
+        x, y = position
+        return self.canvas.create_text(x, -y, text="", anchor=anchor, fill=SCORE_COLOR, font=font,
+                                       justify="center")
 
-        Args:
-            points: The number of points to add to the score
+    def set_text(self, item, text):
         """
-        # Add points to the current score
-        self.score += points
+        Remember new text for an item; it is shown at the next render().
 
-        # Update the display
-        self.update_scoreboard()
+        Args:
+            item: The canvas item id
+            text: The text to show
+        """
+        self.pending[item] = text
 
-    def decrease_lives(self):
+    def render(self):
         """
-        Decrease the player's remaining lives by 1.
-        This is called when the ball falls off the bottom of the screen.
+        Show all text changes made since the last frame.
+        Items whose text did not actually change are not touched.
         """
-        # Subtract one life
-        self.lives -= 1
+        if not self.pending:
+            return
+        for item, text in self.pending.items():
+            if self.shown.get(item) != text:
+                self.canvas.itemconfigure(item, text=text)
+                self.shown[item] = text
+        self.pending.clear()
 
-        # Update the display
-        self.update_scoreboard()
+    def update_scoreboard(self):
+        """
+        Show the updated score and lives at the next render().
+        This method is called whenever the score, lives or level change.
+        """
+        # Format: "Score: 0 | Lives: 3" (with " | Level: 1" added when several levels are played)
+        text = f"Score: {self.state.score} | Lives: {self.state.lives}"
+        if self.show_level:
+            text += f" | Level: {self.first_level + self.state.level + 1}"
+        self.set_text(self.score_text, text)
 
     def game_over(self):
         """
         Display a "GAME OVER" message in the center of the screen.
         This is called when the player runs out of lives.
         """
-        # Move to center of screen
-        self.goto(0, 0)
-
-        # Display game over message
-        self.write("GAME OVER", align=ALIGNMENT, font=("Courier", 40, "bold"))
+        self.set_text(self.message_text, "GAME OVER")
 
     def you_win(self):
         """
         Display a "YOU WIN!" message in the center of the screen.
         This is called when the player destroys all the bricks.
         """
-        # Move to center of screen
-        self.goto(0, 0)
+        self.set_text(self.message_text, "YOU WIN!")
+
+    def show_high_scores(self, top_scores):
+        """
+        Display the high score table below the game over / victory message.
 
-        # Display victory message
-        self.write("YOU WIN!", align=ALIGNMENT, font=("Courier", 40, "bold"))
+        Args:
+            top_scores: A list of (player, score) pairs, best first
+        """
+        lines = ["HIGH SCORES"]
+        for place, (player, score) in enumerate(top_scores, start=1):
+            lines.append(f"{place:2}. {player[:12]:<12} {score:6}")
+        self.set_text(self.table_text, "\n".join(lines))
@@ -0,0 +1,452 @@
+"""
+Background Services for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file defines the jobs that run alongside the game on the Scheduler
+(see scheduler.py):
+- Telemetry samples the game every second and writes the samples to a JSON lines
+  file every few seconds.
+- Autosave writes a copy of the game to disk every few seconds, so a game can be
+  resumed later with main.py --resume. Save files hold only numbers (a header
+  and the game's array columns), and the save is deleted once the game is over.
+- LeaderboardClient sends the score to a leaderboard service. LeaderboardStandIn
+  is a tiny local HTTP service with the same interface, for playing offline and
+  for testing.
+
+Anything that touches the game state runs on the main thread and only takes a
+quick copy; writing files and talking to the network happens on worker threads.
+When a job fails, the error is kept in the service's error attribute and
+reported once on the console; the game goes on and the job tries again next time.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from engine import (
+    GameState, BRICK_POINTS, BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y, POWERUP_KINDS,
+)
+from spatial import BrickGrid
+
+# Constants for the background services
+TELEMETRY_INTERVAL = 1.0  # Seconds between telemetry samples
+TELEMETRY_FLUSH_INTERVAL = 5.0  # Seconds between writes of the telemetry file
+AUTOSAVE_INTERVAL = 10.0  # Seconds between autosaves
+LEADERBOARD_INTERVAL = 15.0  # Seconds between score updates sent to the leaderboard
+LEADERBOARD_TIMEOUT = 2.0  # Seconds to wait for the leaderboard service to answer
+
+# Constants for the save file format (a header, the game's numbers, then each array column)
+SAVE_MAGIC = b"BRKSAVED"  # First bytes of every save file
+SAVE_VERSION = 1  # Bump when the file layout changes
+SAVE_HEADER = struct.Struct("<8sH")  # Magic, version
+SAVE_NUMBERS = struct.Struct("<HddIIHIH??ddBI")  # Balls served, paddle x and speed, bricks left, score, lives,
+# tick, level, game on, won, paddle half width, ball speed scale, power-up chance, random seed
+SAVE_COUNT = struct.Struct("<I")  # Number of items in the column that follows
+SAVE_COLUMNS = [  # Array columns of GameState, in file order, with their typecodes
+    ("ball_x", "d"), ("ball_y", "d"), ("prev_x", "d"), ("prev_y", "d"), ("x_move", "d"), ("y_move", "d"),
+    ("brick_x", "d"), ("brick_y", "d"), ("brick_type", "B"), ("brick_hp", "B"), ("brick_points", "H"),
+    ("brick_alive", "B"), ("hit_bricks", "I"),
+    ("powerup_x", "d"), ("powerup_y", "d"), ("powerup_kind", "B"),
+    ("effect_end_ticks", "I"), ("effect_kinds", "B"), ("effect_stacks", "H"),
+]
+LEADERBOARD_SIZE = 10  # Number of top scores the leaderboard sends back
+
+
+def report_failure(service, name, error):
+    """
+    Remember a background job's error (main thread). It is only printed when the
+    job was working before, so a service that stays down does not flood the console.
+
+    Args:
+        service: The Telemetry, Autosave or LeaderboardClient whose job failed
+        name: The job's name for the message
+        error: The exception, or None if the job worked
+    """
+    if error is not None and service.error is None:
+        print(f"{name} failed: {type(error).__name__}: {error}")
+    service.error = error
+
+
+class Telemetry:
+    """
+    The Telemetry class keeps samples of the game in memory and appends them to
+    a file in the background.
+    """
+
+    def __init__(self, state, path):
+        """
+        Initialize telemetry for a game.
+
+        Args:
+            state: The GameState to sample
+            path: The JSON lines file to append samples to
+        """
+        self.state = state
+        self.path = path
+        self.samples = []  # Samples taken since the last write
+        self.error = None  # The last error, if writing the file failed
+
+    def sample(self):
+        """
+        Take a sample of the game (main thread, every TELEMETRY_INTERVAL seconds).
+        """
+        state = self.state
+        self.samples.append({
+            "time": round(time.time(), 3), "tick": state.tick, "score": state.score,
+            "lives": state.lives, "balls": len(state.ball_x), "bricks_left": state.bricks_left,
+        })
+
+    def flush(self, scheduler):
+        """
+        Hand the samples taken so far to a worker thread to be written.
+
+        Args:
+            scheduler: The Scheduler running the game
+        """
+        if self.samples:
+            samples, self.samples = self.samples, []
+            scheduler.run_in_background(self.write, samples, done=self.written)
+
+    def written(self, future):
+        """
+        Note whether a write worked (main thread).
+
+        Args:
+            future: The finished background job
+        """
+        report_failure(self, "Telemetry", future.exception())
+
+    def write(self, samples):
+        """
+        Append samples to the telemetry file (worker thread).
+
+        Args:
+            samples: A list of sample dictionaries
+        """
+        with open(self.path, "a") as file:
+            file.writelines(json.dumps(sample) + "\n" for sample in samples)
+
+
+class Autosave:
+    """
+    The Autosave class writes copies of the game to disk in the background.
+    """
+
+    def __init__(self, state, path):
+        """
+        Initialize autosave for a game.
+
+        Args:
+            state: The GameState to save
+            path: The save file
+        """
+        self.state = state
+        self.path = path
+        self.error = None  # The last error, if saving failed
+        self.lock = threading.Lock()  # Saves run on a pool of threads; only one writes at a time
+        self.saved_tick = -1  # Tick of the newest copy written so far
+
+    def save(self, scheduler):
+        """
+        Copy the game (main thread, quick) and write the copy on a worker thread.
+
+        Args:
+            scheduler: The Scheduler running the game
+        """
+        scheduler.run_in_background(self.write, self.state.copy(), done=self.written)
+
+    def write(self, state):
+        """
+        Write a copy of the game (worker thread). If two saves overlap, they take
+        turns, and a copy older than one already written is skipped. Once the game
+        is over there is nothing left to resume, so the save file is deleted instead.
+
+        Args:
+            state: The copy of the game to write
+        """
+        with self.lock:
+            if state.tick < self.saved_tick:
+                return
+            if state.game_is_on:
+                write_save(state, self.path)
+            elif os.path.exists(self.path):
+                os.unlink(self.path)
+            self.saved_tick = state.tick
+
+    def written(self, future):
+        """
+        Note whether a save worked (main thread).
+
+        Args:
+            future: The finished background job
+        """
+        report_failure(self, "Autosave", future.exception())
+
+
+def encode_save(state):
+    """
+    Turn a game into the bytes of a save file. Only numbers are written (no
+    Python objects), so reading a save can never run code.
+
+    Args:
+        state: The GameState to save
+
+    Returns:
+        The save file's bytes
+    """
+    parts = [SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION),
+             SAVE_NUMBERS.pack(state.serve_balls, state.paddle_x, state.paddle_speed, state.bricks_left,
+                               state.score, state.lives, state.tick, state.level, state.game_is_on, state.won,
+                               state.paddle_half_width, state.ball_speed_scale, state.powerup_chance,
+                               state.random_seed)]
+    # The effect heap is a list of (end tick, kind) pairs, written as two columns
+    columns = {"effect_end_ticks": [end for end, kind in state.effect_ends],
+               "effect_kinds": [kind for end, kind in state.effect_ends]}
+    for name, typecode in SAVE_COLUMNS:
+        column = array(typecode, columns[name] if name in columns else getattr(state, name))
+        if sys.byteorder == "big":
+            column.byteswap()  # Save files are always little-endian
+        parts.append(SAVE_COUNT.pack(len(column)))
+        parts.append(column.tobytes())
+    return b"".join(parts)
+
+
+def decode_save(data, path):
+    """
+    Rebuild a game from the bytes of a save file.
+
+    Args:
+        data: The save file's bytes
+        path: The save file (only used in error messages)
+
+    Returns:
+        The saved GameState
+
+    Raises:
+        ValueError: If the data is not a save file, uses another format version,
+            is cut short or its columns do not fit together
+    """
+    if len(data) < SAVE_HEADER.size + SAVE_NUMBERS.size:
+        raise ValueError(f"{path} is not a BreakOut save file")
+    magic, version = SAVE_HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError(f"{path} is not a BreakOut save file")
+    if version != SAVE_VERSION:
+        raise ValueError(f"{path} uses save format {version}, expected {SAVE_VERSION}")
+
+    # Start from an empty game and fill in every slot from the file
+    state = GameState.__new__(GameState)
+    (state.serve_balls, state.paddle_x, state.paddle_speed, state.bricks_left, state.score, state.lives,
+     state.tick, state.level, state.game_is_on, state.won, state.paddle_half_width, state.ball_speed_scale,
+     state.powerup_chance, state.random_seed) = SAVE_NUMBERS.unpack_from(data, SAVE_HEADER.size)
+
+    columns = {}
+    offset = SAVE_HEADER.size + SAVE_NUMBERS.size
+    for name, typecode in SAVE_COLUMNS:
+        column = array(typecode)
+        if offset + SAVE_COUNT.size > len(data):
+            raise ValueError(f"{path} is damaged: it is cut short")
+        (count,) = SAVE_COUNT.unpack_from(data, offset)
+        offset += SAVE_COUNT.size
+        end = offset + count * column.itemsize
+        if end > len(data):
+            raise ValueError(f"{path} is damaged: it is cut short")
+        column.frombytes(data[offset:end])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns[name] = column
+        offset = end
+    if offset != len(data):
+        raise ValueError(f"{path} is damaged: it has extra bytes at the end")
+
+    # Check that the parallel columns are the same length, so the game can't index past one of them
+    balls = len(columns["ball_x"])
+    bricks = len(columns["brick_x"])
+    if (any(len(columns[name]) != balls for name in ("ball_y", "prev_x", "prev_y", "x_move", "y_move"))
+            or any(len(columns[name]) != bricks for name in ("brick_y", "brick_type", "brick_hp", "brick_points"))
+            or len(columns["brick_alive"]) != (bricks + 7) // 8
+            or any(index >= bricks for index in columns["hit_bricks"])
+            or len(columns["powerup_y"]) != len(columns["powerup_x"])
+            or len(columns["powerup_kind"]) != len(columns["powerup_x"])
+            or len(columns["effect_kinds"]) != len(columns["effect_end_ticks"])
+            or len(columns["effect_stacks"]) != POWERUP_KINDS):
+        raise ValueError(f"{path} is damaged: its columns do not fit together")
+    if (any(kind >= len(BRICK_POINTS) for kind in columns["brick_type"])
+            or any(kind >= POWERUP_KINDS for kind in columns["powerup_kind"])
+            or any(kind >= POWERUP_KINDS for kind in columns["effect_kinds"])):
+        raise ValueError(f"{path} is damaged: it has an unknown kind of brick or power-up")
+
+    for name, typecode in SAVE_COLUMNS:
+        if name not in ("brick_alive", "hit_bricks", "effect_end_ticks", "effect_kinds"):
+            setattr(state, name, columns[name])
+    state.brick_alive = bytearray(columns["brick_alive"])
+    state.hit_bricks = list(columns["hit_bricks"])
+    state.effect_ends = list(zip(columns["effect_end_ticks"], columns["effect_kinds"]))  # Still in heap order
+
+    # The brick grid is not saved; it is built again from the brick positions
+    state.brick_grid = BrickGrid(BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y)
+    state.brick_grid.build(state.brick_x, state.brick_y)
+    return state
+
+
+def write_save(state, path):
+    """
+    Write a game to a save file. The file is written under a temporary name of
+    its own (next to the save file) and then renamed, so a crash never leaves
+    half a save behind and two saves never write into the same file.
+
+    Args:
+        state: The GameState to save (a copy nobody else is changing)
+        path: The save file
+    """
+    folder, name = os.path.split(os.path.abspath(path))
+    file = tempfile.NamedTemporaryFile(dir=folder, prefix=name + ".", suffix=".tmp", delete=False)
+    try:
+        with file:
+            file.write(encode_save(state))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, path)
+    except BaseException:
+        # Do not leave the half-written temporary file behind
+        if os.path.exists(file.name):
+            os.unlink(file.name)
+        raise
+
+
+def load_save(path):
+    """
+    Read a game from a save file made by Autosave.
+
+    Args:
+        path: The save file
+
+    Returns:
+        The saved GameState
+
+    Raises:
+        ValueError: If the file is not a save file or is damaged
+    """
+    with open(path, "rb") as file:
+        return decode_save(file.read(), path)
+
+
+class LeaderboardClient:
+    """
+    The LeaderboardClient class sends the player's score to a leaderboard service
+    and keeps the latest top scores it sends back.
+    """
+
+    def __init__(self, url, player):
+        """
+        Initialize the client.
+
+        Args:
+            url: Address of the leaderboard service (like http://127.0.0.1:8000)
+            player: The name shown on the leaderboard
+        """
+        self.url = url.rstrip("/")
+        self.player = player
+        self.top_scores = []  # Latest top scores as [name, score] pairs
+        self.error = None  # The last error, if the service could not be reached
+
+    def send(self, score):
+        """
+        Send a score and get back the top scores (worker thread, may block).
+
+        Args:
+            score: The score to send
+
+        Returns:
+            The top scores as a list of [name, score] pairs
+        """
+        body = json.dumps({"player": self.player, "score": score}).encode()
+        request = urllib.request.Request(self.url + "/scores", data=body,
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=LEADERBOARD_TIMEOUT) as response:
+            return json.load(response)
+
+    def sync(self, scheduler, score):
+        """
+        Send a score in the background; the answer is picked up on the main thread.
+
+        Args:
+            scheduler: The Scheduler running the game
+            score: The score to send
+        """
+        scheduler.run_in_background(self.send, score, done=self.received)
+
+    def received(self, future):
+        """
+        Keep the top scores from a finished sync (main thread).
+
+        Args:
+            future: The finished background job
+        """
+        try:
+            top_scores = future.result()
+            # Check the answer looks like a list of [name, score] pairs before keeping it
+            self.top_scores = [[str(name), int(score)] for name, score in top_scores]
+        except Exception as error:
+            # The service is down or sent nonsense; try again at the next sync
+            report_failure(self, "Leaderboard", error)
+        else:
+            report_failure(self, "Leaderboard", None)
+
+
+class LeaderboardStandIn:
+    """
+    The LeaderboardStandIn class is a tiny leaderboard service running on this
+    computer. It keeps each player's best score in memory.
+    """
+
+    def __init__(self, port=0):
+        """
+        Start the service on a background thread.
+
+        Args:
+            port: The port to listen on (0 = any free port)
+        """
+        best = {}  # Best score of each player
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                entry = json.loads(self.rfile.read(length))
+                with lock:
+                    best[entry["player"]] = max(best.get(entry["player"], 0), int(entry["score"]))
+                    top = sorted(best.items(), key=lambda item: -item[1])[:LEADERBOARD_SIZE]
+                body = json.dumps(top).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Keep the game's console quiet
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.1,), daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """
+        Stop the service.
+        """
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,390 @@
+"""
+Parameter Sweep for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file plays many headless games for every combination of a grid of difficulty
+settings (ball speed, speed increase, paddle width and speed, lives, ball size)
+to help balance the game without playing it by hand. The games are shared out
+over a pool of worker processes so every CPU core is used.
+
+Results are streamed to a small columnar file as the workers finish: a header
+describing the columns, then blocks of rows where each column is stored as one
+packed array. When the sweep is done, the win rate, game length and score of
+every combination are printed.
+
+Run a sweep from the project directory with:
+    python sweep.py --set ball_speed=100,150,200 --set paddle_width=3,5 --games 200
+    python sweep.py --player random --games 1000 --output random.col
+    python sweep.py --summary random.col
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import autoplayer
+import engine
+from engine import GameState, step, TIME_STEP, INPUT_LEFT, INPUT_RIGHT
+from profiler import percentiles
+
+# The settings that can be swept, with the normal game's values
+DEFAULTS = {
+    "ball_speed": engine.INITIAL_MOVE_SPEED,  # Starting ball speed (pixels per second in x and y)
+    "speed_increment": engine.SPEED_INCREMENT,  # Ball speed-up after each paddle hit
+    "paddle_width": engine.PADDLE_WIDTH,  # Paddle width (1 = 20 pixels)
+    "paddle_speed": engine.PADDLE_MAX_SPEED,  # Fastest paddle speed (pixels per second)
+    "lives": engine.STARTING_LIVES,  # Lives at the start of a game
+    "ball_radius": engine.BALL_RADIUS,  # Ball radius used for collisions (pixels)
+}
+PLAYERS = ["autoplay", "follow", "random"]  # Scripted players that can play the games
+
+# Constants for the sweep
+GAMES_PER_TASK = 20  # Games handed to a worker at a time (small enough to keep all cores busy)
+MAX_GAME_TICKS = 120 * 600  # Games still going after 10 minutes of game time are stopped
+RANDOM_KEY_CHANGE = 0.05  # Chance per tick that the random player changes the keys it holds
+
+# Constants for the columnar results file
+MAGIC = b"BRKSWEEP"  # First bytes of every results file
+FORMAT_VERSION = 1  # Bump when the file layout changes
+HEADER = struct.Struct("<8sHI")  # Magic, version, length of the JSON column description
+BLOCK = struct.Struct("<I")  # Number of rows in the block that follows
+RESULT_COLUMNS = [  # (name, array typecode) of the columns stored for every game
+    ("point", "I"),  # Index of the parameter combination
+    ("seed", "I"),  # Random seed of the game
+    ("won", "B"),  # 1 if all bricks were destroyed
+    ("ticks", "I"),  # Length of the game in steps
+    ("score", "I"),
+    ("lives_left", "H"),
+    ("bricks_left", "I"),
+]
+
+
+def current_parameters():
+    """
+    Read the game's difficulty settings in this process.
+
+    Returns:
+        A dictionary with a value for every name in DEFAULTS
+    """
+    return {
+        "ball_speed": engine.INITIAL_MOVE_SPEED,
+        "speed_increment": engine.SPEED_INCREMENT,
+        "paddle_width": engine.PADDLE_WIDTH,
+        "paddle_speed": engine.PADDLE_MAX_SPEED,
+        "lives": engine.STARTING_LIVES,
+        "ball_radius": engine.BALL_RADIUS,
+    }
+
+
+def apply_parameters(parameters):
+    """
+    Change the game's difficulty settings in this process.
+    The settings are module constants of engine.py, so every game in the process
+    sees them; give the returned settings back to apply_parameters() when done.
+
+    Args:
+        parameters: A dictionary with a value for every name in DEFAULTS
+
+    Returns:
+        The settings that were in place before (see current_parameters())
+    """
+    previous = current_parameters()
+    engine.INITIAL_MOVE_SPEED = parameters["ball_speed"]
+    engine.SPEED_INCREMENT = parameters["speed_increment"]
+    engine.PADDLE_WIDTH = parameters["paddle_width"]
+    engine.PADDLE_HALF_WIDTH = parameters["paddle_width"] * 10
+    engine.PADDLE_MAX_SPEED = parameters["paddle_speed"]
+    engine.STARTING_LIVES = parameters["lives"]
+    engine.BALL_RADIUS = parameters["ball_radius"]
+
+    # The bot works out where the ball meets the paddle from the same settings
+    autoplayer.CONTACT_Y = engine.PADDLE_Y + engine.PADDLE_HALF_HEIGHT + engine.BALL_RADIUS
+    return previous
+
+
+def make_player(name, state, rng):
+    """
+    Create a scripted player for a game.
+
+    Args:
+        name: One of the PLAYERS
+        state: The GameState it plays
+        rng: A random.Random for the random player
+
+    Returns:
+        A function that returns the INPUT_* flags for the next step
+    """
+    if name == "autoplay":
+        return autoplayer.AutoPlayer(state).inputs
+
+    if name == "follow":
+        def follow():
+            # Move towards the first ball
+            if state.ball_x[0] > state.paddle_x + 10:
+                return INPUT_RIGHT
+            if state.ball_x[0] < state.paddle_x - 10:
+                return INPUT_LEFT
+            return 0
+        return follow
+
+    held = [0]
+
+    def mash():
+        # Hold random keys, changing them now and then
+        if rng.random() < RANDOM_KEY_CHANGE:
+            held[0] = rng.choice((0, INPUT_LEFT, INPUT_RIGHT))
+        return held[0]
+    return mash
+
+
+def run_task(point, parameters, player, seeds):
+    """
+    Play a batch of games with one set of parameters (runs in a worker process).
+
+    Args:
+        point: Index of the parameter combination
+        parameters: A dictionary with a value for every name in DEFAULTS
+        player: One of the PLAYERS
+        seeds: Random seeds, one game per seed
+
+    Returns:
+        A dictionary mapping each RESULT_COLUMNS name to an array of results
+    """
+    columns = {name: array(typecode) for name, typecode in RESULT_COLUMNS}
+    # Workers are reused for other batches, so put the settings back afterwards
+    previous = apply_parameters(parameters)
+    try:
+        for seed in seeds:
+            rng = random.Random(seed)
+            state = GameState()
+
+            # Start each game with the ball heading in a random direction
+            state.x_move[0] = rng.choice((-1, 1)) * rng.uniform(0.5, 1.0) * engine.INITIAL_MOVE_SPEED
+            play = make_player(player, state, rng)
+            while state.game_is_on and state.tick < MAX_GAME_TICKS:
+                step(state, play())
+
+            columns["point"].append(point)
+            columns["seed"].append(seed)
+            columns["won"].append(state.won)
+            columns["ticks"].append(state.tick)
+            columns["score"].append(state.score)
+            columns["lives_left"].append(state.lives)
+            columns["bricks_left"].append(state.bricks_left)
+    finally:
+        apply_parameters(previous)
+    return columns
+
+
+def write_block(file, columns):
+    """
+    Append a block of rows to a results file, one packed array per column.
+
+    Args:
+        file: The results file, open for binary writing
+        columns: A dictionary mapping each RESULT_COLUMNS name to an array
+    """
+    file.write(BLOCK.pack(len(columns["point"])))
+    for name, _ in RESULT_COLUMNS:
+        values = columns[name]
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()  # The file is always little-endian
+        values.tofile(file)
+
+
+def read_results(path):
+    """
+    Read a whole results file.
+
+    Args:
+        path: The file to read
+
+    Returns:
+        A tuple (description, columns) where description is the dictionary saved in
+        the header (parameter grid and player) and columns maps each column name to
+        an array holding every game
+    """
+    with open(path, "rb") as file:
+        magic, version, size = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a BreakOut sweep results file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} uses results format {version}, expected {FORMAT_VERSION}")
+        description = json.loads(file.read(size))
+
+        columns = {name: array(typecode) for name, typecode in description["columns"]}
+        while True:
+            data = file.read(BLOCK.size)
+            if len(data) < BLOCK.size:
+                break  # End of file (or a block cut short by an interrupted sweep)
+            rows = BLOCK.unpack(data)[0]
+            for name, typecode in description["columns"]:
+                block = array(typecode)
+                block.frombytes(file.read(rows * block.itemsize))
+                if sys.byteorder == "big":
+                    block.byteswap()
+                columns[name].extend(block)
+    return description, columns
+
+
+def summarize(description, columns):
+    """
+    Work out the win rate, game length and score of every parameter combination.
+
+    Args:
+        description: The description saved in the results file header
+        columns: The columns read from the results file
+
+    Returns:
+        A list of dictionaries, one per parameter combination
+    """
+    games = {}
+    for row, point in enumerate(columns["point"]):
+        games.setdefault(point, []).append(row)
+
+    summary = []
+    for point, parameters in enumerate(description["points"]):
+        rows = games.get(point, [])
+        seconds = [columns["ticks"][row] * description["time_step"] for row in rows]
+        scores = [columns["score"][row] for row in rows]
+        summary.append({
+            "parameters": parameters,
+            "games": len(rows),
+            "win_rate": sum(columns["won"][row] for row in rows) / len(rows) if rows else 0.0,
+            "game_seconds": {name: round(value, 1) for name, value in percentiles(seconds).items()},
+            "score": percentiles(scores),
+        })
+    return summary
+
+
+def print_summary(summary, swept):
+    """
+    Print the summary as a table.
+
+    Args:
+        summary: The result of summarize()
+        swept: Names of the parameters that were swept (shown as columns)
+    """
+    titles = swept + ["games", "win %", "len p50", "len p95", "score p50", "score p95"]
+    print("  ".join(f"{title:>10}" for title in titles))
+    for entry in summary:
+        values = [entry["parameters"][name] for name in swept] + [
+            entry["games"], f"{entry['win_rate'] * 100:.1f}",
+            f"{entry['game_seconds']['p50']}s", f"{entry['game_seconds']['p95']}s",
+            entry["score"]["p50"], entry["score"]["p95"]]
+        print("  ".join(f"{value:>10}" for value in values))
+
+
+def parse_setting(text):
+    """
+    Read a --set option such as "ball_speed=100,150,200".
+
+    Args:
+        text: The option value
+
+    Returns:
+        A tuple (name, list of values)
+    """
+    name, _, values = text.partition("=")
+    if name not in DEFAULTS:
+        raise argparse.ArgumentTypeError(f"unknown setting {name!r} (choose from {', '.join(DEFAULTS)})")
+    kind = type(DEFAULTS[name])
+    try:
+        return name, [kind(value) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad values for {name}: {values!r}")
+
+
+def run_sweep(grid, games, player, output, workers=None, seed=0):
+    """
+    Play every combination of the grid on a process pool, streaming results to a file.
+
+    Args:
+        grid: A dictionary mapping setting names to lists of values to try
+        games: Games played for each combination
+        player: One of the PLAYERS
+        output: The results file to write
+        workers: Number of worker processes (all CPU cores if None)
+        seed: Seed of the first game (games are numbered from it)
+
+    Returns:
+        The description saved in the results file header
+    """
+    names = list(grid)
+    points = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        parameters = dict(DEFAULTS)
+        parameters.update(zip(names, values))
+        points.append(parameters)
+
+    description = {
+        "player": player,
+        "swept": names,
+        "points": points,
+        "time_step": TIME_STEP,
+        "columns": RESULT_COLUMNS,
+    }
+    header = json.dumps(description).encode()
+
+    with open(output, "wb") as file, ProcessPoolExecutor(max_workers=workers) as pool:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(header)))
+        file.write(header)
+
+        # Every combination plays the same seeds, so they are compared on the same games
+        tasks = []
+        for point, parameters in enumerate(points):
+            for first in range(0, games, GAMES_PER_TASK):
+                seeds = range(seed + first, seed + min(first + GAMES_PER_TASK, games))
+                tasks.append(pool.submit(run_task, point, parameters, player, list(seeds)))
+
+        done = 0
+        for task in as_completed(tasks):
+            write_block(file, task.result())
+            file.flush()
+            done += 1
+            print(f"\r{done}/{len(tasks)} batches done", end="", file=sys.stderr, flush=True)
+        print(file=sys.stderr)
+    return description
+
+
+def main():
+    """
+    Run a parameter sweep from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Play many headless BreakOut games over a grid of settings.")
+    parser.add_argument("--set", dest="settings", type=parse_setting, action="append", default=[],
+                        metavar="NAME=V1,V2,...", help=f"values to try for a setting ({', '.join(DEFAULTS)})")
+    parser.add_argument("--games", type=int, default=100, help="games played for each combination")
+    parser.add_argument("--player", choices=PLAYERS, default="autoplay", help="the scripted player")
+    parser.add_argument("--output", default="sweep.col", help="the columnar results file to write")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: all CPU cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--summary", metavar="FILE", help="only print the summary of an earlier results file")
+    args = parser.parse_args()
+
+    if args.summary:
+        description, columns = read_results(args.summary)
+    else:
+        grid = dict(args.settings)
+        print(f"Playing {args.games} games for each of "
+              f"{len(list(itertools.product(*grid.values())))} combinations on "
+              f"{args.workers or os.cpu_count()} processes", file=sys.stderr)
+        run_sweep(grid, args.games, args.player, args.output, args.workers, args.seed)
+        description, columns = read_results(args.output)
+    print_summary(summarize(description, columns), description["swept"])
+
+
+if __name__ == "__main__":
+    main()
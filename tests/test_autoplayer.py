@@ -0,0 +1,67 @@
+"""
+Autoplayer Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the bot in autoplayer.py: its prediction of where the ball comes down
+matches the ball's real path off the walls and ceiling, it keeps returning the
+ball, and a headless soak run plays game after game.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import pytest
+
+from autoplayer import AutoPlayer, predict_landing, soak, CONTACT_Y
+from engine import GameState, step, EVENT_PADDLE, TOP_WALL, SIDE_WALL
+
+
+def fly(x, y, x_move, y_move, dt=0.0001):
+    """
+    Move a ball in tiny steps, bouncing off the side walls and the ceiling, until
+    it comes down to the paddle.
+
+    Returns:
+        A tuple (landing x, seconds until landing)
+    """
+    seconds = 0.0
+    while y > CONTACT_Y or y_move > 0:
+        x += x_move * dt
+        y += y_move * dt
+        seconds += dt
+        if abs(x) > SIDE_WALL:
+            x_move = -x_move
+            x = 2 * SIDE_WALL * (1 if x > 0 else -1) - x
+        if y > TOP_WALL:
+            y_move = -y_move
+            y = 2 * TOP_WALL - y
+    return x, seconds
+
+
+@pytest.mark.parametrize("ball", [
+    (0, 0, 0, -300),  # Straight down
+    (100, 50, 450, -300),  # Off the right wall
+    (-200, 100, -700, 300),  # Off the left wall and the ceiling
+])
+def test_prediction_matches_the_balls_path(ball):
+    expected_x, expected_seconds = fly(*ball)
+    landing_x, seconds = predict_landing(*ball)
+    assert landing_x == pytest.approx(expected_x, abs=0.5)
+    assert seconds == pytest.approx(expected_seconds, abs=0.001)
+
+
+def test_bot_returns_the_ball():
+    state = GameState()
+    bot = AutoPlayer(state)
+    events = 0
+    for _ in range(5000):
+        events |= step(state, bot.inputs())
+    assert events & EVENT_PADDLE
+    assert state.score > 0 and state.game_is_on
+
+
+def test_soak_plays_game_after_game():
+    result = soak(ticks=60000, report=lambda line: None)
+    assert result["ticks"] == 60000 and result["games"] >= 1
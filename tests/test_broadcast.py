@@ -0,0 +1,120 @@
+"""
+Spectator Broadcasting Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks that spectators' copies of a broadcast game (see broadcast.py) match the
+game, for spectators that watch from the start and ones that join late, over TCP
+and Unix sockets, and across a new level.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import socket
+import time
+
+import pytest
+
+from autoplayer import AutoPlayer
+from broadcast import Broadcaster, Spectator, parse_address, quantize
+from engine import GameState, step, load_level, EVENT_WIN
+
+# A short row of bricks the bot clears in well under a minute, so the game reaches a new level
+LEVEL = [(x, 200, 0, 1, 10) for x in (-130, -65, 0, 65, 130)]
+
+
+def catch_up(spectators, state, timeout=2.0):
+    """
+    Let the spectators read the stream until their copies reach the game's tick.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for spectator in spectators:
+            spectator.receive()
+        if all(spectator.state is not None and spectator.state.tick == state.tick for spectator in spectators):
+            return
+        time.sleep(0.001)
+
+
+def matches(copy, state):
+    """
+    Returns:
+        True if a spectator's copy shows the game as it is (positions to a quarter pixel)
+    """
+    return ((copy.tick, copy.score, copy.lives, copy.level, copy.game_is_on)
+            == (state.tick, state.score, state.lives, state.level, state.game_is_on)
+            and copy.brick_alive == state.brick_alive and copy.bricks_left == state.bricks_left
+            and round(copy.paddle_x * 4) == quantize(state.paddle_x)
+            and [round(x * 4) for x in copy.ball_x] == [quantize(x) for x in state.ball_x])
+
+
+def watch(address):
+    """
+    Broadcast a bot game with a level change, with one spectator from the start
+    and one joining late, checking both copies along the way.
+    """
+    state = GameState(bricks=LEVEL, balls=2)
+    bot = AutoPlayer(state)
+    broadcaster = Broadcaster(state, address)
+    if broadcaster.family == socket.AF_INET:
+        address = "%s:%d" % broadcaster.address
+    spectators = [Spectator(address)]
+    try:
+        levels = 0
+        for tick in range(1, 6001):
+            if step(state, bot.inputs()) & EVENT_WIN:
+                load_level(state, LEVEL)
+                bot = AutoPlayer(state)
+                levels += 1
+            broadcaster.record()
+            if tick % 2:
+                continue
+            broadcaster.flush()  # Once per frame, like main.py
+            if tick == 1990:  # Let in at the next flush()
+                spectators.append(Spectator(address))
+            if tick % 200 == 0:
+                catch_up(spectators, state)
+                for spectator in spectators:
+                    assert matches(spectator.state, state)
+            if not state.game_is_on:
+                break
+        return levels
+    finally:
+        for spectator in spectators:
+            spectator.close()
+        broadcaster.close()
+
+
+def test_parse_address():
+    assert parse_address("8765") == (socket.AF_INET, ("127.0.0.1", 8765))
+    assert parse_address("0.0.0.0:9000") == (socket.AF_INET, ("0.0.0.0", 9000))
+    assert parse_address("/tmp/game.sock") == (socket.AF_UNIX, "/tmp/game.sock")
+
+
+def test_spectators_follow_over_tcp():
+    assert watch("127.0.0.1:0") >= 1  # The game went on to a new level
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+def test_spectators_follow_over_a_unix_socket(tmp_path):
+    watch(str(tmp_path / "game.sock"))
+
+
+def test_a_spectator_that_goes_away_is_dropped():
+    state = GameState()
+    broadcaster = Broadcaster(state, "127.0.0.1:0")
+    spectator = Spectator("%s:%d" % broadcaster.address)
+    try:
+        catch_up([spectator], state)
+        spectator.close()
+        for _ in range(2000):
+            step(state)
+            broadcaster.record()
+            broadcaster.flush()
+            if not broadcaster.spectators:
+                break
+        assert not broadcaster.spectators
+    finally:
+        broadcaster.close()
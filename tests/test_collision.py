@@ -0,0 +1,39 @@
+"""
+Collision Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the swept collision checks in collision.py: a ball is caught at the moment
+it first touches a box, even when it moves further than the box is thick in one
+step, so a fast ball never passes through a brick.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import pytest
+
+from collision import sweep_circle_box, reflect
+from engine import GameState, step, EVENT_BRICK, TIME_STEP
+
+
+def test_fast_ball_is_caught_at_first_touch():
+    # Moving 1000 pixels up through a box 20 pixels thick, the ball touches it 18% into the step
+    t, normal_x, normal_y = sweep_circle_box(0, -100, 0, 1000, 10, -30, 90, 30, 110)
+    assert t == pytest.approx(0.18)
+    assert (normal_x, normal_y) == (0, -1)
+    assert reflect(0, 1000, normal_x, normal_y) == pytest.approx((0, -1000))
+
+
+def test_ball_that_misses_or_moves_away_is_not_caught():
+    assert sweep_circle_box(0, -100, 500, 0, 10, -30, 90, 30, 110) is None  # Passes underneath
+    assert sweep_circle_box(0, 0, 0, -100, 10, -30, 90, 30, 110) is None  # Moving away
+
+
+def test_fast_ball_does_not_pass_through_a_brick():
+    state = GameState(bricks=[(0, 100, 0, 1, 10)])
+    state.x_move[0] = 0.0
+    state.y_move[0] = 400 / TIME_STEP  # 400 pixels per step, far more than the brick is thick
+    assert step(state) & EVENT_BRICK
+    assert state.bricks_left == 0 and state.ball_y[0] < 100
@@ -0,0 +1,100 @@
+"""
+Engine Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the game rules in engine.py: bounces, scoring, losing lives and winning.
+Also checks that the engine runs without turtle or tkinter, so it works without
+a window.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import os
+import subprocess
+import sys
+
+import engine
+from engine import (
+    GameState, step, brick_is_alive,
+    EVENT_WALL, EVENT_BRICK, EVENT_LIFE_LOST, EVENT_WIN, EVENT_GAME_OVER,
+    INPUT_LEFT, INPUT_RIGHT, STARTING_LIVES, SCREEN_EDGE, PADDLE_HALF_WIDTH, TOP_WALL,
+)
+
+
+def play(state, ticks):
+    """
+    Step a game for a number of ticks (or until it ends), without touching the keys.
+
+    Returns:
+        All the EVENT_* flags seen
+    """
+    events = 0
+    for _ in range(ticks):
+        if not state.game_is_on:
+            break
+        events |= step(state)
+    return events
+
+
+def test_engine_runs_without_a_window():
+    # Run in a fresh interpreter, since other tests may have loaded turtle already
+    code = ("import sys, engine; state = engine.GameState(); engine.step(state); "
+            "print('turtle' in sys.modules or 'tkinter' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(engine.__file__)))
+    assert result.stdout.strip() == "False"
+
+
+def test_new_game():
+    state = GameState()
+    assert len(state.brick_x) == state.bricks_left == 55
+    assert state.lives == STARTING_LIVES
+    assert state.score == 0 and state.tick == 0
+    assert all(brick_is_alive(state, index) for index in range(55))
+
+
+def test_paddle_stops_at_the_edge():
+    state = GameState()
+    for _ in range(600):
+        step(state, INPUT_RIGHT)
+    assert state.paddle_x == SCREEN_EDGE - PADDLE_HALF_WIDTH
+    for _ in range(600):
+        step(state, INPUT_LEFT)
+    assert state.paddle_x == -(SCREEN_EDGE - PADDLE_HALF_WIDTH)
+
+
+def test_ball_bounces_off_the_walls_and_stays_inside():
+    state = GameState()
+    events = 0
+    for _ in range(1200):
+        events |= step(state)
+        assert state.ball_y[0] <= TOP_WALL
+    assert events & EVENT_WALL
+
+
+def test_hitting_a_brick_scores_and_destroys_it():
+    state = GameState()
+    events = play(state, 1000)
+    assert events & EVENT_BRICK
+    destroyed = [index for index in range(len(state.brick_x)) if not brick_is_alive(state, index)]
+    assert destroyed and state.bricks_left == 55 - len(destroyed)
+    assert state.score == sum(state.brick_points[index] for index in destroyed)
+
+
+def test_missed_balls_cost_lives_until_game_over():
+    state = GameState()
+    events = 0
+    while state.game_is_on:
+        events |= step(state, INPUT_LEFT)  # The paddle hides in the corner
+    assert events & EVENT_LIFE_LOST and events & EVENT_GAME_OVER
+    assert state.lives == 0 and not state.won
+
+
+def test_clearing_the_last_brick_wins():
+    state = GameState(bricks=[(0, 100, 0, 1, 10)])
+    events = play(state, 2000)
+    assert events & EVENT_WIN
+    assert state.won and not state.game_is_on and state.score == 10
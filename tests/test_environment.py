@@ -0,0 +1,99 @@
+"""
+Training Environment Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks that VectorEnv gives the same observations, rewards and dones whether
+the games run on worker processes or in this process, that each environment
+matches a plain game stepped the same way, that without auto_reset a finished
+game stays done and earns nothing more, and that the shared block is freed.
+
+These tests need NumPy (pip install numpy) and are skipped without it.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine import GameState, step  # noqa: E402 (NumPy is checked first)
+from environment import VectorEnv, ACTIONS  # noqa: E402
+
+ENVS = 6
+STEPS = 300
+
+
+def run(workers):
+    """
+    Step ENVS environments with the same random actions.
+
+    Returns:
+        The list of actions, and lists of copies of the observations, rewards and dones after each step
+    """
+    rng = random.Random(3)
+    actions = [[rng.choice(ACTIONS) for _ in range(ENVS)] for _ in range(STEPS)]
+    history = []
+    with VectorEnv(ENVS, workers=workers, frame_skip=4) as env:
+        env.reset()
+        for action in actions:
+            observations, rewards, dones = env.step(action)
+            history.append(({name: array.copy() for name, array in observations.items()},
+                            rewards.copy(), dones.copy()))
+    return actions, history
+
+
+def test_workers_match_running_in_process():
+    _, in_process = run(workers=0)
+    _, on_workers = run(workers=2)
+    for (observations, rewards, dones), (other, other_rewards, other_dones) in zip(in_process, on_workers):
+        for name in observations:
+            assert np.array_equal(observations[name], other[name])
+        assert np.array_equal(rewards, other_rewards) and np.array_equal(dones, other_dones)
+
+
+def test_environment_matches_a_plain_game():
+    actions, history = run(workers=0)
+    state = GameState()
+    for number, action in enumerate(actions):
+        score = state.score
+        for _ in range(4):
+            step(state, action[0])
+            if not state.game_is_on:
+                break
+        observations, rewards, dones = history[number]
+        assert observations["paddle_x"][0] == state.paddle_x
+        assert observations["score"][0] == state.score and rewards[0] == state.score - score
+        assert dones[0] == (not state.game_is_on)
+        if not state.game_is_on:
+            break
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_finished_games_earn_nothing_without_auto_reset(workers):
+    with VectorEnv(2, workers=workers, frame_skip=30, auto_reset=False) as env:
+        env.reset()
+        for _ in range(1000):
+            _, rewards, dones = env.step([0, 0])  # Nobody moves the paddle, so both games are lost
+            if dones.all():
+                break
+        assert dones.all()
+        rewards[:] = 7  # As if the games had just ended with a reward
+        scores = env.score.copy()
+        for _ in range(3):
+            _, rewards, dones = env.step([0, 0])
+            assert dones.all() and not rewards.any()
+        assert np.array_equal(env.score, scores)
+
+
+def test_shared_block_is_freed():
+    env = VectorEnv(2, workers=1)
+    name = env.block.name
+    env.close()
+    if os.path.isdir("/dev/shm"):
+        assert not os.path.exists(os.path.join("/dev/shm", name.lstrip("/")))
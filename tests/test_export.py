@@ -0,0 +1,197 @@
+"""
+Picture Export Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the offscreen pictures: the Rasterizer's frame-by-frame repainting gives
+the same picture as drawing everything again, and the PNG and GIF files written
+by export.py read back to exactly the pixels that were written. The files are
+read back with small decoders written here, following the PNG and GIF specifications.
+
+These tests need NumPy (pip install numpy) and are skipped without it.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import struct
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from autoplayer import AutoPlayer  # noqa: E402 (NumPy is checked first)
+from engine import GameState, step, load_level, grid_layout, EVENT_WIN  # noqa: E402
+from export import write_png, GifWriter, shrink  # noqa: E402
+from rasterizer import Rasterizer  # noqa: E402
+
+
+def read_png(path):
+    """
+    Read an 8-bit RGB PNG without filters (the kind write_png makes).
+
+    Returns:
+        A NumPy uint8 array of shape (height, width, 3)
+    """
+    data = path.read_bytes()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position = 8
+    image = b""
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        assert zlib.crc32(kind + body) == struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0]
+        if kind == b"IHDR":
+            width, height = struct.unpack(">II", body[:8])
+        elif kind == b"IDAT":
+            image += body
+        position += 12 + length
+    rows = np.frombuffer(zlib.decompress(image), np.uint8).reshape(height, width * 3 + 1)
+    assert (rows[:, 0] == 0).all()  # Filter type 0 on every row
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def lzw_decode(data, code_size):
+    """
+    Decode the LZW-compressed pixels of one GIF image.
+
+    Returns:
+        The palette indices as bytes
+    """
+    clear = 1 << code_size
+    end = clear + 1
+    bits = count = position = 0
+    output = bytearray()
+    table = previous = None
+    while True:
+        if table is None:
+            table = [bytes([index]) for index in range(clear)] + [b"", b""]
+            width = code_size + 1
+            previous = None
+        while count < width:
+            bits |= data[position] << count
+            position += 1
+            count += 8
+        code = bits & ((1 << width) - 1)
+        bits >>= width
+        count -= width
+        if code == clear:
+            table = None
+            continue
+        if code == end:
+            return bytes(output)
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else table[previous] + table[previous][:1]
+            if len(table) < 4096:
+                table.append(table[previous] + entry[:1])
+        output += entry
+        previous = code
+        if len(table) == (1 << width) and width < 12:
+            width += 1
+
+
+def read_gif(path):
+    """
+    Read every frame of an animated GIF, drawing each frame over the last.
+
+    Returns:
+        A list of (pixels, delay) pairs, pixels as in read_png()
+    """
+    data = path.read_bytes()
+    assert data[:6] == b"GIF89a"
+    width, height, flags = struct.unpack("<HHB", data[6:11])
+    colors = 2 << (flags & 7)
+    palette = np.frombuffer(data[13:13 + 3 * colors], np.uint8).reshape(colors, 3)
+    position = 13 + 3 * colors
+    screen = np.zeros((height, width), np.uint8)
+    frames = []
+    delay = 0
+    while data[position] != 0x3B:
+        if data[position] == 0x21:  # Extension: remember a graphic control's delay, skip the rest
+            if data[position + 1] == 0xF9:
+                delay = struct.unpack("<H", data[position + 4:position + 6])[0]
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+        else:  # Image: its box, then its sub-blocks of LZW data
+            assert data[position] == 0x2C
+            left, top, box_width, box_height = struct.unpack("<HHHH", data[position + 1:position + 9])
+            code_size = data[position + 10]
+            position += 11
+            blocks = bytearray()
+            while data[position]:
+                blocks += data[position + 1:position + 1 + data[position]]
+                position += data[position] + 1
+            position += 1
+            pixels = lzw_decode(bytes(blocks), code_size)
+            screen[top:top + box_height, left:left + box_width] = \
+                np.frombuffer(pixels, np.uint8).reshape(box_height, box_width)
+            frames.append((palette[screen], delay))
+    return frames
+
+
+def bot_frames(count, ticks_per_frame=6):
+    """
+    Let the bot play and draw a picture every few ticks.
+
+    Returns:
+        The Rasterizer and a generator of its picture after each frame
+    """
+    state = GameState(balls=2)
+    bot = AutoPlayer(state)
+    rasterizer = Rasterizer(state, show_level=True)
+
+    def frames():
+        nonlocal bot
+        for _ in range(count):
+            for _ in range(ticks_per_frame):
+                if step(state, bot.inputs()) & EVENT_WIN:
+                    load_level(state, grid_layout())
+                    bot = AutoPlayer(state)
+            rasterizer.render()
+            yield rasterizer.pixels
+    return rasterizer, frames()
+
+
+def test_repainting_matches_a_full_redraw():
+    rasterizer, frames = bot_frames(400)
+    for number, pixels in enumerate(frames):
+        if number % 40 == 0:
+            fresh = Rasterizer(rasterizer.state, show_level=True)
+            fresh.render()
+            assert np.array_equal(fresh.pixels, pixels)
+
+
+def test_png_round_trip(tmp_path):
+    rasterizer, frames = bot_frames(50)
+    for _ in frames:
+        pass  # Play the 50 frames; the last picture is in rasterizer.pixels
+    write_png(tmp_path / "frame.png", rasterizer.pixels)
+    assert np.array_equal(read_png(tmp_path / "frame.png"), rasterizer.pixels)
+
+    small = shrink(rasterizer.pixels, 3)
+    write_png(tmp_path / "small.png", small)
+    assert np.array_equal(read_png(tmp_path / "small.png"), small)
+
+
+def test_gif_round_trip(tmp_path):
+    rasterizer, frames = bot_frames(60)
+    gif = GifWriter(tmp_path / "clip.gif", rasterizer.width, rasterizer.height, 10)
+    written = []
+    for pixels in frames:
+        gif.add_frame(pixels)
+        if not written or not np.array_equal(written[-1], pixels):
+            written.append(pixels.copy())
+    gif.add_frame(written[-1])  # An unchanged frame only makes the last one last longer
+    gif.close()
+
+    frames = read_gif(tmp_path / "clip.gif")
+    assert len(frames) == len(written)
+    for (pixels, _), expected in zip(frames, written):
+        assert np.array_equal(pixels, expected)
+    assert frames[-1][1] == 20
@@ -0,0 +1,74 @@
+"""
+High Score Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the run log in highscores.py: recorded games are still there after the
+log is opened again, the index catches up with runs it missed, a record cut
+short by a crash is dropped, and looking at the scores never changes the files.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import os
+
+import pytest
+
+from highscores import HighScores, Run, read_log, read_runs, rebuild_index, index_path, TOP_SIZE
+
+
+def record(path, scores):
+    """
+    Record one game per score in a run log and wait until they are written.
+    """
+    high_scores = HighScores(path)
+    for number, score in enumerate(scores):
+        high_scores.add(Run(f"player{number % 3}", score, ticks=100 + number, ended=1000.0 + number))
+    high_scores.close()
+    assert high_scores.error is None
+
+
+def test_scores_are_kept_after_reopening(tmp_path):
+    path = str(tmp_path / "scores.brs")
+    scores = [40, 330, 120, 310, 5, 77, 210, 90, 15, 300, 60, 250]
+    record(path, scores)
+    high_scores = HighScores(path)
+    high_scores.close()
+    assert high_scores.top() == [(f"player{scores.index(score) % 3}", score)
+                                 for score in sorted(scores, reverse=True)[:TOP_SIZE]]
+    assert high_scores.best("player0") == max(scores[0::3])
+    assert [run.score for run, _ in read_runs(path)] == scores
+
+
+def test_index_catches_up_and_cut_records_are_dropped(tmp_path):
+    path = str(tmp_path / "scores.brs")
+    record(path, [10, 20])
+    with open(path, "ab") as file:
+        file.write(Run("late", 500, ended=2000.0).pack())  # Reached the log but not the index
+        file.write(Run("crash", 900).pack()[:-3])  # Only partly written when the game stopped
+
+    assert read_log(path).top[0][:2] == ["late", 500]
+    high_scores = HighScores(path)
+    high_scores.add(Run("next", 50))
+    high_scores.close()
+    assert [run.player for run, _ in read_runs(path)] == ["player0", "player1", "late", "next"]
+    assert rebuild_index(path).runs == 4
+
+
+def test_looking_at_scores_changes_nothing(tmp_path):
+    path = str(tmp_path / "scores.brs")
+    record(path, [10, 20])
+    with open(path, "ab") as file:
+        file.write(Run("crash", 900).pack()[:-3])
+    os.remove(index_path(path))
+    before = open(path, "rb").read()
+
+    assert read_log(path).runs == 2
+    assert open(path, "rb").read() == before
+    assert not os.path.exists(index_path(path))
+
+    with pytest.raises(OSError):
+        read_log(str(tmp_path / "missing.brs"))
+    assert not os.path.exists(tmp_path / "missing.brs")
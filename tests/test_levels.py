@@ -0,0 +1,95 @@
+"""
+Level Pack Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks level packs (see levels.py): levels read back exactly as written, only
+playable levels are written, and damaged or hand-edited packs are refused when
+they are opened or a level is loaded, instead of breaking the game.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import pytest
+
+from engine import GameState, step, grid_layout, EVENT_WIN
+from levels import LevelPack, write_pack, random_level, HEADER, BRICK_RECORD
+
+BRICK = (0, 100, 0, 1, 10)  # One playable brick record
+
+
+def test_pack_round_trip(tmp_path):
+    levels = [grid_layout()] + [random_level(12, 11, seed) for seed in range(5)]
+    write_pack(tmp_path / "levels.brk", levels)
+    with LevelPack(tmp_path / "levels.brk") as pack:
+        assert len(pack) == len(levels)
+        for number, bricks in enumerate(levels):
+            assert len(pack.level(number)) == len(bricks)
+            assert list(pack.level(number).bricks()) == [tuple(brick) for brick in bricks]
+        with pytest.raises(IndexError):
+            pack.level(len(levels))
+
+
+def test_levels_are_written_one_at_a_time(tmp_path):
+    write_pack(tmp_path / "levels.brk", (random_level(5, 11, seed) for seed in range(20)), 20)
+    with LevelPack(tmp_path / "levels.brk") as pack:
+        assert len(pack) == 20
+
+
+@pytest.mark.parametrize("bricks, reason", [
+    ([], "no bricks"),
+    ([(0, -225, 0, 1, 10)], "below the lowest"),
+    ([(420, 100, 0, 1, 10)], "can't reach"),
+    ([(0, 100, 0, 0, 10)], "0 hit points"),
+    ([(0, 100, 9, 1, 10)], "unknown type"),
+])
+def test_unplayable_levels_are_not_written(tmp_path, bricks, reason):
+    path = tmp_path / "levels.brk"
+    with pytest.raises(ValueError, match=reason):
+        write_pack(path, [[BRICK], bricks])
+    assert not path.exists()  # No half-written pack is left behind
+
+
+def write_raw_pack(path, bricks):
+    """
+    Write a one-level pack by hand, without write_pack()'s checks (like a hand-edited file).
+    """
+    write_pack(path, [[BRICK] * len(bricks)])
+    data = bytearray(path.read_bytes())
+    start = len(data) - len(bricks) * BRICK_RECORD.size
+    for number, brick in enumerate(bricks):
+        BRICK_RECORD.pack_into(data, start + number * BRICK_RECORD.size, *brick)
+    path.write_bytes(bytes(data))
+
+
+def test_edited_bricks_are_refused_when_loaded(tmp_path):
+    write_raw_pack(tmp_path / "levels.brk", [BRICK, (65, 100, 0, 0, 10)])
+    with LevelPack(tmp_path / "levels.brk") as pack:
+        with pytest.raises(ValueError, match="0 hit points"):
+            GameState(bricks=pack.level(0).bricks())
+
+
+def test_cut_short_packs_are_refused(tmp_path):
+    write_pack(tmp_path / "levels.brk", [[BRICK, BRICK]])
+    data = (tmp_path / "levels.brk").read_bytes()
+
+    (tmp_path / "bricks.brk").write_bytes(data[:-1])
+    with LevelPack(tmp_path / "bricks.brk") as pack:
+        with pytest.raises(ValueError, match="outside the file"):
+            pack.level(0)
+
+    (tmp_path / "table.brk").write_bytes(data[:HEADER.size + 2])
+    with pytest.raises(ValueError, match="cut short"):
+        LevelPack(tmp_path / "table.brk")
+
+    (tmp_path / "other.brk").write_bytes(b"not a pack at all")
+    with pytest.raises(ValueError, match="not a BreakOut level pack"):
+        LevelPack(tmp_path / "other.brk")
+
+
+def test_empty_level_is_cleared_at_once():
+    state = GameState(bricks=[])
+    assert step(state) == EVENT_WIN
+    assert state.won and not state.game_is_on
@@ -0,0 +1,123 @@
+"""
+Power-up Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the power-ups in engine.py: catching each kind, effects stacking and
+running out on time, drops being the same in every replay of a game, and games
+without power-ups staying untouched.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+from autoplayer import AutoPlayer
+from engine import (
+    GameState, step, start_effect, SCREEN_EDGE, STARTING_LIVES, EVENT_POWERUP,
+    POWERUP_WIDE, POWERUP_SLOW, POWERUP_LIFE, POWERUP_BALL, EFFECT_TICKS,
+    PADDLE_HALF_WIDTH, WIDE_GROWTH, MAX_PADDLE_HALF_WIDTH, SLOW_FACTOR, MIN_BALL_SPEED_SCALE,
+)
+
+
+def drop_on_paddle(state, kind):
+    """
+    Drop a power-up straight above the paddle and step until it is caught.
+
+    Returns:
+        The EVENT_* flags seen
+    """
+    state.powerup_x.append(state.paddle_x)
+    state.powerup_y.append(0.0)
+    state.powerup_kind.append(kind)
+    events = 0
+    while state.powerup_x:
+        events |= step(state)
+    return events
+
+
+def test_catching_each_kind():
+    state = GameState(powerups=True)
+    assert drop_on_paddle(state, POWERUP_WIDE) & EVENT_POWERUP
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH + WIDE_GROWTH
+    drop_on_paddle(state, POWERUP_SLOW)
+    assert state.ball_speed_scale == SLOW_FACTOR
+    lives = state.lives
+    drop_on_paddle(state, POWERUP_LIFE)
+    assert state.lives == lives + 1
+    balls = len(state.ball_x)
+    drop_on_paddle(state, POWERUP_BALL)
+    assert len(state.ball_x) == balls + 1
+
+
+def test_effects_stack_and_run_out_one_by_one():
+    state = GameState(powerups=True)
+    start_effect(state, POWERUP_WIDE)
+    for _ in range(EFFECT_TICKS // 2):
+        step(state)
+    start_effect(state, POWERUP_WIDE)
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH + 2 * WIDE_GROWTH
+
+    # The first one runs out exactly EFFECT_TICKS after it was caught, the second half that later
+    for _ in range(EFFECT_TICKS // 2 - 1):
+        step(state)
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH + 2 * WIDE_GROWTH
+    assert step(state) & EVENT_POWERUP
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH + WIDE_GROWTH
+    for _ in range(EFFECT_TICKS // 2):
+        step(state)
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH and not state.effect_ends
+
+
+def test_many_effects_are_capped():
+    state = GameState(powerups=True)
+    for number in range(400):
+        start_effect(state, POWERUP_WIDE if number % 2 else POWERUP_SLOW)
+    assert state.paddle_half_width == MAX_PADDLE_HALF_WIDTH
+    assert state.ball_speed_scale == MIN_BALL_SPEED_SCALE
+    assert len(state.effect_ends) == 400
+    for _ in range(EFFECT_TICKS):
+        state.lives = STARTING_LIVES  # Keep the game going while the effects run out
+        step(state)
+    assert not state.effect_ends and list(state.effect_stacks) == [0, 0, 0, 0]
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH and state.ball_speed_scale == 1.0
+
+
+def test_wide_paddle_stays_on_screen_and_the_bot_reaches_the_edge():
+    state = GameState(powerups=True)
+    for _ in range(3):
+        start_effect(state, POWERUP_WIDE)
+    limit = SCREEN_EDGE - state.paddle_half_width
+
+    # A ball falling straight down near the right wall: the bot goes as far right as it can
+    state.ball_x[0], state.ball_y[0], state.x_move[0], state.y_move[0] = 370.0, -150.0, 0.0, -100.0
+    bot = AutoPlayer(state)
+    for _ in range(150):
+        step(state, bot.inputs())
+        assert abs(state.paddle_x) <= limit
+    assert state.paddle_x == limit
+
+
+def test_drops_are_the_same_every_time():
+    def play():
+        state = GameState(powerups=True)
+        bot = AutoPlayer(state)
+        drops = []
+        while state.game_is_on and state.tick < 20000:
+            step(state, bot.inputs())
+            if state.powerup_x and state.powerup_y[-1] > 0 and (state.tick, len(state.powerup_x)) not in drops:
+                drops.append((state.tick, len(state.powerup_x)))
+        return drops, state.score, state.lives, state.effect_ends
+
+    first = play()
+    assert first[0]  # Some bricks dropped power-ups
+    assert play() == first
+
+
+def test_no_powerups_without_the_option():
+    state = GameState()
+    bot = AutoPlayer(state)
+    while state.game_is_on and state.tick < 20000:
+        assert not step(state, bot.inputs()) & EVENT_POWERUP
+        assert not state.powerup_x
+    assert state.paddle_half_width == PADDLE_HALF_WIDTH and state.ball_speed_scale == 1.0
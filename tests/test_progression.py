@@ -0,0 +1,91 @@
+"""
+Level Progression Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks moving on to the next level: the game keeps its score and lives, the
+canvas items of the old bricks are reused for the new ones instead of new items
+being made, and the scoreboard shows the level number of the level pack.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+from brick import BrickManager
+from engine import GameState, step, load_level, grid_layout, EVENT_WIN
+from scoreboard import Scoreboard
+
+
+class FakeCanvas:
+    """
+    Stands in for a Tk canvas: makes numbered items and remembers their options.
+    """
+
+    def __init__(self):
+        self.options = {}  # Options of each item made so far
+
+    def create(self, *coords, **options):
+        item = len(self.options) + 1
+        self.options[item] = dict(options)
+        return item
+
+    create_rectangle = create_text = create
+
+    def itemconfigure(self, item, **options):
+        self.options[item].update(options)
+
+    def coords(self, item, *coords):
+        pass
+
+    def tag_lower(self, tag):
+        pass
+
+
+def play(state, ticks):
+    """
+    Step a game for a number of ticks (or until it ends).
+
+    Returns:
+        All the EVENT_* flags seen
+    """
+    events = 0
+    for _ in range(ticks):
+        if not state.game_is_on:
+            break
+        events |= step(state)
+    return events
+
+
+def test_load_level_keeps_score_and_lives():
+    state = GameState(bricks=[(0, 100, 0, 1, 10)])
+    play(state, 2000)
+    score, lives = state.score, state.lives
+    load_level(state, grid_layout())
+    assert state.game_is_on and not state.won and state.level == 1
+    assert state.bricks_left == 55 and state.score == score and state.lives == lives
+    assert not play(state, 100) & EVENT_WIN
+
+
+def test_new_level_reuses_the_old_bricks_items():
+    canvas = FakeCanvas()
+    state = GameState(rows=3)
+    bricks = BrickManager(state, canvas)
+    for _ in range(3):
+        for index in range(len(state.brick_x)):
+            bricks.destroy(index)
+        load_level(state, grid_layout(rows=2))
+        bricks.load_level()
+    assert bricks.pool.created == 33  # Only the first level's bricks were ever made
+    assert len(bricks.pool) == 11  # The rest wait hidden for a bigger level
+
+
+def test_scoreboard_shows_the_level_of_the_pack():
+    canvas = FakeCanvas()
+    state = GameState()
+    scoreboard = Scoreboard(state, canvas, show_level=True, first_level=3)
+    assert canvas.options[scoreboard.score_text]["text"] == "Score: 0 | Lives: 3 | Level: 4"
+    state.level = 1
+    scoreboard.update_scoreboard()
+    scoreboard.render()
+    assert canvas.options[scoreboard.score_text]["text"] == "Score: 0 | Lives: 3 | Level: 5"
@@ -0,0 +1,93 @@
+"""
+Replay Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks that a recorded game replays to exactly the same game, from the start
+and when jumping to a tick through the checkpoints (see replay.py), and that a
+copy of a game (which is what a checkpoint is) plays on exactly like the original.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import pytest
+
+from autoplayer import AutoPlayer
+from engine import GameState, step
+from replay import InputRecorder, NullRecorder, Replay, CHECKPOINT_INTERVAL
+
+
+def record_game(path, ticks):
+    """
+    Let the bot play a game, recording its keys to a file.
+
+    Returns:
+        The states of the game at every CHECKPOINT_INTERVAL // 2 ticks, keyed by tick,
+        and the final state
+    """
+    state = GameState()
+    bot = AutoPlayer(state)
+    recorder = InputRecorder(state)
+    snapshots = {}
+    while state.game_is_on and state.tick < ticks:
+        inputs = bot.inputs()
+        recorder.record(inputs)
+        step(state, inputs)
+        if state.tick % (CHECKPOINT_INTERVAL // 2) == 0:
+            snapshots[state.tick] = state.copy()
+    recorder.save(path)
+    return snapshots, state
+
+
+def same_game(first, second):
+    """
+    Returns:
+        True if two game states are the same in every detail that matters
+    """
+    return ((first.tick, first.score, first.lives, first.paddle_x, first.game_is_on)
+            == (second.tick, second.score, second.lives, second.paddle_x, second.game_is_on)
+            and list(first.ball_x) == list(second.ball_x) and list(first.ball_y) == list(second.ball_y)
+            and first.brick_alive == second.brick_alive)
+
+
+def test_replay_reproduces_the_game(tmp_path):
+    path = tmp_path / "game.rec"
+    _, final = record_game(path, 4 * CHECKPOINT_INTERVAL)
+    assert same_game(Replay.load(path).run(), final)
+
+
+def test_seek_matches_the_recorded_game(tmp_path):
+    path = tmp_path / "game.rec"
+    snapshots, _ = record_game(path, 4 * CHECKPOINT_INTERVAL)
+    replay = Replay.load(path)
+    replay.run()  # Makes the checkpoints
+    for tick in sorted(snapshots, reverse=True):
+        assert same_game(replay.seek(tick), snapshots[tick])
+
+
+def test_null_recorder_keeps_nothing(tmp_path):
+    recorder = NullRecorder()
+    recorder.record(1)
+    recorder.save(tmp_path / "game.rec")
+    assert not (tmp_path / "game.rec").exists()
+
+
+def test_a_copy_plays_on_exactly_like_the_original():
+    state = GameState(balls=3)
+    bot = AutoPlayer(state)
+    for _ in range(3000):
+        step(state, bot.inputs())
+    other = state.copy()
+    other_bot = AutoPlayer(other)
+    for _ in range(3000):
+        step(state, bot.inputs())
+        step(other, other_bot.inputs())
+    assert same_game(other, state)
+
+
+def test_other_files_are_refused(tmp_path):
+    (tmp_path / "game.rec").write_bytes(b"not a recording at all")
+    with pytest.raises(ValueError, match="not a BreakOut recording"):
+        Replay.load(tmp_path / "game.rec")
@@ -0,0 +1,77 @@
+"""
+Save File Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the save files written by Autosave (see services.py): a resumed game plays
+on exactly like the original, the save is deleted once the game is over, and
+files that are not saves (or are damaged) are refused instead of loaded.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import pickle
+
+import pytest
+
+from autoplayer import AutoPlayer
+from engine import GameState, step, start_effect, POWERUP_WIDE, POWERUP_SLOW
+from services import Autosave, write_save, load_save
+
+
+def played_game():
+    """
+    Play a multi-ball game with power-ups for a while, with effects running and a power-up falling.
+    """
+    state = GameState(balls=2, powerups=True)
+    bot = AutoPlayer(state)
+    for _ in range(3000):
+        step(state, bot.inputs())
+    start_effect(state, POWERUP_WIDE)
+    start_effect(state, POWERUP_SLOW)
+    state.powerup_x.append(50.0)
+    state.powerup_y.append(100.0)
+    state.powerup_kind.append(POWERUP_SLOW)
+    return state
+
+
+def test_resumed_game_plays_on_like_the_original(tmp_path):
+    original = played_game()
+    write_save(original, tmp_path / "game.sav")
+    resumed = load_save(tmp_path / "game.sav")
+
+    for name in GameState.__slots__:
+        if name != "brick_grid":
+            assert getattr(resumed, name) == getattr(original, name), name
+
+    bot, resumed_bot = AutoPlayer(original), AutoPlayer(resumed)
+    while original.game_is_on:
+        assert step(original, bot.inputs()) == step(resumed, resumed_bot.inputs())
+    assert (resumed.tick, resumed.score, resumed.lives) == (original.tick, original.score, original.lives)
+
+
+def test_save_is_deleted_once_the_game_is_over(tmp_path):
+    state = GameState()
+    autosave = Autosave(state, tmp_path / "game.sav")
+    autosave.write(state.copy())
+    assert (tmp_path / "game.sav").exists()
+
+    state.tick += 1
+    state.game_is_on = False
+    autosave.write(state.copy())
+    assert not (tmp_path / "game.sav").exists()
+
+
+def test_files_that_are_not_saves_are_refused(tmp_path):
+    write_save(played_game(), tmp_path / "game.sav")
+    data = (tmp_path / "game.sav").read_bytes()
+
+    (tmp_path / "short.sav").write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="cut short"):
+        load_save(tmp_path / "short.sav")
+
+    (tmp_path / "pickle.sav").write_bytes(pickle.dumps(GameState()))
+    with pytest.raises(ValueError, match="not a BreakOut save file"):
+        load_save(tmp_path / "pickle.sav")
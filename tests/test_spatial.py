@@ -0,0 +1,43 @@
+"""
+Spatial Grid Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the BrickGrid in spatial.py: a query finds every brick whose center lies
+in the box (the same bricks a check of every brick would find) and skips the
+cells outside it.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import random
+
+from engine import GameState, BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y
+from levels import random_level
+from spatial import BrickGrid
+
+
+def test_query_finds_the_same_bricks_as_checking_them_all():
+    state = GameState(bricks=random_level(12, 11, 7))
+    grid = BrickGrid(BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y)
+    grid.build(state.brick_x, state.brick_y)
+    randomness = random.Random(1)
+    for _ in range(500):
+        left = randomness.uniform(-450, 350)
+        bottom = randomness.uniform(-300, 250)
+        right, top = left + randomness.uniform(0, 200), bottom + randomness.uniform(0, 200)
+        expected = {index for index in range(len(state.brick_x))
+                    if left <= state.brick_x[index] <= right and bottom <= state.brick_y[index] <= top}
+        found = grid.query_box(left, bottom, right, top)
+        assert expected <= set(found)
+        assert len(found) == len(set(found))  # No brick is returned twice
+
+
+def test_far_away_query_finds_nothing():
+    grid = BrickGrid(BRICK_START_X, BRICK_START_Y, BRICK_SPACING_X, BRICK_SPACING_Y)
+    state = GameState()
+    grid.build(state.brick_x, state.brick_y)
+    assert grid.query_box(-50, -300, 50, -250) == []  # Down by the paddle
+    assert BrickGrid(0, 0, 10, 10).query_box(-5, -5, 5, 5) == []  # No bricks at all
@@ -0,0 +1,36 @@
+"""
+Parameter Sweep Tests for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+Checks the sweep in sweep.py: a small sweep on worker processes writes one row
+per game to the results file and reads back into a summary, every setting fits
+its column, and a batch of games leaves the game's settings as it found them.
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import sweep
+from sweep import run_sweep, run_task, read_results, summarize, current_parameters, DEFAULTS
+
+
+def test_small_sweep_writes_every_game(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep, "MAX_GAME_TICKS", 3000)
+    path = tmp_path / "sweep.col"
+    run_sweep({"paddle_width": [3, 5]}, 3, "follow", path, workers=2)
+    description, columns = read_results(path)
+    assert sorted(zip(columns["point"], columns["seed"])) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    summary = summarize(description, columns)
+    assert [entry["parameters"]["paddle_width"] for entry in summary] == [3, 5]
+    assert all(entry["games"] == 3 for entry in summary)
+
+
+def test_batch_puts_the_settings_back(monkeypatch):
+    monkeypatch.setattr(sweep, "MAX_GAME_TICKS", 500)
+    before = current_parameters()
+    parameters = dict(DEFAULTS, ball_speed=300.0, paddle_width=2, lives=1000)
+    columns = run_task(0, parameters, "autoplay", [1, 2])
+    assert current_parameters() == before
+    assert all(lives > 255 for lives in columns["lives_left"])  # More lives than fit in a byte
@@ -0,0 +1,163 @@
+"""
+Spectator Viewer for BreakOut Clone Game
+Author: Hemant Vijay
+Last Updated: 18-Oct-2026
+
+This file is a small program that watches a game broadcast by
+main.py --broadcast (see broadcast.py). It has no game rules of its own: it
+keeps a copy of the game up to date from the stream and draws it with the same
+classes as the game itself. Many viewers can watch one game.
+
+Watch a game in a window:
+    python main.py --broadcast 127.0.0.1:8765
+    python viewer.py 127.0.0.1:8765
+Or save a picture of it without a window (needs NumPy, see rasterizer.py):
+    python viewer.py 127.0.0.1:8765 --snapshot game.png --after 5
+
+Project Credit: This project is part of the assignment for Angela Yu's course
+"100 Days of Code: The Complete Python Pro Bootcamp"
+Course URL: https://www.udemy.com/course/100-days-of-code/
+"""
+
+import argparse
+import time
+
+from broadcast import Spectator, DEFAULT_PORT
+
+# Constants for the viewer
+FRAME_TIME = 1 / 60  # Seconds between redraws of the window
+CONNECT_TIMEOUT = 5.0  # Seconds to wait for the first keyframe
+
+
+def wait_for_game(spectator, timeout=CONNECT_TIMEOUT):
+    """
+    Wait until the first keyframe has arrived.
+
+    Args:
+        spectator: A connected Spectator
+        timeout: Seconds to wait at most
+
+    Returns:
+        True if the game copy is ready
+    """
+    deadline = time.monotonic() + timeout
+    while spectator.state is None and spectator.connected and time.monotonic() < deadline:
+        spectator.receive()
+        time.sleep(0.01)
+    return spectator.state is not None
+
+
+def save_snapshot(spectator, path, seconds):
+    """
+    Follow the game for a while without a window, then save a PNG picture of it.
+
+    Args:
+        spectator: A Spectator with a game copy
+        path: The PNG file to write
+        seconds: How long to follow the game first
+    """
+    from rasterizer import Rasterizer
+    from export import write_png
+
+    deadline = time.monotonic() + seconds
+    while spectator.connected and time.monotonic() < deadline:
+        spectator.receive()
+        time.sleep(FRAME_TIME)
+    spectator.receive()
+    rasterizer = Rasterizer(spectator.state)
+    rasterizer.render()
+    write_png(path, rasterizer.pixels)
+
+
+def watch(spectator):
+    """
+    Draw the game in a window until the window is closed.
+
+    Args:
+        spectator: A Spectator with a game copy
+    """
+    from turtle import Screen
+    from paddle import Paddle, register_paddle_shape
+    from ball import Ball
+    from brick import BrickManager
+    from powerup import PowerUpManager
+    from scoreboard import Scoreboard
+    from scheduler import Scheduler
+
+    screen = Screen()
+    screen.title("BreakOut Clone - Spectator")
+    screen.bgcolor("black")
+    screen.setup(width=800, height=600)
+    screen.tracer(0)
+    register_paddle_shape(screen)
+
+    # The same drawing classes as the game, pointed at the copy of the game
+    state = spectator.state
+    paddle = Paddle(state)
+    balls = [Ball(state, index) for index in range(len(state.ball_x))]
+    brick_manager = BrickManager(state, screen.getcanvas())
+    powerups = PowerUpManager(state, screen.getcanvas(), brick_manager.pool)
+    scoreboard = Scoreboard(state, screen.getcanvas(), show_level=state.level > 0)
+    spectator.new_level = False
+    scheduler = Scheduler(screen)
+
+    def frame():
+        if not spectator.receive():
+            return
+        state = spectator.state
+        if spectator.new_level:
+            # A keyframe replaced the game copy: point everything at the new one
+            spectator.new_level = False
+            paddle.state = brick_manager.state = powerups.state = scoreboard.state = state
+            for ball in balls:
+                ball.state = state
+            scoreboard.show_level = scoreboard.show_level or state.level > 0
+            brick_manager.load_level()
+        for index in spectator.destroyed:
+            brick_manager.destroy(index)
+        while len(balls) < len(state.ball_x):
+            balls.append(Ball(state, len(balls)))
+        paddle.render()
+        for ball in balls:
+            ball.render()
+        powerups.render()
+        scoreboard.update_scoreboard()
+        if not state.game_is_on:
+            if state.won:
+                scoreboard.you_win()
+            else:
+                scoreboard.game_over()
+        scoreboard.render()
+        screen.update()
+
+    scheduler.call_every(FRAME_TIME, frame)
+    screen.mainloop()
+    scheduler.stop()
+
+
+def main():
+    """
+    Watch a broadcast game from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Watch a BreakOut game broadcast with main.py --broadcast.")
+    parser.add_argument("address", nargs="?", default=f"127.0.0.1:{DEFAULT_PORT}",
+                        help="HOST:PORT of the game, or the path of its Unix socket")
+    parser.add_argument("--snapshot", metavar="FILE", help="save a PNG picture instead of opening a window")
+    parser.add_argument("--after", type=float, default=0.0, help="with --snapshot: seconds to watch first")
+    args = parser.parse_args()
+
+    spectator = Spectator(args.address)
+    if not wait_for_game(spectator):
+        parser.exit(1, "No game arrived from " + args.address + "\n")
+    try:
+        if args.snapshot:
+            save_snapshot(spectator, args.snapshot, args.after)
+            print(f"Saved {args.snapshot} at tick {spectator.state.tick}")
+        else:
+            watch(spectator)
+    finally:
+        spectator.close()
+
+
+if __name__ == "__main__":
+    main()